@@ -3,7 +3,7 @@ Flask API for Roofing Quote Generator
 Main application entry point with REST endpoints
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
 import json
@@ -28,7 +28,7 @@ uploaded_csv_data = {}
 @app.route('/')
 def index():
     """Serve the main application page"""
-    return render_template_string(INDEX_TEMPLATE)
+    return app.response_class(INDEX_PAGE, mimetype='text/html')
 
 
 @app.route('/api/roofer/register', methods=['POST'])
@@ -370,5 +370,8 @@ INDEX_TEMPLATE = """
 </html>
 """
 
+# Static page (no template syntax), encoded once at import
+INDEX_PAGE = INDEX_TEMPLATE.rstrip('\n').encode('utf-8')
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,233 @@
+"""
+Dashboard asset pipeline
+Builds the dashboard page and its static assets once at import: minified,
+fingerprinted and Brotli/gzip-compressed, ready to be served straight from memory
+"""
+
+import brotli
+import gzip
+import hashlib
+import re
+from dataclasses import dataclass, field
+from html import escape
+from pathlib import Path
+from typing import Dict
+
+from flask import request, current_app
+
+STATIC_DIR = Path(__file__).parent / 'static'
+
+# Fingerprinted assets are immutable: a content change produces a new URL
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@dataclass
+class Asset:
+    """An in-memory response body with its precompressed variants"""
+    body: bytes
+    brotli: bytes
+    gzipped: bytes
+    mimetype: str
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def build_asset(body: bytes, mimetype: str) -> Asset:
+    """
+    Compress and fingerprint a response body
+    Compression runs once per asset at startup, so both codecs use their
+    slowest, smallest settings
+    """
+    return Asset(
+        body=body,
+        brotli=brotli.compress(body, quality=11),
+        gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+        mimetype=mimetype,
+        etag=hashlib.sha256(body).hexdigest()
+    )
+
+
+_CSS_STRINGS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+# Comments are matched together with strings so that a quote inside a
+# comment (or /* inside a string) can't be mistaken for the other
+_CSS_COMMENTS = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/', re.S)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a stylesheet
+    Quoted strings are left untouched
+    """
+    css = _CSS_COMMENTS.sub(lambda m: '' if m.group(0).startswith('/*') else m.group(0), css)
+    parts = []
+    for chunk in _CSS_STRINGS.split(css):
+        if chunk[:1] in ('"', "'"):
+            parts.append(chunk)
+            continue
+        chunk = re.sub(r'\s+', ' ', chunk)
+        chunk = _CSS_PUNCTUATION.sub(r'\1', chunk)
+        chunk = chunk.replace(': ', ':').replace(';}', '}')
+        parts.append(chunk)
+    return _CSS_BLOCK.sub(_sort_declarations, ''.join(parts).strip())
+
+
+_HTML_COMMENTS = re.compile(r'<!--.*?-->', re.S)
+
+
+def minify_html(html: str) -> str:
+    """
+    Strip comments, indentation and blank lines from a page or fragment
+    Line breaks are kept as single whitespace between tags; none of the
+    dashboard markup uses <pre> or <textarea>, where that would matter
+    """
+    lines = (line.strip() for line in _HTML_COMMENTS.sub('', html).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def minify_js(js: str) -> str:
+    """
+    Strip indentation, blank lines and whole-line // comments from a script
+    Line breaks are kept so automatic semicolon insertion is unaffected.
+    Trailing comments stay: telling them apart from strings, regex literals
+    and template literals needs a real tokenizer.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+_CSS_BLOCK = re.compile(r'\{([^{}]*)\}')
+_CSS_DECLARATION = re.compile(r'(?:[^;\'"(]|\'[^\']*\'|"[^"]*"|\([^)]*\))+')
+
+
+def _sort_declarations(match) -> str:
+    """
+    Order a rule's declarations alphabetically so identical runs repeat across
+    rules and gzip finds longer matches. The sort is stable and shorthands sort
+    ahead of their own longhands (border < border-top), so cascade order within
+    the rule is preserved.
+    """
+    declarations = _CSS_DECLARATION.findall(match.group(1))
+    declarations.sort(key=lambda d: d.partition(':')[0])
+    return '{' + ';'.join(declarations) + '}'
+
+
+# Static sources referenced from dashboard.html as /static/<name>, with the
+# mimetype and minifier used to build their fingerprinted copies. The
+# section-*.html fragments are fetched by the page the first time their
+# section is opened.
+DASHBOARD_SOURCES: Dict[str, tuple] = {
+    'tileit.css': ('text/css', minify_css),
+    'tileit.js': ('application/javascript', minify_js),
+    'section-quotes.html': ('text/html', minify_html),
+    'section-settings.html': ('text/html', minify_html),
+}
+
+
+# <link ... data-inline> stylesheets are replaced by a <style> block holding
+# their minified contents
+_INLINE_STYLESHEET = re.compile(r'<link rel="stylesheet" href="/static/([\w.-]+)" data-inline>')
+
+
+def _inline_stylesheet(match) -> str:
+    css = (STATIC_DIR / match.group(1)).read_text(encoding='utf-8')
+    return f'<style>{minify_css(css)}</style>'
+
+
+# Numeric inputs of the business profile form, keyed by element id:
+# (label, placeholder, step, min, max). dashboard.html lays them out as
+# <div class="form-row" data-fields="id id ..."></div> placeholders.
+PROFILE_NUMBER_FIELDS: Dict[str, tuple] = {
+    'profileLaborRate': ('Labor Rate ($/hour per worker)', '45', '1', '0', None),
+    'profileDailyProductivity': ('Daily Productivity (sqft/day per crew)', '2500', '100', '0', None),
+    'profileSlopeFlatLow': ('Flat/Low (0-15°)', '0', '0.1', '0', None),
+    'profileSlopeModerate': ('Moderate (15-30°)', '0.1', '0.1', '0', None),
+    'profileSlopeSteep': ('Steep (30-45°)', '0.2', '0.1', '0', None),
+    'profileSlopeVerySteep': ('Very Steep (>45°)', '0.3', '0.1', '0', None),
+    'profileMaterialAsphalt': ('Asphalt', '4.0', '0.5', '0', None),
+    'profileMaterialShingle': ('Shingle', '4.5', '0.5', '0', None),
+    'profileMaterialMetal': ('Metal', '7.0', '0.5', '0', None),
+    'profileMaterialTile': ('Tile', '8.0', '0.5', '0', None),
+    'profileMaterialConcrete': ('Concrete', '6.0', '0.5', '0', None),
+    'profileReplacementAsphalt': ('Asphalt', '45', '5', '0', None),
+    'profileReplacementShingle': ('Shingle', '50', '5', '0', None),
+    'profileReplacementMetal': ('Metal', '90', '5', '0', None),
+    'profileReplacementTile': ('Tile', '70', '5', '0', None),
+    'profileReplacementConcrete': ('Concrete', '60', '5', '0', None),
+    'profileOverhead': ('Overhead Percentage', '0.1', '0.01', '0', '1'),
+    'profileProfit': ('Profit Margin', '0.2', '0.01', '0', '1'),
+}
+
+_FIELD_ROW = re.compile(r'<div class="form-row" data-fields="([\w ]+)"></div>')
+
+
+def _number_field(field_id: str) -> str:
+    label, placeholder, step, minimum, maximum = PROFILE_NUMBER_FIELDS[field_id]
+    limit = f' max="{maximum}"' if maximum is not None else ''
+    return (f'<div class="form-group"><label>{escape(label)}</label>'
+            f'<input type="number" id="{field_id}" placeholder="{placeholder}" '
+            f'step="{step}" min="{minimum}"{limit}></div>')
+
+
+def _field_row(match) -> str:
+    fields = ''.join(_number_field(field_id) for field_id in match.group(1).split())
+    return f'<div class="form-row">{fields}</div>'
+
+
+# Preload destination for each asset type, used in the page's Link header;
+# types not listed here are loaded on demand and not preloaded
+PRELOAD_AS = {
+    'text/css': 'style',
+    'application/javascript': 'script',
+}
+
+
+def fingerprinted_name(name: str, asset: Asset) -> str:
+    """tileit.css -> tileit.<hash>.css"""
+    stem, _, ext = name.rpartition('.')
+    return f"{stem}.{asset.etag[:12]}.{ext}"
+
+
+def build_dashboard():
+    """
+    Build the dashboard page and its fingerprinted assets
+    Returns (page asset, {fingerprinted name: asset})
+    """
+    html = (STATIC_DIR / 'dashboard.html').read_text(encoding='utf-8')
+    html = _INLINE_STYLESHEET.sub(_inline_stylesheet, html)
+    html = _FIELD_ROW.sub(_field_row, html)
+    assets = {}
+    preloads = []
+    for name, (mimetype, minify) in DASHBOARD_SOURCES.items():
+        source = (STATIC_DIR / name).read_text(encoding='utf-8')
+        asset = build_asset(minify(source).encode('utf-8'), mimetype)
+        versioned = fingerprinted_name(name, asset)
+        assets[versioned] = asset
+        html = html.replace(f'/static/{name}', f'/assets/{versioned}')
+        if mimetype in PRELOAD_AS:
+            preloads.append(f'</assets/{versioned}>; rel=preload; as={PRELOAD_AS[mimetype]}')
+    page = build_asset(minify_html(html).encode('utf-8'), 'text/html')
+    # Lets the browser (or an Early Hints capable proxy) start fetching the
+    # stylesheet and script before it has parsed far enough into the page to
+    # discover them
+    page.headers['Link'] = ', '.join(preloads)
+    return page, assets
+
+
+def send_asset(asset: Asset, cache_control: str):
+    """Serve a prebuilt asset, honouring If-None-Match and Accept-Encoding"""
+    if request.if_none_match.contains(asset.etag):
+        response = current_app.response_class(status=304)
+    elif 'br' in request.accept_encodings:
+        response = current_app.response_class(asset.brotli, mimetype=asset.mimetype)
+        response.headers['Content-Encoding'] = 'br'
+    elif 'gzip' in request.accept_encodings:
+        response = current_app.response_class(asset.gzipped, mimetype=asset.mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(asset.body, mimetype=asset.mimetype)
+    response.headers.update(asset.headers)
+    response.set_etag(asset.etag)
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept-Encoding')
+    return response
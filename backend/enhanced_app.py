@@ -3,7 +3,7 @@ Enhanced Roofing Quote Generator
 With filtering, pagination, and comprehensive property management
 """
 
-from flask import Flask, request, jsonify, render_template_string, session, redirect, url_for
+from flask import Flask, request, jsonify, session, redirect, url_for
 from flask_cors import CORS
 import os
 import json
@@ -49,7 +49,7 @@ def require_auth(f):
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template_string(ENHANCED_DASHBOARD_TEMPLATE)
+    return app.response_class(ENHANCED_DASHBOARD_PAGE, mimetype='text/html')
 
 @app.route('/api/auth/register', methods=['POST'])
 def register():
@@ -2183,5 +2183,8 @@ ENHANCED_DASHBOARD_TEMPLATE = """
 </html>
 """
 
+# Static page (no template syntax), encoded once at import
+ENHANCED_DASHBOARD_PAGE = ENHANCED_DASHBOARD_TEMPLATE.rstrip('\n').encode('utf-8')
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
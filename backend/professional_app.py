@@ -3,7 +3,7 @@ Professional Roofing Quote Generator
 Native-looking interface with proper authentication and database
 """
 
-from flask import Flask, request, jsonify, render_template_string, session, redirect, url_for
+from flask import Flask, request, jsonify, session, redirect, url_for
 from flask_cors import CORS
 import os
 import json
@@ -48,7 +48,7 @@ def require_auth(f):
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template_string(NATIVE_DASHBOARD_TEMPLATE)
+    return app.response_class(NATIVE_DASHBOARD_PAGE, mimetype='text/html')
 
 @app.route('/api/auth/register', methods=['POST'])
 def register():
@@ -1504,5 +1504,8 @@ NATIVE_DASHBOARD_TEMPLATE = """
 </html>
 """
 
+# Static page (no template syntax), encoded once at import
+NATIVE_DASHBOARD_PAGE = NATIVE_DASHBOARD_TEMPLATE.rstrip('\n').encode('utf-8')
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
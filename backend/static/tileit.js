@@ -0,0 +1,2046 @@
+let currentUser = null;
+// Read from storage once; afterwards storage is only written, via setAuthToken
+let authToken = localStorage.getItem('authToken');
+// Request headers for the current token, rebuilt only when it changes
+let authHeaders = {};
+let jsonAuthHeaders = {};
+cacheAuthHeaders();
+let currentSection = 'dashboard';
+let sessionTimer = null;
+let sessionExpiresAt = 0;
+let sessionCountdown = null;
+let sessionWarningEndsAt = 0;
+let confirmCallback = null;
+
+// The deferred stylesheet is preloaded; apply it once the script runs
+document.querySelectorAll('link[rel="preload"][as="style"]').forEach(link => {
+    link.rel = 'stylesheet';
+});
+
+// Toast Notification System
+const TOAST_LIFETIME = 5000;
+// Toasts raised within one frame are inserted together in a single append
+const pendingToasts = [];
+let toastFrame = 0;
+// Visible toasts in insertion order; one timer expires them front to back
+const activeToasts = [];
+let toastTimer = 0;
+
+function showToast(message, type = 'info', title = null) {
+    pendingToasts.push({message, type, title});
+    if (!toastFrame) toastFrame = requestAnimationFrame(flushToasts);
+}
+
+const TOAST_ICONS = {
+    success: '✓',
+    error: '✕',
+    warning: '⚠',
+    info: 'ℹ'
+};
+
+const TOAST_TITLES = {
+    success: 'Success',
+    error: 'Error',
+    warning: 'Warning',
+    info: 'Info'
+};
+
+// Toast markup is parsed once from the page's <template> and cloned per toast
+const toastTemplate = document.getElementById('toastTemplate').content.firstElementChild;
+
+function buildToast(message, type, title) {
+    const toast = toastTemplate.cloneNode(true);
+    toast.classList.add(`toast-${type}`);
+    toast.querySelector('.toast-icon').textContent = TOAST_ICONS[type] || TOAST_ICONS.info;
+    toast.querySelector('.toast-title').textContent = title || TOAST_TITLES[type];
+    toast.querySelector('.toast-message').textContent = message;
+    toast.querySelector('.toast-close').addEventListener('click', () => toast.remove());
+    return toast;
+}
+
+function flushToasts() {
+    toastFrame = 0;
+    const fragment = document.createDocumentFragment();
+    const expiresAt = performance.now() + TOAST_LIFETIME;
+    for (const {message, type, title} of pendingToasts) {
+        const toast = buildToast(message, type, title);
+        fragment.appendChild(toast);
+        activeToasts.push({toast, expiresAt});
+    }
+    pendingToasts.length = 0;
+    document.getElementById('toastContainer').appendChild(fragment);
+
+    if (!toastTimer) scheduleToastExpiry();
+}
+
+function scheduleToastExpiry() {
+    toastTimer = activeToasts.length
+        ? setTimeout(expireToasts, activeToasts[0].expiresAt - performance.now())
+        : 0;
+}
+
+function expireToasts() {
+    const now = performance.now();
+    const expired = [];
+    while (activeToasts.length && activeToasts[0].expiresAt <= now) {
+        const {toast} = activeToasts.shift();
+        toast.classList.add('hiding');
+        expired.push(toast);
+    }
+    // Remove once the 300ms slide-out has played
+    setTimeout(() => expired.forEach(toast => toast.remove()), 300);
+    scheduleToastExpiry();
+}
+
+// Drop a one-shot animation's will-change hint once it has finished,
+// so the element doesn't keep its own compositor layer
+function releaseWillChange(event) {
+    event.target.style.willChange = 'auto';
+}
+
+// Confirmation Dialog
+function showConfirmDialog(title, message, onConfirm, confirmText = 'Confirm', cancelText = 'Cancel') {
+    document.getElementById('confirmTitle').textContent = title;
+    document.getElementById('confirmMessage').textContent = message;
+    document.getElementById('confirmOk').textContent = confirmText;
+    document.getElementById('confirmCancel').textContent = cancelText;
+    document.getElementById('confirmDialog').classList.add('active');
+    confirmCallback = onConfirm;
+}
+
+function closeConfirmDialog() {
+    document.getElementById('confirmDialog').classList.remove('active');
+    confirmCallback = null;
+}
+
+function executeConfirmedAction() {
+    if (confirmCallback) {
+        confirmCallback();
+    }
+    closeConfirmDialog();
+}
+
+
+// Password Strength Checker
+// Password strength buckets, weakest first: indicator class, hint, hint colour
+const PASSWORD_STRENGTH_LEVELS = [
+    ['password-strength-weak', 'Weak password - add more characters and variety', '#dc3545'],
+    ['password-strength-medium', 'Medium password - consider adding special characters', '#ffc107'],
+    ['password-strength-strong', 'Strong password!', '#28a745']
+];
+const PASSWORD_LOWER = /[a-z]/;
+const PASSWORD_UPPER = /[A-Z]/;
+const PASSWORD_DIGIT = /\d/;
+const PASSWORD_SYMBOL = /[^a-zA-Z0-9]/;
+
+// Last input seen and bucket shown, so repeated events for the same value
+// (and edits that stay in the same bucket) don't touch the DOM
+let lastCheckedPassword = null;
+let lastStrengthLevel = null;
+
+function checkPasswordStrength(password) {
+    if (password === lastCheckedPassword) return;
+    lastCheckedPassword = password;
+
+    const strengthIndicator = document.getElementById('passwordStrength');
+    const hint = document.getElementById('passwordHint');
+
+    if (!password) {
+        lastStrengthLevel = null;
+        strengthIndicator.className = 'password-strength';
+        hint.textContent = 'Use at least 8 characters with a mix of letters, numbers & symbols';
+        hint.style.color = '';
+        return;
+    }
+
+    let strength = 0;
+    if (password.length >= 8) strength++;
+    if (password.length >= 12) strength++;
+    if (PASSWORD_LOWER.test(password) && PASSWORD_UPPER.test(password)) strength++;
+    if (PASSWORD_DIGIT.test(password)) strength++;
+    if (PASSWORD_SYMBOL.test(password)) strength++;
+
+    const level = strength <= 2 ? 0 : (strength <= 4 ? 1 : 2);
+    if (level === lastStrengthLevel) return;
+    lastStrengthLevel = level;
+
+    const [levelClass, hintText, hintColor] = PASSWORD_STRENGTH_LEVELS[level];
+    strengthIndicator.className = 'password-strength active ' + levelClass;
+    hint.textContent = hintText;
+    hint.style.color = hintColor;
+}
+
+// Typing only re-rates the password once input pauses for 60ms; clearing
+// the field resets the indicator straight away
+let passwordStrengthTimer = 0;
+
+function checkPasswordStrengthDebounced(password) {
+    clearTimeout(passwordStrengthTimer);
+    if (!password) {
+        checkPasswordStrength(password);
+        return;
+    }
+    passwordStrengthTimer = setTimeout(() => checkPasswordStrength(password), 60);
+}
+
+// Session Management
+// Auto logout after 24 minutes, with a warning 5 minutes before
+const SESSION_LENGTH = 24 * 60 * 1000;
+const SESSION_WARNING_LEAD = 5 * 60 * 1000;
+
+function startSessionTimer() {
+    sessionExpiresAt = Date.now() + SESSION_LENGTH;
+    scheduleSessionCheck();
+}
+
+// A single timer is armed for the next deadline: the warning, then expiry
+function scheduleSessionCheck() {
+    clearTimeout(sessionTimer);
+    const remaining = sessionExpiresAt - Date.now();
+    const delay = remaining > SESSION_WARNING_LEAD ? remaining - SESSION_WARNING_LEAD : remaining;
+    sessionTimer = setTimeout(checkSession, Math.max(0, delay));
+}
+
+function checkSession() {
+    if (!sessionExpiresAt) return;
+    const remaining = sessionExpiresAt - Date.now();
+    if (remaining <= 0) {
+        sessionExpiresAt = 0;
+        showToast('Session expired. Please login again.', 'warning');
+        logout();
+        return;
+    }
+    // Shown once per deadline, so a dismissed warning stays dismissed
+    if (remaining <= SESSION_WARNING_LEAD && sessionWarningEndsAt !== sessionExpiresAt) {
+        showSessionWarning();
+    }
+    scheduleSessionCheck();
+}
+
+// Timers are throttled in background tabs and fire late after a sleep, so
+// the deadlines are checked again as soon as the tab is visible
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'visible') checkSession();
+});
+
+function showSessionWarning() {
+    const warning = document.getElementById('sessionWarning');
+    warning.style.willChange = '';
+    warning.addEventListener('animationend', releaseWillChange, { once: true });
+    warning.classList.add('active');
+
+    // Count down to the session deadline rather than decrementing per tick, so
+    // throttled timers in a background tab can't make the display drift
+    sessionWarningEndsAt = sessionExpiresAt;
+    stopSessionCountdown();
+    updateSessionCountdown();
+    sessionCountdown = setInterval(updateSessionCountdown, 1000);
+}
+
+function updateSessionCountdown() {
+    const timeLeft = Math.max(0, Math.round((sessionWarningEndsAt - Date.now()) / 1000));
+    const minutes = Math.floor(timeLeft / 60);
+    const seconds = timeLeft % 60;
+    const text = `${minutes}:${seconds.toString().padStart(2, '0')}`;
+
+    const timerEl = document.getElementById('sessionTimer');
+    if (timerEl.textContent !== text) timerEl.textContent = text;
+
+    if (timeLeft <= 0) stopSessionCountdown();
+}
+
+function stopSessionCountdown() {
+    clearInterval(sessionCountdown);
+    sessionCountdown = null;
+}
+
+function dismissSessionWarning() {
+    stopSessionCountdown();
+    document.getElementById('sessionWarning').classList.remove('active');
+}
+
+// Open tabs share one session: an extension in any of them resets the
+// timers in the others, so they don't each ping the server
+const sessionChannel = 'BroadcastChannel' in window ? new BroadcastChannel('tileit-session') : null;
+if (sessionChannel) {
+    sessionChannel.onmessage = event => {
+        if (event.data === 'extended' && authToken) {
+            dismissSessionWarning();
+            startSessionTimer();
+        }
+    };
+}
+
+async function extendSession() {
+    try {
+        const response = await fetch('/api/auth/ping', {
+            method: 'POST',
+            headers: authHeaders
+        });
+
+        if (response.status === 204) {
+            dismissSessionWarning();
+            startSessionTimer();
+            if (sessionChannel) sessionChannel.postMessage('extended');
+            showToast('Session extended successfully', 'success');
+        } else {
+            showToast('Failed to extend session', 'error');
+        }
+    } catch (error) {
+        showToast('Error extending session', 'error');
+    }
+}
+
+// Loading Button State
+function setButtonLoading(button, isLoading) {
+    if (isLoading) {
+        button.classList.add('loading');
+        button.disabled = true;
+    } else {
+        button.classList.remove('loading');
+        button.disabled = false;
+    }
+}
+
+// Blurred overlay backdrops are a per-device display preference
+function setHighQualityEffects(enabled) {
+    document.body.classList.toggle('hq-effects', enabled);
+    if (enabled) {
+        localStorage.setItem('hqEffects', '1');
+    } else {
+        localStorage.removeItem('hqEffects');
+    }
+}
+
+window.onload = function() {
+    const hqEffects = localStorage.getItem('hqEffects') === '1';
+    document.body.classList.toggle('hq-effects', hqEffects);
+
+    // Resume an existing session
+    if (authToken) {
+        loadDashboard();
+    }
+};
+
+function showLogin() {
+    document.getElementById('loginForm').style.display = 'block';
+    document.getElementById('registerForm').style.display = 'none';
+    document.getElementById('forgotPasswordForm').style.display = 'none';
+    document.querySelectorAll('.auth-tab').forEach(tab => tab.classList.remove('active'));
+    document.querySelectorAll('.auth-tab')[0].classList.add('active');
+}
+
+function showRegister() {
+    document.getElementById('loginForm').style.display = 'none';
+    document.getElementById('registerForm').style.display = 'block';
+    document.getElementById('forgotPasswordForm').style.display = 'none';
+    document.querySelectorAll('.auth-tab').forEach(tab => tab.classList.remove('active'));
+    document.querySelectorAll('.auth-tab')[1].classList.add('active');
+}
+
+function showForgotPassword() {
+    document.getElementById('loginForm').style.display = 'none';
+    document.getElementById('registerForm').style.display = 'none';
+    document.getElementById('forgotPasswordForm').style.display = 'block';
+}
+
+// Validation patterns shared by the auth and profile forms
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+const ZIP_PATTERN = /^\d{5}$/;
+const PHONE_PATTERN = /^[\d\s\-\(\)]+$/;
+
+function cacheAuthHeaders() {
+    authHeaders = authToken ? {'Authorization': 'Bearer ' + authToken} : {};
+    jsonAuthHeaders = {'Content-Type': 'application/json', ...authHeaders};
+}
+
+function setAuthToken(token) {
+    authToken = token;
+    cacheAuthHeaders();
+    if (token) {
+        localStorage.setItem('authToken', token);
+    } else {
+        localStorage.removeItem('authToken');
+    }
+}
+
+// Authenticated API request resolving to the parsed JSON response. A body is
+// sent as JSON. Requests that need the HTTP status or a binary response
+// (PDF downloads) call fetch directly.
+function apiFetch(path, {method = 'GET', body, signal} = {}) {
+    return fetch(path, {
+        method,
+        headers: body === undefined ? authHeaders : jsonAuthHeaders,
+        body: body === undefined ? undefined : JSON.stringify(body),
+        signal
+    }).then(response => response.json());
+}
+
+// Adopt the token and user returned by login or registration and open the
+// dashboard straight away; the welcome toast animates alongside it
+function commitSession(result, welcome) {
+    setAuthToken(result.token);
+    currentUser = result.user;
+    showToast(welcome, 'success');
+    startSessionTimer();
+    loadDashboard();
+}
+
+// Auth form inputs, looked up once. The script is deferred, so the auth
+// forms are already parsed when this runs.
+const authFields = {};
+for (const id of ['loginEmail', 'loginPassword', 'regBusinessName', 'regEmail', 'regPassword',
+                  'regLicenseId', 'regZipCode', 'regPhone', 'forgotEmail']) {
+    authFields[id] = document.getElementById(id);
+}
+
+async function login(event) {
+    if (event) event.preventDefault();
+
+    const email = authFields.loginEmail.value.trim();
+    const password = authFields.loginPassword.value;
+    const submitBtn = event ? event.target : document.querySelector('#loginForm .btn-primary');
+
+    if (!email || !password) {
+        showToast('Please fill in all fields', 'error');
+        return;
+    }
+
+    // Email validation
+    if (!EMAIL_PATTERN.test(email)) {
+        showToast('Please enter a valid email address', 'error');
+        return;
+    }
+
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const response = await fetch('/api/auth/login', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({email, password})
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            commitSession(result, 'Welcome back, ' + result.user.business_name + '!');
+        } else {
+            showToast(result.error || 'Login failed', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Login error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+async function register(event) {
+    if (event) event.preventDefault();
+
+    const businessName = authFields.regBusinessName.value.trim();
+    const email = authFields.regEmail.value.trim();
+    const password = authFields.regPassword.value;
+    const licenseId = authFields.regLicenseId.value.trim();
+    const zipCode = authFields.regZipCode.value.trim();
+    const phone = authFields.regPhone.value.trim();
+    const submitBtn = event ? event.target : document.querySelector('#registerForm .btn-primary');
+
+    // Validation
+    if (!businessName || !email || !password || !licenseId || !zipCode || !phone) {
+        showToast('Please fill in all fields including phone number', 'error');
+        return;
+    }
+
+    // Report every invalid field in one toast rather than one per attempt
+    const errors = [];
+    if (!EMAIL_PATTERN.test(email)) errors.push('Please enter a valid email address');
+    if (password.length < 8) errors.push('Password must be at least 8 characters long');
+    if (!ZIP_PATTERN.test(zipCode)) errors.push('Please enter a valid 5-digit ZIP code');
+    // Phone validation (basic)
+    if (!PHONE_PATTERN.test(phone) || phone.length < 10) errors.push('Please enter a valid phone number');
+    if (errors.length) {
+        showToast(errors.join('. '), 'error');
+        return;
+    }
+
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const response = await fetch('/api/auth/register', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                business_name: businessName,
+                email,
+                password,
+                license_id: licenseId,
+                primary_zip_code: zipCode,
+                phone: phone
+            })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            commitSession(result, 'Account created successfully! Welcome to Tileit!');
+        } else {
+            showToast(result.error || 'Registration failed', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Registration error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+async function forgotPassword(event) {
+    if (event) event.preventDefault();
+
+    const email = authFields.forgotEmail.value.trim();
+    const submitBtn = event ? event.target : document.querySelector('#forgotPasswordForm .btn-primary');
+
+    if (!email) {
+        showToast('Please enter your email address', 'error');
+        return;
+    }
+
+    if (!EMAIL_PATTERN.test(email)) {
+        showToast('Please enter a valid email address', 'error');
+        return;
+    }
+
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const response = await fetch('/api/auth/forgot-password', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({email})
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            showToast('Password reset link sent to your email. Check your inbox.', 'success');
+            setTimeout(() => showLogin(), 2000);
+        } else {
+            showToast(result.error || 'Failed to send reset link', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Forgot password error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+function confirmLogout() {
+    showConfirmDialog(
+        'Confirm Logout',
+        'Are you sure you want to logout?',
+        () => logout(),
+        'Logout',
+        'Cancel'
+    );
+}
+
+function logout() {
+    // Call logout API without waiting on it; keepalive lets the request
+    // finish even if the tab is closed straight after
+    if (authToken) {
+        fetch('/api/auth/logout', {
+            method: 'POST',
+            headers: jsonAuthHeaders,
+            keepalive: true
+        }).catch(error => console.error('Logout API error:', error));
+    }
+
+    // Clear session data
+    setAuthToken(null);
+    currentUser = null;
+
+    // Clear timers
+    clearTimeout(sessionTimer);
+    sessionExpiresAt = 0;
+
+    propertiesCache.clear();
+    quoteCache.clear();
+    generatedQuotes = null;
+    for (const section in sectionLoaded) sectionLoaded[section] = 0;
+
+    // Reset UI
+    document.getElementById('authSection').style.display = 'block';
+    sections.get('dashboard').classList.remove('active');
+    document.getElementById('userMenu').style.display = 'none';
+    dismissSessionWarning();
+
+    // Hide all sections
+    sections.forEach(el => el.style.display = 'none');
+
+    showToast('You have been logged out successfully', 'info');
+}
+
+// Section containers (by id) and nav links are fixed parts of the page,
+// so they are looked up once rather than on every navigation
+const sections = new Map(Array.from(document.querySelectorAll('.dashboard'), el => [el.id, el]));
+const navItems = document.querySelectorAll('.nav-item');
+
+function showSection(section) {
+    // Hide all sections
+    sections.forEach(el => el.style.display = 'none');
+    navItems.forEach(el => el.classList.remove('active'));
+
+    // Show selected section and load data
+    if (section === 'dashboard') {
+        sections.get('dashboard').style.display = 'block';
+        navItems[0].classList.add('active');
+        // Dashboard loads stats automatically on init
+    } else if (section === 'properties') {
+        sections.get('properties').style.display = 'block';
+        navItems[1].classList.add('active');
+        if (!sectionIsFresh('properties')) loadProperties();
+    } else if (section === 'quotes') {
+        sections.get('quotes').style.display = 'block';
+        navItems[2].classList.add('active');
+        if (!sectionIsFresh('quotes')) loadSavedQuotes();
+    } else if (section === 'settings') {
+        sections.get('settings').style.display = 'block';
+        navItems[3].classList.add('active');
+        ensureSection('settings').then(() => {
+            document.getElementById('hqEffects').checked = document.body.classList.contains('hq-effects');
+        }).catch(error => console.error('Error loading settings:', error));
+    } else if (section === 'profile') {
+        sections.get('profile').style.display = 'block';
+        navItems[4].classList.add('active');
+        if (!sectionIsFresh('profile')) loadRooferProfile();
+    }
+
+    currentSection = section;
+}
+
+// When each section's data was last shown. Switching back to a section
+// within a minute keeps what is already rendered (and the page the user was
+// on); the Refresh buttons and mutations that change the data reset it.
+const SECTION_FRESHNESS = 60 * 1000;
+const sectionLoaded = {properties: 0, quotes: 0, profile: 0};
+
+function sectionIsFresh(section) {
+    return Date.now() - sectionLoaded[section] < SECTION_FRESHNESS;
+}
+
+function refreshProperties() {
+    propertiesCache.clear();
+    loadProperties(propertiesPagination ? propertiesPagination.page : 1);
+}
+
+function refreshSavedQuotes() {
+    loadSavedQuotes(savedQuotesPagination ? savedQuotesPagination.page : 1);
+}
+
+// Sections marked data-fragment ship as an empty shell; their markup
+// is fetched the first time they are needed and kept from then on
+const sectionLoads = new Map();
+
+function ensureSection(section) {
+    const el = sections.get(section);
+    if (!el.dataset.fragment) return Promise.resolve(el);
+
+    if (!sectionLoads.has(section)) {
+        const load = fetch(el.dataset.fragment)
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.text();
+            })
+            .then(html => {
+                el.innerHTML = html;
+                delete el.dataset.fragment;
+                return el;
+            })
+            .catch(error => {
+                sectionLoads.delete(section);
+                throw error;
+            });
+        sectionLoads.set(section, load);
+    }
+    return sectionLoads.get(section);
+}
+
+function handleProfileStatusClick() {
+    if (PROFILE_FORM.status.textContent.includes('Incomplete')) {
+        showSection('profile');
+    }
+}
+
+async function loadDashboard() {
+    try {
+        // User, roofer profile, first page of properties and quote count
+        // arrive together
+        const query = propertyQuery().toString();
+        const result = await apiFetch(`/api/dashboard/bootstrap?${query}`);
+        if (!result.success) throw new Error(result.error || 'Bootstrap failed');
+
+        currentUser = result.user;
+        document.getElementById('userName').textContent = currentUser.business_name;
+        document.getElementById('userAvatar').textContent = currentUser.business_name.charAt(0).toUpperCase();
+        document.getElementById('userMenu').style.display = 'flex';
+
+        // Populate profile form
+        PROFILE_FORM.businessName.value = currentUser.business_name;
+        document.getElementById('profileEmail').value = currentUser.email;
+        PROFILE_FORM.licenseId.value = currentUser.license_id;
+        PROFILE_FORM.zipCode.value = currentUser.primary_zip_code;
+
+        // Make email readonly
+        document.getElementById('profileEmail').setAttribute('readonly', 'true');
+
+        applyRooferProfile(result.roofer_profile);
+        cacheProperties(query, result.properties);
+        applyProperties(result.properties);
+        document.getElementById('totalQuotes').textContent = result.total_quotes;
+
+        // Show dashboard
+        document.getElementById('authSection').style.display = 'none';
+        sections.get('dashboard').classList.add('active');
+        sections.get('dashboard').style.display = 'block';
+
+    } catch (error) {
+        console.error('Error loading dashboard:', error);
+        showToast('Error loading dashboard data', 'error');
+        logout();
+    }
+}
+
+// Columns read by the properties table, the quote modal and the saved-quote
+// snapshot (the server recalculates PDF quotes from the snapshot, so the
+// repair areas and tile count it falls back on are kept too)
+const PROPERTY_LIST_FIELDS = [
+    'address', 'roof_material', 'roof_area', 'pitch', 'avg_pitch',
+    'roof condition summary score', 'avg_condition', 'height (ft)', 'avg_height',
+    'roof_layers', 'shingle repair area (sqm)', 'tile repair area (sqm)',
+    'metal repair area (sqm)', 'tile count'
+].join(',');
+
+// Query string for /api/properties from the page number and filter inputs
+function propertyQuery(page = 1) {
+    const params = new URLSearchParams({
+        page: page,
+        per_page: 20,
+        fields: PROPERTY_LIST_FIELDS
+    });
+
+    // Add filters
+    const searchAddress = document.getElementById('searchAddress').value;
+    const material = document.getElementById('filterMaterial').value;
+    const minArea = document.getElementById('minArea').value;
+    const maxArea = document.getElementById('maxArea').value;
+    const minPitch = document.getElementById('minPitch').value;
+    const maxPitch = document.getElementById('maxPitch').value;
+    const minCondition = document.getElementById('minCondition').value;
+    const maxCondition = document.getElementById('maxCondition').value;
+
+    if (searchAddress) params.append('search', searchAddress);
+    if (material) params.append('material', material);
+    if (minArea) params.append('min_area', minArea);
+    if (maxArea) params.append('max_area', maxArea);
+    if (minPitch) params.append('min_pitch', minPitch);
+    if (maxPitch) params.append('max_pitch', maxPitch);
+    if (minCondition) params.append('condition_min', minCondition);
+    if (maxCondition) params.append('condition_max', maxCondition);
+
+    return params;
+}
+
+// Recently viewed property pages keyed by query string. The property data
+// doesn't change while the app runs, so paging back and forth or re-applying
+// filters is served from here for a minute.
+const PROPERTIES_CACHE_SIZE = 32;
+const PROPERTIES_CACHE_TTL = 60 * 1000;
+const propertiesCache = new Map();
+
+function cacheProperties(query, result) {
+    if (!result.success) return;
+    propertiesCache.delete(query);
+    propertiesCache.set(query, {time: Date.now(), result});
+    // Maps iterate in insertion order, so the first key is least recently used
+    if (propertiesCache.size > PROPERTIES_CACHE_SIZE) {
+        propertiesCache.delete(propertiesCache.keys().next().value);
+    }
+}
+
+// Only the latest properties request may render: starting a new one aborts
+// the one in flight, so quick paging can't paint an older page over a newer one
+let propertiesController = null;
+let propertiesQueryInFlight = '';
+// Pagination of the page on screen; Previous/Next step from it
+let propertiesPagination = null;
+
+async function loadProperties(page = 1) {
+    const query = propertyQuery(page).toString();
+    // Asking again for the request already in flight (Apply Filters clicked
+    // twice, say) lets it finish instead of restarting it
+    if (propertiesController && query === propertiesQueryInFlight) return;
+    if (propertiesController) propertiesController.abort();
+    propertiesController = null;
+    let controller = null;
+
+    try {
+        const cached = propertiesCache.get(query);
+        if (cached && Date.now() - cached.time < PROPERTIES_CACHE_TTL) {
+            // Move to the most recently used end, keeping its original age
+            propertiesCache.delete(query);
+            propertiesCache.set(query, cached);
+            applyProperties(cached.result);
+            prefetchNextProperties(cached.result.pagination);
+            return;
+        }
+
+        controller = new AbortController();
+        propertiesController = controller;
+        propertiesQueryInFlight = query;
+        const result = await apiFetch(`/api/properties?${query}`, { signal: controller.signal });
+        if (propertiesController !== controller) return;
+        propertiesController = null;
+        cacheProperties(query, result);
+        applyProperties(result);
+        if (result.success) prefetchNextProperties(result.pagination);
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        // A failed request mustn't keep later identical ones from starting
+        if (propertiesController === controller) propertiesController = null;
+        console.error('Error loading properties:', error);
+    }
+}
+
+// Users mostly page forward, so once a page is shown the next one is fetched
+// into the cache while the browser is idle. Skipped when the browser asks to
+// save data.
+function prefetchNextProperties(pagination) {
+    if (!pagination.has_next || (navigator.connection && navigator.connection.saveData)) return;
+    // Built now, while the filter inputs still match the page on screen
+    const query = propertyQuery(pagination.page + 1).toString();
+    const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 0));
+    whenIdle(() => {
+        const cached = propertiesCache.get(query);
+        if (cached && Date.now() - cached.time < PROPERTIES_CACHE_TTL) return;
+        apiFetch(`/api/properties?${query}`)
+            .then(result => cacheProperties(query, result))
+            .catch(() => {});
+    }, { timeout: 2000 });
+}
+
+function applyProperties(result) {
+    if (result.success) {
+        sectionLoaded.properties = Date.now();
+        propertiesPagination = result.pagination;
+        document.getElementById('totalProperties').textContent = result.pagination.total_properties;
+        document.getElementById('propertiesStats').textContent = 
+            `Showing ${result.properties.length} of ${result.pagination.total_properties} properties`;
+
+        displayProperties(result.properties);
+        updatePagination(document.getElementById('propertiesPagination'), result.pagination);
+    }
+}
+
+function displayProperties(properties) {
+    const container = document.getElementById('propertiesTable');
+
+    if (properties.length === 0) {
+        container.innerHTML = '<div class="loading">No properties found matching your filters.</div>';
+        return;
+    }
+
+    renderTable(
+        container,
+        ['Address', 'Material', 'Area (sqft)', 'Pitch (°)', 'Condition', 'Height (ft)', 'Layers'],
+        properties,
+        prop => {
+            const {pitch, condition, height} = propertyFigures(prop);
+            return [
+                propertyLink(prop.address || 'N/A'),
+                prop.roof_material || 'N/A',
+                fixed(prop.roof_area, 0),
+                pitch,
+                condition,
+                height,
+                prop.roof_layers || 1
+            ];
+        },
+        prop => showPropertyDetails(prop)
+    );
+}
+
+// Build a table off-document, collecting its rows in a fragment, and
+// swap it into the container with a single DOM mutation. Cells may be
+// nodes or plain values; values are inserted as text, never as markup.
+function renderTable(container, headers, items, cellsFor, onRowClick = null) {
+    const table = document.createElement('table');
+    table.className = 'properties-table';
+
+    const headRow = table.createTHead().insertRow();
+    for (const header of headers) {
+        const th = document.createElement('th');
+        th.textContent = header;
+        headRow.appendChild(th);
+    }
+
+    const rows = document.createDocumentFragment();
+    for (const item of items) {
+        const tr = document.createElement('tr');
+        for (const cell of cellsFor(item)) {
+            // A cell is text, a node, or an array of nodes
+            tr.insertCell().append(...[].concat(cell));
+        }
+        rows.appendChild(tr);
+    }
+    const tbody = table.createTBody();
+    tbody.appendChild(rows);
+
+    if (onRowClick) {
+        // One listener for the whole body; a row's position is its item index.
+        // Buttons inside the row run their own data-action instead
+        tbody.addEventListener('click', event => {
+            const tr = event.target.closest('tr');
+            if (tr && !event.target.closest('[data-action]')) onRowClick(items[tr.sectionRowIndex]);
+        });
+    }
+
+    container.replaceChildren(table);
+}
+
+// Pitch, condition and height as displayed. Multi-layer properties carry
+// avg_* values, single-layer ones the raw CSV columns. Worked out once per
+// property object, so cached pages and the modal reuse them, and kept off the
+// object itself, which is stored verbatim in saved-quote snapshots.
+const propertyFiguresCache = new WeakMap();
+
+function propertyFigures(prop) {
+    let figures = propertyFiguresCache.get(prop);
+    if (!figures) {
+        figures = {
+            pitch: fixed(prop.avg_pitch || prop.pitch, 1),
+            condition: prop.avg_condition ? prop.avg_condition.toFixed(1) : (prop['roof condition summary score'] || 'N/A'),
+            height: fixed(prop.avg_height || prop['height (ft)'], 1)
+        };
+        propertyFiguresCache.set(prop, figures);
+    }
+    return figures;
+}
+
+function propertyLink(text) {
+    const link = document.createElement('a');
+    link.href = '#';
+    link.className = 'property-link';
+    link.textContent = text;
+    return link;
+}
+
+// Table cell button dispatched through ACTIONS
+function actionButton(label, className, action, arg) {
+    const button = document.createElement('button');
+    button.className = `btn btn-sm ${className}`;
+    button.textContent = label;
+    button.dataset.action = action;
+    button.dataset.arg = arg;
+    return button;
+}
+
+// Number formatters in the user's locale, built once: each toLocaleString()
+// call sets up a formatter of its own
+const WHOLE_NUMBER = new Intl.NumberFormat(undefined, {maximumFractionDigits: 0});
+const MONEY = new Intl.NumberFormat(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2});
+
+// A measurement to the given number of decimals, or N/A when it is missing
+// (or zero, which the data uses for unknown)
+function fixed(value, digits, unit = '') {
+    return value ? value.toFixed(digits) + unit : 'N/A';
+}
+
+function strong(text) {
+    const element = document.createElement('strong');
+    element.textContent = text;
+    return element;
+}
+
+
+// Pagination bars are laid out as <button>Previous</button> <span> <button>Next</button>
+function updatePagination(container, pagination) {
+    const prevBtn = container.querySelector('button:first-child');
+    const nextBtn = container.querySelector('button:last-child');
+    const pageInfo = container.querySelector('span');
+
+    if (pagination.total_pages > 1) {
+        container.style.display = 'flex';
+        prevBtn.disabled = !pagination.has_prev;
+        nextBtn.disabled = !pagination.has_next;
+        pageInfo.textContent = `Page ${pagination.page} of ${pagination.total_pages}`;
+    } else {
+        container.style.display = 'none';
+    }
+}
+
+function previousPage() {
+    if (propertiesPagination && propertiesPagination.has_prev) {
+        loadProperties(propertiesPagination.page - 1);
+    }
+}
+
+function nextPage() {
+    if (propertiesPagination && propertiesPagination.has_next) {
+        loadProperties(propertiesPagination.page + 1);
+    }
+}
+
+// Load Saved Quotes
+// As with properties, a reload (e.g. after a delete) aborts the one in flight
+let savedQuotesController = null;
+// Pagination of the saved-quotes page on screen, null until one is loaded
+let savedQuotesPagination = null;
+
+function previousQuotesPage() {
+    if (savedQuotesPagination && savedQuotesPagination.has_prev) {
+        loadSavedQuotes(savedQuotesPagination.page - 1);
+    }
+}
+
+function nextQuotesPage() {
+    if (savedQuotesPagination && savedQuotesPagination.has_next) {
+        loadSavedQuotes(savedQuotesPagination.page + 1);
+    }
+}
+
+async function loadSavedQuotes(page = 1) {
+    if (savedQuotesController) savedQuotesController.abort();
+    const controller = new AbortController();
+    savedQuotesController = controller;
+
+    try {
+        await ensureSection('quotes');
+
+        const result = await apiFetch(`/api/quotes/saved?page=${page}&per_page=20`, { signal: controller.signal });
+        if (savedQuotesController !== controller) return;
+        savedQuotesController = null;
+
+        if (result.success) {
+            showSavedQuotes(result.quotes, result.pagination);
+        } else {
+            savedQuotesById.clear();
+            document.getElementById('savedQuotesTable').innerHTML = '<div class="loading">No saved quotes yet.</div>';
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error loading saved quotes:', error);
+        savedQuotesById.clear();
+        const table = document.getElementById('savedQuotesTable');
+        if (table) table.innerHTML = '<div class="loading">No saved quotes yet. Browse properties to create some!</div>';
+    }
+}
+
+function showSavedQuotes(quotes, pagination) {
+    // Looked up by id, so View Details doesn't depend on the page's row order
+    savedQuotesById.clear();
+    for (const quote of quotes) savedQuotesById.set(quote.id, quote);
+    savedQuotesPagination = pagination;
+    sectionLoaded.quotes = Date.now();
+    const total = pagination.total_quotes;
+    document.getElementById('totalQuotes').textContent = total;
+    document.getElementById('savedQuotesStats').textContent = 
+        `${total} saved ${total === 1 ? 'quote' : 'quotes'}`;
+    displaySavedQuotes(quotes);
+    updatePagination(document.getElementById('savedQuotesPagination'), pagination);
+}
+
+function displaySavedQuotes(quotes) {
+    const container = document.getElementById('savedQuotesTable');
+
+    if (quotes.length === 0) {
+        container.innerHTML = '<div class="loading">No saved quotes yet. Browse properties and click "Save Quote" to add them here!</div>';
+        return;
+    }
+
+    renderTable(
+        container,
+        ['Property Address', 'Material', 'Area (sqft)', 'Quote Range', 'Saved On', 'Actions'],
+        quotes,
+        quote => {
+            const addr = (quote.property_snapshot && quote.property_snapshot.address) || quote.property_address || 'N/A';
+            const material = (quote.property_snapshot && (quote.property_snapshot.roof_material || quote.property_snapshot.material)) || quote.material || 'N/A';
+            const areaVal = (quote.property_snapshot && (quote.property_snapshot.roof_area || quote.property_snapshot.area)) || quote.area;
+            const area = areaVal ? Math.round(areaVal) : 'N/A';
+            const minQ = (quote.quote_snapshot && quote.quote_snapshot.min_quote) || quote.min_quote;
+            const maxQ = (quote.quote_snapshot && quote.quote_snapshot.max_quote) || quote.max_quote;
+            const savedOn = quote.saved_date ? new Date(quote.saved_date).toLocaleDateString() : 'N/A';
+            const pdfButton = actionButton('📄 PDF', 'btn-success', 'download-pdf', quote.id);
+            const deleteButton = actionButton('Delete', 'btn-secondary', 'delete-saved-quote', quote.id);
+            pdfButton.style.marginLeft = deleteButton.style.marginLeft = '8px';
+            return [
+                addr,
+                material,
+                area,
+                `$${minQ ? WHOLE_NUMBER.format(minQ) : 'N/A'} - $${maxQ ? WHOLE_NUMBER.format(maxQ) : 'N/A'}`,
+                savedOn,
+                [actionButton('View Details', 'btn-primary', 'view-saved-quote', quote.id), pdfButton, deleteButton]
+            ];
+        }
+    );
+}
+
+// Show Property Details Modal
+function showLoadingShimmer(text = 'Loading...') {
+    const shimmer = document.getElementById('loadingShimmer');
+    shimmer.querySelector('.shimmer-text').textContent = text;
+    shimmer.hidden = false;
+}
+
+function hideLoadingShimmer() {
+    document.getElementById('loadingShimmer').hidden = true;
+}
+
+// Quotes generated this session, keyed by address. A quote depends only on
+// the property and the roofer profile, so saving the profile clears it.
+const quoteCache = new Map();
+
+// Takes the property object from the clicked row, which already holds
+// everything the modal shows, so only the quote needs a request
+async function showPropertyDetails(property) {
+    const cachedQuote = quoteCache.get(property.address);
+    if (cachedQuote) {
+        showPropertyModal(property, cachedQuote);
+        return;
+    }
+
+    try {
+        showLoadingShimmer('Generating quote...');
+
+        // Generate quote for this property
+        const quoteResponse = await fetch('/api/quotes/generate', {
+            method: 'POST',
+            headers: jsonAuthHeaders,
+            body: JSON.stringify({
+                addresses: [property.address]
+            })
+        });
+
+        hideLoadingShimmer();
+
+        if (!quoteResponse.ok) {
+            if (quoteResponse.status === 409) {
+                promptProfileCompletion();
+                return;
+            }
+            throw new Error(`Quote calculation failed! status: ${quoteResponse.status}`);
+        }
+
+        const quoteResult = await quoteResponse.json();
+
+        if (!quoteResult.success || !quoteResult.quotes || quoteResult.quotes.length === 0) {
+            showToast('Failed to generate quote', 'error');
+            return;
+        }
+
+        const quote = quoteResult.quotes[0];
+        quoteCache.set(property.address, quote);
+        showPropertyModal(property, quote);
+
+    } catch (error) {
+        hideLoadingShimmer();
+        console.error('Error loading property details:', error);
+        showToast('Error: ' + error.message, 'error');
+    }
+}
+
+function generatePropertyAnalysis(property, quote) {
+    const condition = property.avg_condition || property['roof condition summary score'] || 75;
+    const pitch = property.avg_pitch || property.pitch || 20;
+    const layers = property.roof_layers || 1;
+
+    // Condition Category
+    let conditionCategory, conditionClass;
+    if (condition >= 80) {
+        conditionCategory = 'Excellent';
+        conditionClass = 'status-excellent';
+    } else if (condition >= 60) {
+        conditionCategory = 'Good';
+        conditionClass = 'status-good';
+    } else if (condition >= 40) {
+        conditionCategory = 'Fair';
+        conditionClass = 'status-fair';
+    } else {
+        conditionCategory = 'Poor';
+        conditionClass = 'status-poor';
+    }
+
+    // Issues & Recommendations
+    let issues = [];
+    let recommendations = [];
+
+    if (condition < 50) {
+        issues.push('Low condition score indicates potential damage');
+        recommendations.push('Schedule inspection within 3 months');
+        recommendations.push('Consider full roof replacement');
+    } else if (condition < 70) {
+        issues.push('Moderate wear detected');
+        recommendations.push('Schedule inspection within 6 months');
+        recommendations.push('Monitor for leaks or damage');
+    }
+
+    if (pitch > 30) {
+        issues.push('Steep pitch requires specialized crew');
+        recommendations.push('Use safety equipment and experienced crew');
+    }
+
+    if (layers > 1) {
+        issues.push(`Multiple layers (${layers}) may require removal`);
+        recommendations.push('Factor in additional removal costs');
+    }
+
+    if (issues.length === 0) {
+        issues.push('No major issues detected');
+    }
+    if (recommendations.length === 0) {
+        recommendations.push('Standard maintenance schedule recommended');
+    }
+
+    return `
+        <div class="analysis-item">
+            <span class="analysis-label">Condition Category</span>
+            <span class="analysis-badge ${conditionClass}">${conditionCategory} (${condition.toFixed(1)}/100)</span>
+        </div>
+        <div class="analysis-item">
+            <span class="analysis-label">Potential Issues</span>
+            <ul class="analysis-list">
+                ${issues.map(issue => `<li>${issue}</li>`).join('')}
+            </ul>
+        </div>
+        <div class="analysis-item">
+            <span class="analysis-label">Recommended Actions</span>
+            <ul class="analysis-list">
+                ${recommendations.map(rec => `<li>${rec}</li>`).join('')}
+            </ul>
+        </div>
+    `;
+}
+
+// Store current property and quote globally for save function
+let currentPropertyData = null;
+let currentQuoteData = null;
+const savedQuotesById = new Map();
+let currentGeneratedQuotes = [];
+
+// The modal is part of the page; each open only rewrites these fields
+const propertyModal = document.getElementById('propertyQuoteModal');
+propertyModal.addEventListener('animationend', releaseWillChange);
+const propertyModalFields = new Map(
+    Array.from(propertyModal.querySelectorAll('[data-field]'), el => [el.dataset.field, el])
+);
+
+const PROPERTY_MODAL_FIELDS = {
+    address: property => property.address || 'N/A',
+    material: property => property.roof_material ? property.roof_material.charAt(0).toUpperCase() + property.roof_material.slice(1) : 'N/A',
+    area: property => fixed(property.roof_area, 0, ' sqft'),
+    pitch: property => `${propertyFigures(property).pitch}°`,
+    condition: property => `${propertyFigures(property).condition}/100`,
+    height: property => `${propertyFigures(property).height} ft`,
+    layers: property => property.roof_layers || 1,
+    minQuote: (property, quote) => `$${quote.min_quote ? WHOLE_NUMBER.format(quote.min_quote) : 'N/A'}`,
+    maxQuote: (property, quote) => `$${quote.max_quote ? WHOLE_NUMBER.format(quote.max_quote) : 'N/A'}`,
+    crew: (property, quote) => `${quote.crew_size_used || 'N/A'} workers`,
+    notes: (property, quote) => quote.notes || ''
+};
+
+function showPropertyModal(property, quote) {
+    // Store in global variables
+    currentPropertyData = property;
+    currentQuoteData = quote;
+
+    for (const [field, format] of Object.entries(PROPERTY_MODAL_FIELDS)) {
+        propertyModalFields.get(field).textContent = format(property, quote);
+    }
+    document.getElementById('propertyQuoteNotes').style.display = quote.notes ? '' : 'none';
+    document.getElementById('propertyAnalysis').innerHTML = generatePropertyAnalysis(property, quote);
+
+    // Re-arm will-change for the open animation; releaseWillChange drops it again
+    propertyModal.style.willChange = '';
+    propertyModal.firstElementChild.style.willChange = '';
+    propertyModal.hidden = false;
+}
+
+function closePropertyModal(event) {
+    if (!event || event.target === propertyModal) {
+        propertyModal.hidden = true;
+    }
+}
+
+// Function to save the currently displayed property quote
+async function saveCurrentQuote() {
+    if (!currentPropertyData || !currentQuoteData) {
+        showToast('No quote data available', 'error');
+        return;
+    }
+
+    console.log('💾 Saving quote...');
+    console.log('Current Property Data:', currentPropertyData);
+    console.log('Current Quote Data:', currentQuoteData);
+
+    // Build the payload
+    const payload = {
+        property_address: currentPropertyData.address || currentPropertyData.Address || currentPropertyData['Address'] || 'Unknown',
+        material: currentPropertyData.roof_material || currentPropertyData.Material || currentPropertyData['Roof Material'] || 'Unknown',
+        area: currentPropertyData.roof_area || currentPropertyData.Area || currentPropertyData['Area (sqft)'] || 0,
+        min_quote: currentQuoteData.min_quote,
+        max_quote: currentQuoteData.max_quote,
+        crew_size: currentQuoteData.crew_size_used || 3,
+        time_estimate: 0,
+        notes: currentQuoteData.estimated_quote_range || '',
+        // snapshots for rich Saved Quotes details
+        property_snapshot: currentPropertyData,
+        quote_snapshot: currentQuoteData
+    };
+
+    console.log('📤 Payload being sent:', payload);
+
+    try {
+        const result = await apiFetch('/api/quotes/save', { method: 'POST', body: payload });
+
+        if (result.success) {
+            showToast('Quote saved successfully!', 'success');
+            closePropertyModal();
+            if (savedQuotesPagination) {
+                // Saved quotes are listed newest first, so the new one shifts
+                // every page; reload the first page rather than patch one
+                loadSavedQuotes();
+            } else {
+                // Quotes section not opened yet; it loads its first page then
+                const totalQuotes = document.getElementById('totalQuotes');
+                totalQuotes.textContent = Number(totalQuotes.textContent) + 1;
+            }
+        } else {
+            showToast(result.message || 'Failed to save quote', 'error');
+        }
+    } catch (error) {
+        console.error('Error saving quote:', error);
+        showToast('Error saving quote', 'error');
+    }
+}
+
+// Legacy function for saved quotes view
+async function saveQuote(property, quote) {
+    currentPropertyData = property;
+    currentQuoteData = quote;
+    await saveCurrentQuote();
+}
+
+function viewSavedQuoteDetails(quoteId) {
+    const quote = savedQuotesById.get(quoteId);
+    if (!quote) {
+        showToast('Quote not found', 'error');
+        return;
+    }
+
+    // Reconstruct property and quote objects from saved quote
+    // Prefer stored snapshots; fall back to minimal fields
+    const property = quote.property_snapshot ? quote.property_snapshot : {
+        address: quote.property_address,
+        roof_material: quote.material,
+        roof_area: quote.area
+    };
+
+    const quoteData = quote.quote_snapshot ? quote.quote_snapshot : {
+        min_quote: quote.min_quote,
+        max_quote: quote.max_quote,
+        crew_size_used: quote.crew_size,
+        estimated_quote_range: quote.notes
+    };
+
+    showPropertyModal(property, quoteData);
+}
+
+async function deleteSavedQuote(quoteId) {
+    if (!confirm('Are you sure you want to delete this quote?')) return;
+
+    console.log('Deleting quote with ID:', quoteId);
+
+    try {
+        const result = await apiFetch(`/api/quotes/${quoteId}`, { method: 'DELETE' });
+
+        if (result.success) {
+            showToast('Quote deleted successfully', 'success');
+            loadSavedQuotes(savedQuotesPagination ? savedQuotesPagination.page : 1);
+        } else {
+            showToast('Failed to delete quote', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting quote:', error);
+        showToast('Error deleting quote', 'error');
+    }
+}
+
+async function downloadPDF(quoteId, quoteData = null) {
+    try {
+        showToast('Generating PDF...', 'info');
+
+        const url = `/api/quotes/${quoteId}/pdf`;
+        const response = await fetch(url, {
+            method: 'GET',
+            headers: authHeaders
+        });
+
+        if (!response.ok) {
+            const error = await response.json().catch(() => ({error: 'Failed to generate PDF'}));
+            throw new Error(error.error || 'Failed to generate PDF');
+        }
+
+        // Get PDF blob
+        const blob = await response.blob();
+        const url_blob = window.URL.createObjectURL(blob);
+
+        // Create download link
+        const a = document.createElement('a');
+        a.href = url_blob;
+        a.download = `Roofing_Estimate_${quoteId}_${new Date().toISOString().split('T')[0]}.pdf`;
+        document.body.appendChild(a);
+        a.click();
+
+        // Cleanup
+        window.URL.revokeObjectURL(url_blob);
+        document.body.removeChild(a);
+
+        showToast('PDF downloaded successfully!', 'success');
+    } catch (error) {
+        console.error('Error downloading PDF:', error);
+        showToast('Failed to download PDF: ' + error.message, 'error');
+    }
+}
+
+async function downloadPDFFromData(quote, quoteId = null) {
+    try {
+        showToast('Generating PDF...', 'info');
+
+        const response = await fetch('/api/quotes/generate-pdf', {
+            method: 'POST',
+            headers: jsonAuthHeaders,
+            body: JSON.stringify({
+                quote: quote
+            })
+        });
+
+        if (!response.ok) {
+            const error = await response.json().catch(() => ({error: 'Failed to generate PDF'}));
+            throw new Error(error.error || 'Failed to generate PDF');
+        }
+
+        // Get PDF blob
+        const blob = await response.blob();
+        const url_blob = window.URL.createObjectURL(blob);
+
+        // Create download link
+        const a = document.createElement('a');
+        a.href = url_blob;
+        const address = quote.address || 'quote';
+        const safeAddress = address.replace(/[^a-z0-9]/gi, '_').substring(0, 30);
+        a.download = `Roofing_Estimate_${safeAddress}_${new Date().toISOString().split('T')[0]}.pdf`;
+        document.body.appendChild(a);
+        a.click();
+
+        // Cleanup
+        window.URL.revokeObjectURL(url_blob);
+        document.body.removeChild(a);
+
+        showToast('PDF downloaded successfully!', 'success');
+    } catch (error) {
+        console.error('Error downloading PDF:', error);
+        showToast('Failed to download PDF: ' + error.message, 'error');
+    }
+}
+
+async function downloadPDFFromIndex(index) {
+    // Get quotes from the global array
+    if (!currentGeneratedQuotes || !currentGeneratedQuotes[index]) {
+        showToast('Quote not found', 'error');
+        return;
+    }
+
+    await downloadPDFFromData(currentGeneratedQuotes[index], index);
+}
+
+async function downloadPDFFromModal() {
+    if (!currentPropertyData || !currentQuoteData) {
+        showToast('No quote data available', 'error');
+        return;
+    }
+
+    // Combine property and quote data into a QuoteResult-like object
+    const quoteForPDF = {
+        address: currentPropertyData.address || 'Unknown Address',
+        roof_material: currentPropertyData.roof_material || 'asphalt',
+        pitch: currentPropertyData.pitch || currentPropertyData.avg_pitch || 15,
+        estimated_quote_range: currentQuoteData.estimated_quote_range || `$${currentQuoteData.min_quote || 0} - $${currentQuoteData.max_quote || 0}`,
+        min_quote: currentQuoteData.min_quote || 0,
+        max_quote: currentQuoteData.max_quote || 0,
+        region_multiplier: currentQuoteData.region_multiplier || 1.0,
+        crew_size_used: currentQuoteData.crew_size_used || 3,
+        roof_area: currentPropertyData.roof_area || 0,
+        material_cost: currentQuoteData.material_cost || 0,
+        labor_cost: currentQuoteData.labor_cost || 0,
+        repair_cost: currentQuoteData.repair_cost || 0,
+        subtotal: currentQuoteData.subtotal || 0,
+        overhead: currentQuoteData.overhead || 0,
+        profit: currentQuoteData.profit || 0,
+        total: currentQuoteData.total || (currentQuoteData.min_quote || 0)
+    };
+
+    await downloadPDFFromData(quoteForPDF);
+}
+
+function applyFilters() {
+    showToast('Applying filters...', 'info');
+    loadProperties();
+}
+
+function clearFilters() {
+    document.getElementById('searchAddress').value = '';
+    document.getElementById('filterMaterial').value = '';
+    document.getElementById('minArea').value = '';
+    document.getElementById('maxArea').value = '';
+    document.getElementById('minPitch').value = '';
+    document.getElementById('maxPitch').value = '';
+    document.getElementById('minCondition').value = '';
+    document.getElementById('maxCondition').value = '';
+    showToast('Filters cleared', 'info');
+    loadProperties();
+}
+
+async function saveSettings(event) {
+    if (event) event.preventDefault();
+
+    const submitBtn = event ? event.target : document.querySelector('#settings .btn-primary');
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const settings = {
+            notifications: document.getElementById('notifications').checked,
+            email_alerts: document.getElementById('emailAlerts').checked,
+            auto_save: document.getElementById('autoSave').checked
+        };
+
+        const result = await apiFetch('/api/settings', { method: 'PUT', body: settings });
+
+        if (result.success) {
+            showToast('Settings saved successfully!', 'success');
+        } else {
+            showToast(result.error || 'Error saving settings', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Save settings error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+async function updateProfile(event) {
+    if (event) event.preventDefault();
+
+    const businessName = PROFILE_FORM.businessName.value.trim();
+    const licenseId = PROFILE_FORM.licenseId.value.trim();
+    const zipCode = PROFILE_FORM.zipCode.value.trim();
+    const submitBtn = event ? event.target : document.querySelector('#profile .btn-primary');
+
+    // Validation
+    if (!businessName || !licenseId || !zipCode) {
+        showToast('Please fill in all fields', 'error');
+        return;
+    }
+
+    if (!ZIP_PATTERN.test(zipCode)) {
+        showToast('Please enter a valid 5-digit ZIP code', 'error');
+        return;
+    }
+
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const profileData = {
+            business_name: businessName,
+            license_id: licenseId,
+            primary_zip_code: zipCode
+        };
+
+        const result = await apiFetch('/api/profile', { method: 'PUT', body: profileData });
+
+        if (result.success) {
+            // Update current user info
+            currentUser.business_name = businessName;
+            currentUser.license_id = licenseId;
+            currentUser.primary_zip_code = zipCode;
+
+            // Update display
+            document.getElementById('userName').textContent = businessName;
+            document.getElementById('userAvatar').textContent = businessName.charAt(0).toUpperCase();
+
+            showToast('Profile updated successfully!', 'success');
+        } else {
+            showToast(result.error || 'Error updating profile', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Update profile error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+// Roofer Profile Functions
+async function loadRooferProfile() {
+    try {
+        applyRooferProfile(await apiFetch('/api/profile/roofer'));
+    } catch (error) {
+        console.error('Error loading roofer profile:', error);
+        markProfileIncomplete();
+    }
+}
+
+// Business profile form, looked up once: the profile section is part of the
+// page, so these inputs live as long as it does. The cost groups are keyed
+// like the roofer profile JSON (flat_low -> profileSlopeFlatLow).
+const profileInputs = (prefix, keys) => Object.freeze(Object.fromEntries(keys.map(key =>
+    [key, document.getElementById(prefix + key.replace(/(?:^|_)(\w)/g, (_, c) => c.toUpperCase()))])));
+const PROFILE_MATERIALS = ['asphalt', 'shingle', 'metal', 'tile', 'concrete'];
+
+const PROFILE_FORM = Object.freeze({
+    status: document.getElementById('profileStatus'),
+    statusCard: document.getElementById('profileStatusCard'),
+    businessName: document.getElementById('profileBusinessName'),
+    licenseId: document.getElementById('profileLicenseId'),
+    zipCode: document.getElementById('profileZipCode'),
+    laborRate: document.getElementById('profileLaborRate'),
+    dailyProductivity: document.getElementById('profileDailyProductivity'),
+    baseCrewSize: document.getElementById('profileBaseCrewSize'),
+    crewScalingRule: document.getElementById('profileCrewScalingRule'),
+    overhead: document.getElementById('profileOverhead'),
+    profit: document.getElementById('profileProfit'),
+    slope: profileInputs('profileSlope', ['flat_low', 'moderate', 'steep', 'very_steep']),
+    materials: profileInputs('profileMaterial', PROFILE_MATERIALS),
+    replacement: profileInputs('profileReplacement', PROFILE_MATERIALS)
+});
+
+// Values shown for cost groups the saved profile leaves unset
+const PROFILE_DEFAULTS = {
+    slope: {flat_low: 0, moderate: 0.1, steep: 0.2, very_steep: 0.3},
+    materials: {asphalt: 4.0, shingle: 4.5, metal: 7.0, tile: 8.0, concrete: 6.0},
+    replacement: {asphalt: 45, shingle: 50, metal: 90, tile: 70, concrete: 60}
+};
+
+function fillProfileGroup(group, values) {
+    for (const key in PROFILE_FORM[group]) {
+        PROFILE_FORM[group][key].value = values[key] || PROFILE_DEFAULTS[group][key];
+    }
+}
+
+function readProfileGroup(group) {
+    return Object.fromEntries(Object.entries(PROFILE_FORM[group]).map(([key, el]) => [key, parseFloat(el.value)]));
+}
+
+// Whether the saved profile can generate quotes, as last loaded or saved; lets
+// "Generate All Quotes" skip a profile request. The server checks again.
+let profileIsComplete = false;
+
+function setProfileStatus(isComplete) {
+    profileIsComplete = isComplete;
+    PROFILE_FORM.status.textContent = isComplete ? 'Complete ✓' : 'Incomplete - Click to complete';
+    PROFILE_FORM.statusCard.classList.toggle('status--complete', isComplete);
+    PROFILE_FORM.statusCard.classList.toggle('status--incomplete', !isComplete);
+}
+
+function applyRooferProfile(result) {
+    if (result.success && result.profile) {
+        sectionLoaded.profile = Date.now();
+        const profile = result.profile;
+
+        // Check if profile is actually saved (not just default values)
+        setProfileStatus(Boolean(result.profile_exists && rooferProfileComplete(profile)));
+
+        // Labor Information
+        PROFILE_FORM.laborRate.value = profile.labor_rate || 45;
+        PROFILE_FORM.dailyProductivity.value = profile.daily_productivity || 2500;
+        PROFILE_FORM.baseCrewSize.value = profile.base_crew_size || 3;
+        PROFILE_FORM.crewScalingRule.value = profile.crew_scaling_rule || 'size_and_complexity';
+
+        // Slope adjustments, material and replacement costs
+        fillProfileGroup('slope', profile.slope_cost_adjustment || {});
+        fillProfileGroup('materials', profile.material_costs || {});
+        fillProfileGroup('replacement', profile.replacement_costs || {});
+
+        // Business Margins
+        PROFILE_FORM.overhead.value = profile.overhead_percent || 0.1;
+        PROFILE_FORM.profit.value = profile.profit_margin || 0.2;
+    } else {
+        // No profile found
+        markProfileIncomplete();
+    }
+}
+
+// A saved profile will have all required fields set to non-zero values
+function rooferProfileComplete(profile) {
+    return profile.labor_rate > 0 &&
+           profile.daily_productivity > 0 &&
+           profile.base_crew_size > 0 &&
+           profile.overhead_percent !== null &&
+           profile.profit_margin !== null;
+}
+
+function markProfileIncomplete() {
+    setProfileStatus(false);
+}
+
+function promptProfileCompletion() {
+    showToast('Please complete your business profile before generating quotes', 'warning');
+    showSection('profile');
+}
+
+async function saveRooferProfile(event) {
+    if (event) event.preventDefault();
+
+    const submitBtn = event ? event.target : document.querySelector('#profile .btn-primary');
+    setButtonLoading(submitBtn, true);
+
+    try {
+        const profileData = {
+            labor_rate: parseFloat(PROFILE_FORM.laborRate.value),
+            daily_productivity: parseInt(PROFILE_FORM.dailyProductivity.value),
+            base_crew_size: parseInt(PROFILE_FORM.baseCrewSize.value),
+            crew_scaling_rule: PROFILE_FORM.crewScalingRule.value,
+            slope_cost_adjustment: readProfileGroup('slope'),
+            material_costs: readProfileGroup('materials'),
+            replacement_costs: readProfileGroup('replacement'),
+            overhead_percent: parseFloat(PROFILE_FORM.overhead.value),
+            profit_margin: parseFloat(PROFILE_FORM.profit.value)
+        };
+
+        // Also update basic profile info
+        const businessName = PROFILE_FORM.businessName.value.trim();
+        const licenseId = PROFILE_FORM.licenseId.value.trim();
+        const zipCode = PROFILE_FORM.zipCode.value.trim();
+
+        // Saved together with the roofer profile in one request
+        profileData.basic = {
+            business_name: businessName,
+            license_id: licenseId,
+            primary_zip_code: zipCode
+        };
+
+        const result = await apiFetch('/api/profile/roofer', { method: 'POST', body: profileData });
+
+        if (result.success) {
+            quoteCache.clear();
+            sectionLoaded.profile = 0;
+            setProfileStatus(rooferProfileComplete(profileData));
+            showToast('Business profile saved successfully!', 'success');
+        } else {
+            showToast(result.error || 'Error saving profile', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Save roofer profile error:', error);
+    } finally {
+        setButtonLoading(submitBtn, false);
+    }
+}
+
+// Quote Functions
+async function generateAllQuotes(event) {
+    if (event) event.preventDefault();
+
+    const submitBtn = event ? event.target : null;
+    if (submitBtn) setButtonLoading(submitBtn, true);
+
+    try {
+        if (!profileIsComplete) {
+            promptProfileCompletion();
+            return;
+        }
+
+        showToast('Generating quotes, please wait...', 'info');
+
+        const result = await apiFetch('/api/quotes/generate', { method: 'POST', body: {} });
+
+        if (result.error === 'profile_incomplete') {
+            promptProfileCompletion();
+        } else if (result.success) {
+            showToast(`Generated ${result.count} quotes successfully!`, 'success');
+            // Update total quotes counter
+            document.getElementById('totalQuotes').textContent = result.count;
+
+            // Show the generated quotes in the properties table
+            generatedQuotes = null;
+            await loadGeneratedQuotes();
+        } else {
+            showToast(result.error || 'Error generating quotes', 'error');
+        }
+    } catch (error) {
+        showToast('Network error. Please try again.', 'error');
+        console.error('Generate quotes error:', error);
+    } finally {
+        if (submitBtn) setButtonLoading(submitBtn, false);
+    }
+}
+
+// Generated quotes from /api/quotes, shared by every view that lists or looks
+// them up. They only change when quotes are generated, which drops the copy;
+// otherwise a request made in the last 30 seconds (or still in flight) is reused
+const GENERATED_QUOTES_TTL = 30 * 1000;
+let generatedQuotes = null;
+
+function getGeneratedQuotes() {
+    if (!generatedQuotes || Date.now() - generatedQuotes.time >= GENERATED_QUOTES_TTL) {
+        const load = apiFetch('/api/quotes')
+            .then(result => {
+                if (!result.success) throw new Error(result.error || 'Error loading quotes');
+                // First quote per address, as a linear find() would return
+                const byAddress = new Map();
+                for (const quote of result.quotes) {
+                    if (!byAddress.has(quote.address)) byAddress.set(quote.address, quote);
+                }
+                return {quotes: result.quotes, byAddress};
+            });
+        load.catch(() => {
+            if (generatedQuotes && generatedQuotes.load === load) generatedQuotes = null;
+        });
+        generatedQuotes = {time: Date.now(), load};
+    }
+    return generatedQuotes.load;
+}
+
+async function loadGeneratedQuotes() {
+    try {
+        const {quotes} = await getGeneratedQuotes();
+        if (quotes.length > 0) {
+            displayQuotesInProperties(quotes);
+        }
+    } catch (error) {
+        console.error('Error loading quotes:', error);
+    }
+}
+
+// Address, material, area, pitch and crew cells shared by both generated-quote tables
+function generatedQuoteCells(quote) {
+    return [
+        propertyLink(quote.address || 'N/A'),
+        quote.roof_material || 'N/A',
+        fixed(quote.roof_area, 0),
+        fixed(quote.pitch, 1),
+        quote.crew_size_used || 'N/A'
+    ];
+}
+
+function displayQuotesInProperties(quotes) {
+    const container = document.getElementById('propertiesTable');
+
+    if (quotes.length === 0) {
+        container.innerHTML = '<div class="loading">No quotes generated yet.</div>';
+        return;
+    }
+
+    renderTable(
+        container,
+        ['Address', 'Material', 'Area (sqft)', 'Pitch (°)', 'Crew Size', 'Quote Range'],
+        quotes,
+        quote => [...generatedQuoteCells(quote), strong(quote.estimated_quote_range || 'N/A')],
+        quote => showQuoteDetails(quote.address)
+    );
+}
+
+async function showQuoteDetails(address) {
+    try {
+        const {byAddress} = await getGeneratedQuotes();
+        const quote = byAddress.get(address);
+        if (!quote) return;
+
+        const modalBody = document.getElementById('modalBody');
+
+        modalBody.innerHTML = `
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 24px;">
+                <div>
+                    <h4 style="margin-bottom: 16px; color: #1d1d1f;">Quote Details</h4>
+                    <p><strong>Address:</strong> <span data-field="address"></span></p>
+                    <p><strong>Material:</strong> <span data-field="material"></span></p>
+                    <p><strong>Area:</strong> ${fixed(quote.roof_area, 0, ' sqft')}</p>
+                    <p><strong>Pitch:</strong> ${fixed(quote.pitch, 1, '°')}</p>
+                    <p><strong>Crew Size:</strong> ${quote.crew_size_used || 'N/A'}</p>
+                    <p><strong>Region Multiplier:</strong> ${fixed(quote.region_multiplier, 2, 'x')}</p>
+                </div>
+                <div>
+                    <h4 style="margin-bottom: 16px; color: #1d1d1f;">Cost Breakdown</h4>
+                    <p><strong>Material Cost:</strong> $${quote.material_cost ? MONEY.format(quote.material_cost) : 'N/A'}</p>
+                    <p><strong>Labor Cost:</strong> $${quote.labor_cost ? MONEY.format(quote.labor_cost) : 'N/A'}</p>
+                    <p><strong>Repair Cost:</strong> $${quote.repair_cost ? MONEY.format(quote.repair_cost) : 'N/A'}</p>
+                    <p><strong>Subtotal:</strong> $${quote.subtotal ? MONEY.format(quote.subtotal) : 'N/A'}</p>
+                    <p><strong>Overhead:</strong> $${quote.overhead ? MONEY.format(quote.overhead) : 'N/A'}</p>
+                    <p><strong>Profit:</strong> $${quote.profit ? MONEY.format(quote.profit) : 'N/A'}</p>
+                    <p style="font-size: 18px; margin-top: 16px;"><strong>Total Quote Range:</strong><br>${quote.estimated_quote_range || 'N/A'}</p>
+                </div>
+            </div>
+        `;
+        // Text from the property data is assigned, never parsed as markup
+        modalBody.querySelector('[data-field="address"]').textContent = quote.address;
+        modalBody.querySelector('[data-field="material"]').textContent = quote.roof_material || 'N/A';
+
+        detailsModal.style.display = 'flex';
+    } catch (error) {
+        console.error('Error loading quote details:', error);
+    }
+}
+
+async function loadQuotes() {
+    try {
+        const {quotes} = await getGeneratedQuotes();
+        displayQuotes(quotes);
+    } catch (error) {
+        console.error('Error loading quotes:', error);
+        showToast('Error loading quotes', 'error');
+    }
+}
+
+function displayQuotes(quotes) {
+    const container = document.getElementById('quotesTable');
+
+    // Store quotes globally for PDF download
+    currentGeneratedQuotes = quotes || [];
+
+    if (!quotes || quotes.length === 0) {
+        container.innerHTML = '<div class="loading">No quotes generated yet. Click "Generate All Quotes" to create quotes.</div>';
+        document.getElementById('totalQuotesCount').textContent = '0';
+        document.getElementById('totalValueRange').textContent = '$0 - $0';
+        return;
+    }
+
+    // Calculate totals in one pass
+    let totalMin = 0;
+    let totalMax = 0;
+    for (const quote of quotes) {
+        totalMin += quote.min_quote;
+        totalMax += quote.max_quote;
+    }
+
+    document.getElementById('totalQuotesCount').textContent = quotes.length;
+    document.getElementById('totalValueRange').textContent = `$${WHOLE_NUMBER.format(totalMin)} - $${WHOLE_NUMBER.format(totalMax)}`;
+
+    renderTable(
+        container,
+        ['Address', 'Material', 'Area (sqft)', 'Pitch (°)', 'Crew Size', 'Quote Range', 'Actions'],
+        quotes.map((quote, index) => ({quote, index})),
+        ({quote, index}) => [
+            ...generatedQuoteCells(quote),
+            strong(quote.estimated_quote_range),
+            [actionButton('📄 PDF', 'btn-success', 'download-pdf-from-index', index)]
+        ],
+        ({quote}) => showQuoteDetails(quote.address)
+    );
+}
+
+// The generic details modal and the confirmation dialog, looked up once for
+// the click-outside and keyboard handlers below
+const detailsModal = document.getElementById('propertyModal');
+const confirmDialog = document.getElementById('confirmDialog');
+
+function closeModal() {
+    detailsModal.style.display = 'none';
+}
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    if (event.target === detailsModal) {
+        closeModal();
+    }
+
+    if (event.target === confirmDialog) {
+        closeConfirmDialog();
+    }
+}
+
+// Enter inside an auth form submits it
+const AUTH_FORM_SUBMIT = {
+    loginForm: () => login(),
+    registerForm: () => register(),
+    forgotPasswordForm: () => forgotPassword()
+};
+
+// Keyboard accessibility: only Escape and Enter do anything, every other key
+// returns after the comparisons
+document.addEventListener('keydown', function(event) {
+    if (event.key === 'Escape') {
+        // Close property modals
+        if (detailsModal.style.display === 'flex') {
+            closeModal();
+        }
+        if (!propertyModal.hidden) {
+            closePropertyModal();
+        }
+
+        // Close confirmation dialog
+        if (confirmDialog.classList.contains('active')) {
+            closeConfirmDialog();
+        }
+    } else if (event.key === 'Enter') {
+        const form = document.activeElement.closest('#loginForm, #registerForm, #forgotPasswordForm');
+        if (form && form.style.display !== 'none') {
+            event.preventDefault();
+            AUTH_FORM_SUBMIT[form.id]();
+        }
+    }
+});
+
+// Event delegation: elements name their handler with data-action (click),
+// data-input or data-change, plus an optional data-arg. Handlers are called
+// with the element and the event.
+const ACTIONS = {
+    'show-section': el => showSection(el.dataset.arg),
+    'show-login': () => showLogin(),
+    'show-register': () => showRegister(),
+    'show-forgot-password': () => showForgotPassword(),
+    'login': () => login(),
+    'register': () => register(),
+    'forgot-password': () => forgotPassword(),
+    'confirm-logout': () => confirmLogout(),
+    'profile-status': () => handleProfileStatusClick(),
+    'apply-filters': () => applyFilters(),
+    'clear-filters': () => clearFilters(),
+    'previous-page': () => previousPage(),
+    'next-page': () => nextPage(),
+    'previous-quotes-page': () => previousQuotesPage(),
+    'next-quotes-page': () => nextQuotesPage(),
+    'refresh-properties': () => refreshProperties(),
+    'refresh-saved-quotes': () => refreshSavedQuotes(),
+    'save-profile': () => saveRooferProfile(),
+    'save-settings': () => saveSettings(),
+    'close-modal': () => closeModal(),
+    'confirm-cancel': () => closeConfirmDialog(),
+    'confirm-ok': () => executeConfirmedAction(),
+    'extend-session': () => extendSession(),
+    'dismiss-session-warning': () => dismissSessionWarning(),
+    'view-saved-quote': el => viewSavedQuoteDetails(el.dataset.arg),
+    'download-pdf': el => downloadPDF(el.dataset.arg),
+    'delete-saved-quote': el => deleteSavedQuote(el.dataset.arg),
+    'dismiss-property-modal': (el, event) => closePropertyModal(event),
+    'close-property-modal': () => closePropertyModal(),
+    'download-pdf-from-modal': () => downloadPDFFromModal(),
+    'save-current-quote': () => saveCurrentQuote(),
+    'download-pdf-from-index': el => downloadPDFFromIndex(Number(el.dataset.arg)),
+    'password-strength': el => checkPasswordStrengthDebounced(el.value),
+    'hq-effects': el => setHighQualityEffects(el.checked)
+};
+
+function dispatchAction(event, attribute) {
+    // closest() stops at the innermost action, so a button inside a clickable
+    // row or overlay runs only its own handler
+    const el = event.target.closest(`[${attribute}]`);
+    if (!el) return;
+    const action = ACTIONS[el.getAttribute(attribute)];
+    if (action) action(el, event);
+}
+
+document.addEventListener('click', event => dispatchAction(event, 'data-action'));
+document.addEventListener('input', event => dispatchAction(event, 'data-input'));
+document.addEventListener('change', event => dispatchAction(event, 'data-change'));
@@ -3,29 +3,108 @@ Tileit - Professional Roofing Quote Generator
 Modular, scalable application with advanced features
 """
 
-from flask import Flask, request, jsonify, render_template_string, session, redirect, url_for, send_file
+from flask import Flask, request, jsonify, session, redirect, url_for, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import os
-import json
 import hashlib
 import secrets
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Optional
-import math
 from datetime import datetime, timedelta
 import sqlite3
+import logging
+import tempfile
+import threading
+from collections import defaultdict, OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import orjson
 
 from models.roofer_profile import RooferProfile, SlopeCostAdjustment, MaterialCosts, ReplacementCosts, CrewScalingRule, QuoteResult
 from quote_engine import calculate_quote, process_csv_quotes
 from utils import parse_nearmap_csv, save_quotes_to_json
 from pdf_generator import EstimatePDFGenerator, generate_pdf_for_quote
+from assets import build_dashboard, send_asset, IMMUTABLE_CACHE_CONTROL
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that parses request bodies and serializes responses with orjson"""
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return orjson.dumps(obj, option=self.option).decode('utf-8')
+        except TypeError:
+            # Types orjson can't encode (e.g. Decimal) go through the stdlib encoder
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals and non-UTF-8 bodies are only accepted by the stdlib parser
+            return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, option=self.option)
+        except TypeError:
+            body = super().dumps(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 app.secret_key = 'tileit-roofing-quote-generator-secret-key-2024'
 
+# Request-level debug output, enabled with TILEIT_DEBUG=1
+logger = logging.getLogger('tileit')
+if os.environ.get('TILEIT_DEBUG'):
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.StreamHandler())
+
+# JSON file storage for quotes, settings and profiles
+JSON_FILE_OPTION = orjson.OPT_INDENT_2 if os.environ.get('TILEIT_DEBUG') else 0
+JSON_FILE_BUFFER_SIZE = 64 * 1024
+
+def read_json_file(path: str):
+    """Read and parse a JSON file"""
+    with open(path, 'rb', buffering=JSON_FILE_BUFFER_SIZE) as f:
+        return orjson.loads(f.read())
+
+def write_json_file(path: str, data) -> None:
+    """
+    Serialize data as compact JSON (indented when TILEIT_DEBUG is set)
+    The payload is written to a temp file in the same directory and swapped
+    in with os.replace, so readers never see a truncated file
+    """
+    payload = orjson.dumps(data, option=JSON_FILE_OPTION)
+    tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path) or '.', suffix='.tmp',
+                                      buffering=JSON_FILE_BUFFER_SIZE, delete=False)
+    try:
+        with tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+# List responses the dashboard refetches while paging or switching sections:
+# tagged with a hash of the body and revalidated on every use, so an unchanged
+# list comes back as an empty 304
+def conditional_json(payload):
+    response = jsonify(payload)
+    response.add_etag()
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+# Per-user locks so concurrent requests from one user don't interleave file rewrites
+USER_FILE_LOCKS = defaultdict(threading.Lock)
+
 # Load existing CSV data
 CSV_DATA = None
 def load_csv_data():
@@ -259,6 +338,26 @@ class TileitAuth:
         finally:
             conn.close()
     
+    def touch_session(self, token: str) -> bool:
+        """Push a live session's expiry out by another 24 hours"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        try:
+            now = datetime.now()
+            cursor.execute('''
+                UPDATE sessions SET expires_at = ?
+                WHERE token = ? AND expires_at > ?
+                  AND user_id IN (SELECT id FROM users WHERE is_active = 1)
+            ''', ((now + timedelta(hours=24)).isoformat(), token, now.isoformat()))
+            conn.commit()
+            return cursor.rowcount > 0
+        except Exception as e:
+            print(f"Error extending session: {e}")
+            return False
+        finally:
+            conn.close()
+    
     def logout(self, token: str):
         """Logout user and remove session"""
         conn = sqlite3.connect(self.db_path)
@@ -343,6 +442,14 @@ def require_auth(f):
     decorated_function.__name__ = f.__name__
     return decorated_function
 
+# Serialize a user's read-modify-write cycles on their quote/settings files
+def with_user_file_lock(f):
+    def decorated_function(user, *args, **kwargs):
+        with USER_FILE_LOCKS[user['id']]:
+            return f(user, *args, **kwargs)
+    decorated_function.__name__ = f.__name__
+    return decorated_function
+
 # Enhanced Property Processing
 def calculate_roof_area_from_csv(prop: Dict) -> float:
     """
@@ -432,11 +539,65 @@ def process_properties_with_deduplication():
     
     return processed_properties
 
+def build_property_columns(properties: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Build column arrays (one per filterable field) from processed properties
+    so filters run as vectorized boolean masks instead of per-row Python
+    """
+    count = len(properties)
+    return {
+        'roof_area': np.fromiter((p.get('roof_area', 0) for p in properties), dtype=np.float64, count=count),
+        'pitch': np.fromiter((p.get('avg_pitch', p.get('pitch', 0)) for p in properties), dtype=np.float64, count=count),
+        'condition': np.fromiter((p.get('avg_condition', p.get('roof condition summary score', 0)) for p in properties), dtype=np.float64, count=count),
+        'material': np.array([p.get('roof_material', '').lower() for p in properties], dtype=np.str_),
+        'address': np.array([p.get('address', '').lower() for p in properties], dtype=np.str_),
+    }
+
+def build_property_lookup(properties: List[Dict]) -> Dict[str, Dict]:
+    """
+    Map each property's normalized address (spaces removed, lowercased) to
+    the first property with that address, as matched by get_property_details
+    """
+    lookup = {}
+    for p in properties:
+        lookup.setdefault(p.get('address', '').replace(' ', '').lower(), p)
+    return lookup
+
+# Deduplicated properties, their column arrays and address lookup, built once per process
+PROCESSED_PROPERTIES = None
+PROPERTY_COLUMNS = None
+PROPERTY_LOOKUP = None
+def load_processed_properties():
+    global PROCESSED_PROPERTIES, PROPERTY_COLUMNS, PROPERTY_LOOKUP
+    if PROCESSED_PROPERTIES is None:
+        processed = process_properties_with_deduplication()
+        PROPERTY_COLUMNS = build_property_columns(processed)
+        PROPERTY_LOOKUP = build_property_lookup(processed)
+        PROCESSED_PROPERTIES = processed
+    return PROCESSED_PROPERTIES, PROPERTY_COLUMNS
+
 # Routes
+# Dashboard page and its fingerprinted assets, built once at import
+DASHBOARD_PAGE, DASHBOARD_ASSETS = build_dashboard()
+# All handlers are wired from tileit.js, so no inline script is allowed; styles
+# still need 'unsafe-inline' for the inlined critical CSS and style attributes
+DASHBOARD_PAGE.headers['Content-Security-Policy'] = (
+    "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data:; object-src 'none'; base-uri 'self'; frame-ancestors 'none'"
+)
+
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template_string(TILEIT_DASHBOARD_TEMPLATE)
+    return send_asset(DASHBOARD_PAGE, 'no-cache')
+
+@app.route('/assets/<name>')
+def dashboard_asset(name):
+    """Fingerprinted dashboard assets (minified, Brotli/gzip-precompressed)"""
+    asset = DASHBOARD_ASSETS.get(name)
+    if asset is None:
+        return jsonify({'error': 'Not found'}), 404
+    return send_asset(asset, IMMUTABLE_CACHE_CONTROL)
 
 @app.route('/api/auth/register', methods=['POST'])
 def register():
@@ -565,6 +726,14 @@ def logout_route():
     except Exception as e:
         return jsonify({'success': True, 'message': 'Logged out successfully'})
 
+@app.route('/api/auth/ping', methods=['POST'])
+def ping_session():
+    """Keep a session alive; answers 204 with no body"""
+    token = request.headers.get('Authorization', '').replace('Bearer ', '')
+    if not token or not auth.touch_session(token):
+        return jsonify({'error': 'Authentication required'}), 401
+    return '', 204
+
 @app.route('/api/profile', methods=['GET'])
 @require_auth
 def get_profile(user):
@@ -574,6 +743,20 @@ def get_profile(user):
         'user': user
     })
 
+def update_user_details(cursor, user: Dict, data: Dict) -> Dict:
+    """
+    Update the user's business name, license and ZIP code from data
+    Missing keys keep their current value; the caller commits. Returns the updated user
+    """
+    updated = dict(user)
+    for key in ('business_name', 'license_id', 'primary_zip_code'):
+        updated[key] = data.get(key, user[key])
+    cursor.execute('''
+        UPDATE users SET business_name = ?, license_id = ?, primary_zip_code = ?
+        WHERE id = ?
+    ''', (updated['business_name'], updated['license_id'], updated['primary_zip_code'], user['id']))
+    return updated
+
 @app.route('/api/profile', methods=['PUT'])
 @require_auth
 def update_profile(user):
@@ -583,16 +766,7 @@ def update_profile(user):
         
         # Update user profile in database
         conn = sqlite3.connect(auth.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE users SET business_name = ?, license_id = ?, primary_zip_code = ?
-            WHERE id = ?
-        ''', (data.get('business_name', user['business_name']),
-              data.get('license_id', user['license_id']),
-              data.get('primary_zip_code', user['primary_zip_code']),
-              user['id']))
-        
+        update_user_details(conn.cursor(), user, data)
         conn.commit()
         conn.close()
         
@@ -604,43 +778,55 @@ def update_profile(user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Profile returned to roofers who haven't saved one yet
+DEFAULT_ROOFER_PROFILE = {
+    'labor_rate': 45,
+    'daily_productivity': 2500,
+    'base_crew_size': 3,
+    'crew_scaling_rule': 'size_and_complexity',
+    'slope_cost_adjustment': {'flat_low': 0.0, 'moderate': 0.1, 'steep': 0.2, 'very_steep': 0.3},
+    'material_costs': {'asphalt': 4.0, 'shingle': 4.5, 'metal': 7.0, 'tile': 8.0, 'concrete': 6.0},
+    'replacement_costs': {'asphalt': 45, 'shingle': 50, 'metal': 90, 'tile': 70, 'concrete': 60},
+    'overhead_percent': 0.1,
+    'profit_margin': 0.2
+}
+
+# Profile fields that must be set (non-zero) before quotes can be generated
+REQUIRED_PROFILE_FIELDS = ('labor_rate', 'daily_productivity', 'base_crew_size', 'overhead_percent', 'profit_margin')
+
+def roofer_profile_payload(user: Dict) -> Dict:
+    """The user's saved roofer profile, or the defaults with profile_exists = False"""
+    profile_file = f"profiles/{user['id']}_roofer_profile.json"
+    if os.path.exists(profile_file):
+        return {'success': True, 'profile': read_json_file(profile_file), 'profile_exists': True}
+    return {'success': True, 'profile': DEFAULT_ROOFER_PROFILE, 'profile_exists': False}
+
 @app.route('/api/profile/roofer', methods=['GET'])
 @require_auth
 def get_roofer_profile(user):
     """Get roofer business profile"""
     try:
-        profile_file = f"profiles/{user['id']}_roofer_profile.json"
-        if os.path.exists(profile_file):
-            with open(profile_file, 'r') as f:
-                profile = json.load(f)
-                return jsonify({'success': True, 'profile': profile, 'profile_exists': True})
-        else:
-            # Return default profile with profile_exists = False
-            return jsonify({
-                'success': True,
-                'profile_exists': False,
-                'profile': {
-                    'labor_rate': 45,
-                    'daily_productivity': 2500,
-                    'base_crew_size': 3,
-                    'crew_scaling_rule': 'size_and_complexity',
-                    'slope_cost_adjustment': {'flat_low': 0.0, 'moderate': 0.1, 'steep': 0.2, 'very_steep': 0.3},
-                    'material_costs': {'asphalt': 4.0, 'shingle': 4.5, 'metal': 7.0, 'tile': 8.0, 'concrete': 6.0},
-                    'replacement_costs': {'asphalt': 45, 'shingle': 50, 'metal': 90, 'tile': 70, 'concrete': 60},
-                    'overhead_percent': 0.1,
-                    'profit_margin': 0.2
-                }
-            })
+        return jsonify(roofer_profile_payload(user))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/profile/roofer', methods=['POST'])
 @require_auth
+@with_user_file_lock
 def save_roofer_profile(user):
-    """Save roofer business profile"""
+    """
+    Save roofer business profile
+    An optional 'basic' object updates the user's business name, license and
+    ZIP code as well; that update is only committed once the profile is written
+    """
+    conn = None
     try:
         data = request.get_json()
         
+        if 'basic' in data:
+            conn = sqlite3.connect(auth.db_path)
+            user = update_user_details(conn.cursor(), user, data['basic'])
+        
         # Create profile data
         profile = {
             'business_name': user['business_name'],
@@ -661,8 +847,9 @@ def save_roofer_profile(user):
         # Save to file
         os.makedirs('profiles', exist_ok=True)
         profile_file = f"profiles/{user['id']}_roofer_profile.json"
-        with open(profile_file, 'w') as f:
-            json.dump(profile, f, indent=2)
+        write_json_file(profile_file, profile)
+        if conn:
+            conn.commit()
         
         return jsonify({
             'success': True,
@@ -671,26 +858,31 @@ def save_roofer_profile(user):
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    finally:
+        if conn:
+            conn.close()
 
 @app.route('/api/quotes/generate', methods=['POST'])
 @require_auth
 def generate_quotes(user):
     """Generate quotes for selected properties"""
     try:
-        print(f"\n=== GENERATING QUOTES FOR USER: {user['id']} ===")
+        logger.debug("Generating quotes for user %s", user['id'])
         
         # Load roofer profile
         profile_file = f"profiles/{user['id']}_roofer_profile.json"
-        if not os.path.exists(profile_file):
-            print(f"ERROR: Profile file not found at {profile_file}")
-            return jsonify({'error': 'Please complete the business profile to generate quotes'}), 400
-        
-        with open(profile_file, 'r') as f:
-            profile_data = json.load(f)
+        profile_data = read_json_file(profile_file) if os.path.exists(profile_file) else {}
+        if not all(profile_data.get(key) for key in REQUIRED_PROFILE_FIELDS):
+            logger.debug("Profile missing or incomplete at %s", profile_file)
+            return jsonify({
+                'success': False,
+                'error': 'profile_incomplete',
+                'message': 'Please complete the business profile to generate quotes'
+            }), 409
         
-        print(f"Loaded profile: {profile_data.get('business_name')}")
-        print(f"Labor rate: ${profile_data.get('labor_rate')}/hr")
-        print(f"Crew size: {profile_data.get('base_crew_size')}")
+        logger.debug("Loaded profile: %s (labor rate $%s/hr, crew size %s)",
+                     profile_data.get('business_name'), profile_data.get('labor_rate'),
+                     profile_data.get('base_crew_size'))
         
         # Create RooferProfile object
         roofer_profile = RooferProfile.from_dict(profile_data)
@@ -699,30 +891,22 @@ def generate_quotes(user):
         data = request.get_json() or {}
         addresses = data.get('addresses', [])
         
-        # Process all CSV data and group by address
-        processed_data = process_properties_with_deduplication()
-        print(f"\nProcessed {len(processed_data)} unique properties")
+        # Reuse the cached deduplicated properties instead of rebuilding them
+        processed_data, _ = load_processed_properties()
         
         quotes = []
         errors = []
         
         # Process properties
-        properties_to_process = processed_data if not addresses else [p for p in processed_data if p.get('address') in addresses]
-        print(f"Processing {len(properties_to_process)} properties...")
+        address_set = set(addresses)
+        properties_to_process = processed_data if not addresses else [p for p in processed_data if p.get('address') in address_set]
+        logger.debug("Processing %d of %d unique properties", len(properties_to_process), len(processed_data))
         
-        for i, prop in enumerate(properties_to_process):
+        for prop in properties_to_process:
             try:
-                address = prop.get('address', 'Unknown')
-                print(f"\n[{i+1}/{len(properties_to_process)}] Processing: {address}")
-                print(f"  - Area: {prop.get('roof_area', 'N/A')} sqft")
-                print(f"  - Material: {prop.get('roof_material', 'N/A')}")
-                print(f"  - Pitch: {prop.get('pitch', 'N/A')}°")
-                
                 quote = calculate_quote(prop, roofer_profile)
                 quotes.append(quote.to_dict())
                 
-                print(f"  [OK] Quote: {quote.estimated_quote_range}")
-                
             except Exception as e:
                 error_msg = f"Error for {prop.get('address')}: {str(e)}"
                 print(f"  [ERROR] {error_msg}")
@@ -731,9 +915,7 @@ def generate_quotes(user):
                 traceback.print_exc()
                 continue
         
-        print(f"\n=== SUMMARY ===")
-        print(f"Successfully generated: {len(quotes)} quotes")
-        print(f"Errors: {len(errors)}")
+        logger.debug("Generated %d quotes, %d errors", len(quotes), len(errors))
         
         if errors:
             print("\nErrors encountered:")
@@ -743,10 +925,9 @@ def generate_quotes(user):
         # Save generated quotes to a separate file to avoid clobbering saved quotes
         os.makedirs('quotes', exist_ok=True)
         generated_file = f"quotes/{user['id']}_generated.json"
-        with open(generated_file, 'w') as f:
-            json.dump(quotes, f, indent=2)
+        write_json_file(generated_file, quotes)
         
-        print(f"Saved generated quotes to: {generated_file}\n")
+        logger.debug("Saved generated quotes to: %s", generated_file)
         
         return jsonify({
             'success': True,
@@ -761,31 +942,51 @@ def generate_quotes(user):
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def load_generated_quotes(user: Dict) -> List:
+    """The user's last generated quotes (transient), not the saved list"""
+    generated_file = f"quotes/{user['id']}_generated.json"
+    if os.path.exists(generated_file):
+        return read_json_file(generated_file)
+    return []
+
 @app.route('/api/quotes', methods=['GET'])
 @require_auth
 def get_quotes(user):
     """Get saved quotes"""
     try:
-        # Return last generated quotes (transient), not saved list
-        generated_file = f"quotes/{user['id']}_generated.json"
-        if os.path.exists(generated_file):
-            with open(generated_file, 'r') as f:
-                quotes = json.load(f)
-            return jsonify({'success': True, 'quotes': quotes})
-        else:
-            return jsonify({'success': True, 'quotes': []})
+        return jsonify({'success': True, 'quotes': load_generated_quotes(user)})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@lru_cache(maxsize=1024)
+def count_saved_quotes_file(quotes_file: str, mtime_ns: int, inode: int) -> int:
+    """
+    Number of quotes in a saved-quotes file, memoized on its mtime and inode
+    like load_settings_file
+    """
+    quotes = read_json_file(quotes_file)
+    return sum(isinstance(q, dict) for q in quotes) if isinstance(quotes, list) else 0
+
+def count_saved_quotes(user: Dict) -> int:
+    """How many quotes the user has saved, without building the full list"""
+    quotes_file = f"quotes/{user['id']}_saved.json"
+    try:
+        stat = os.stat(quotes_file)
+    except FileNotFoundError:
+        return 0
+    return count_saved_quotes_file(quotes_file, stat.st_mtime_ns, stat.st_ino)
+
 @app.route('/api/quotes/saved', methods=['GET'])
 @require_auth
+@with_user_file_lock
 def get_saved_quotes(user):
-    """Get all saved quotes for user"""
+    """Get one page (?page=&per_page=) of the user's saved quotes, newest first"""
     try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', 20))
         quotes_file = f"quotes/{user['id']}_saved.json"
         if os.path.exists(quotes_file):
-            with open(quotes_file, 'r') as f:
-                quotes = json.load(f)
+            quotes = read_json_file(quotes_file)
 
             # Normalize legacy entries to avoid "N/A" rows; prefer fixing over dropping
             import uuid, datetime
@@ -820,24 +1021,29 @@ def get_saved_quotes(user):
                 pass
 
             if changed:
-                with open(quotes_file, 'w') as f:
-                    json.dump(normalized, f, indent=2)
-
-            return jsonify({'success': True, 'quotes': normalized})
+                write_json_file(quotes_file, normalized)
         else:
-            return jsonify({'success': True, 'quotes': []})
+            normalized = []
+
+        # A delete can empty the last page; fall back to the new last page
+        page = max(1, min(page, -(-len(normalized) // per_page)))
+        start_idx = (page - 1) * per_page
+        return conditional_json({
+            'success': True,
+            'quotes': normalized[start_idx:start_idx + per_page],
+            'pagination': {**pagination_info(page, per_page, len(normalized)), 'total_quotes': len(normalized)}
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/quotes/save', methods=['POST'])
 @require_auth
+@with_user_file_lock
 def save_quote(user):
     """Save a new quote"""
     try:
         data = request.json
-        print(f"📥 Backend received data: {data}")
-        print(f"📥 Data type: {type(data)}")
-        print(f"📥 Data keys: {data.keys() if data else 'None'}")
+        logger.debug("Save quote request: %s", data)
         
         # Validate required fields and non-empty values
         required_fields = ['property_address', 'material', 'area', 'min_quote', 'max_quote']
@@ -849,8 +1055,7 @@ def save_quote(user):
         
         # Load existing quotes
         if os.path.exists(quotes_file):
-            with open(quotes_file, 'r') as f:
-                quotes = json.load(f)
+            quotes = read_json_file(quotes_file)
             # Normalize legacy entries to avoid KeyError on missing fields
             changed = False
             for q in quotes:
@@ -865,8 +1070,7 @@ def save_quote(user):
                             q[key] = None
                             changed = True
             if changed:
-                with open(quotes_file, 'w') as f:
-                    json.dump(quotes, f, indent=2)
+                write_json_file(quotes_file, quotes)
         else:
             quotes = []
         
@@ -903,8 +1107,7 @@ def save_quote(user):
         os.makedirs('quotes', exist_ok=True)
         
         # Save quotes
-        with open(quotes_file, 'w') as f:
-            json.dump(quotes, f, indent=2)
+        write_json_file(quotes_file, quotes)
         
         return jsonify({'success': True, 'message': 'Quote saved successfully', 'quote': new_quote})
     
@@ -914,6 +1117,7 @@ def save_quote(user):
 
 @app.route('/api/quotes/<quote_id>', methods=['DELETE'])
 @require_auth
+@with_user_file_lock
 def delete_quote(user, quote_id):
     """Delete a saved quote"""
     try:
@@ -923,8 +1127,7 @@ def delete_quote(user, quote_id):
         if not os.path.exists(quotes_file):
             return jsonify({'success': False, 'message': 'No quotes found'}), 404
         
-        with open(quotes_file, 'r') as f:
-            quotes = json.load(f)
+        quotes = read_json_file(quotes_file)
         
         # Filter out the quote to delete
         original_length = len(quotes)
@@ -934,8 +1137,7 @@ def delete_quote(user, quote_id):
             return jsonify({'success': False, 'message': 'Quote not found'}), 404
         
         # Save updated quotes
-        with open(quotes_file, 'w') as f:
-            json.dump(quotes, f, indent=2)
+        write_json_file(quotes_file, quotes)
         
         return jsonify({'success': True, 'message': 'Quote deleted successfully'})
     
@@ -943,6 +1145,38 @@ def delete_quote(user, quote_id):
         print(f"Error deleting quote: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/quotes/bulk_delete', methods=['POST'])
+@require_auth
+@with_user_file_lock
+def bulk_delete_quotes(user):
+    """Delete several saved quotes with a single rewrite of the quotes file"""
+    # Clients clearing multiple quotes should batch them into one call here
+    # instead of issuing a DELETE per quote, which rewrites the file each time
+    try:
+        data = request.get_json(silent=True) or {}
+        ids = data.get('ids')
+        if not isinstance(ids, list) or not ids:
+            return jsonify({'success': False, 'message': 'ids must be a non-empty list of quote IDs'}), 400
+        
+        ids_to_delete = {quote_id for quote_id in ids if isinstance(quote_id, str)}
+        quotes_file = f"quotes/{user['id']}_saved.json"
+        
+        if not os.path.exists(quotes_file):
+            return jsonify({'success': False, 'message': 'No quotes found'}), 404
+        
+        quotes = read_json_file(quotes_file)
+        remaining = [q for q in quotes if q.get('id') not in ids_to_delete]
+        deleted = len(quotes) - len(remaining)
+        
+        if deleted:
+            write_json_file(quotes_file, remaining)
+        
+        return jsonify({'success': True, 'message': f'Deleted {deleted} quotes', 'deleted': deleted})
+    
+    except Exception as e:
+        print(f"Error deleting quotes: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/quotes/<quote_id>/pdf', methods=['GET'])
 @require_auth
 def generate_quote_pdf(user, quote_id):
@@ -958,8 +1192,7 @@ def generate_quote_pdf(user, quote_id):
         if not os.path.exists(profile_file):
             return jsonify({'error': 'Roofer profile not found'}), 404
         
-        with open(profile_file, 'r') as f:
-            profile_data = json.load(f)
+        profile_data = read_json_file(profile_file)
         
         roofer = RooferProfile.from_dict(profile_data)
         
@@ -968,8 +1201,7 @@ def generate_quote_pdf(user, quote_id):
         quote_dict = None
         
         if os.path.exists(quotes_file):
-            with open(quotes_file, 'r') as f:
-                saved_quotes = json.load(f)
+            saved_quotes = read_json_file(quotes_file)
             
             # Find quote by ID
             for q in saved_quotes:
@@ -981,8 +1213,7 @@ def generate_quote_pdf(user, quote_id):
         if not quote_dict:
             generated_file = f"quotes/{user['id']}_generated.json"
             if os.path.exists(generated_file):
-                with open(generated_file, 'r') as f:
-                    generated_quotes = json.load(f)
+                generated_quotes = read_json_file(generated_file)
                 
                 # Try to find by index or search
                 try:
@@ -1055,8 +1286,7 @@ def generate_pdf_from_data(user):
         if not os.path.exists(profile_file):
             return jsonify({'error': 'Roofer profile not found'}), 404
         
-        with open(profile_file, 'r') as f:
-            profile_data = json.load(f)
+        profile_data = read_json_file(profile_file)
         
         roofer = RooferProfile.from_dict(profile_data)
         
@@ -1105,23 +1335,33 @@ def generate_pdf_from_data(user):
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+DEFAULT_SETTINGS = {
+    'notifications': True,
+    'email_alerts': True,
+    'quote_auto_save': True,
+    'default_filters': {},
+    'theme': 'light'
+}
+
+@lru_cache(maxsize=1024)
+def load_settings_file(settings_file: str, mtime_ns: int, inode: int) -> Dict:
+    """
+    Parse a settings file, memoized on its mtime and inode so a rewrite
+    (which always swaps in a new file) misses the cache
+    """
+    return read_json_file(settings_file)
+
 @app.route('/api/settings', methods=['GET'])
 @require_auth
 def get_settings(user):
     """Get user settings"""
     try:
         settings_file = f"settings/{user['id']}_settings.json"
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-        else:
-            settings = {
-                'notifications': True,
-                'email_alerts': True,
-                'quote_auto_save': True,
-                'default_filters': {},
-                'theme': 'light'
-            }
+        try:
+            stat = os.stat(settings_file)
+            settings = load_settings_file(settings_file, stat.st_mtime_ns, stat.st_ino)
+        except FileNotFoundError:
+            settings = DEFAULT_SETTINGS
         
         return jsonify({
             'success': True,
@@ -1133,6 +1373,7 @@ def get_settings(user):
 
 @app.route('/api/settings', methods=['PUT'])
 @require_auth
+@with_user_file_lock
 def update_settings(user):
     """Update user settings"""
     try:
@@ -1141,8 +1382,7 @@ def update_settings(user):
         os.makedirs('settings', exist_ok=True)
         settings_file = f"settings/{user['id']}_settings.json"
         
-        with open(settings_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(settings_file, data)
         
         return jsonify({
             'success': True,
@@ -1152,114 +1392,165 @@ def update_settings(user):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Numeric range filters accepted by /api/properties
+PROPERTY_RANGE_FILTERS = ('min_area', 'max_area', 'min_pitch', 'max_pitch', 'condition_min', 'condition_max')
+
+def parse_float_arg(value: Optional[str]) -> Optional[float]:
+    """Convert a query string value to float, treating missing/invalid values as None"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def parse_property_filters(args) -> Dict:
+    """Parse the /api/properties filter parameters in a single pass"""
+    filters = {key: parse_float_arg(args.get(key)) for key in PROPERTY_RANGE_FILTERS}
+    filters['material'] = args.get('material', '').lower()
+    filters['search'] = args.get('search', '').lower()
+    return filters
+
+def filter_property_indices(filters: Dict, columns: Dict[str, np.ndarray], count: int) -> np.ndarray:
+    """Return the indices of the processed properties matching the filters"""
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    # Apply filters as boolean masks over the column arrays, most selective
+    # first (material, then numeric ranges); the address search runs last
+    # and only scans the rows that survived the other filters
+    mask = np.ones(count, dtype=bool)
+    
+    # material accepts a comma-separated list, e.g. material=tile,metal
+    materials = {m.strip() for m in filters['material'].split(',')} - {''}
+    if materials:
+        if len(materials) == 1:
+            mask &= columns['material'] == next(iter(materials))
+        else:
+            mask &= np.isin(columns['material'], list(materials))
+        if debug:
+            logger.debug("After material filter: %d", np.count_nonzero(mask))
+    
+    if filters['min_area'] is not None:
+        mask &= columns['roof_area'] >= filters['min_area']
+        if debug:
+            logger.debug("After min_area filter: %d", np.count_nonzero(mask))
+    
+    if filters['max_area'] is not None:
+        mask &= columns['roof_area'] <= filters['max_area']
+        if debug:
+            logger.debug("After max_area filter: %d", np.count_nonzero(mask))
+    
+    if filters['min_pitch'] is not None:
+        mask &= columns['pitch'] >= filters['min_pitch']
+        if debug:
+            logger.debug("After min_pitch filter: %d", np.count_nonzero(mask))
+    
+    if filters['max_pitch'] is not None:
+        mask &= columns['pitch'] <= filters['max_pitch']
+        if debug:
+            logger.debug("After max_pitch filter: %d", np.count_nonzero(mask))
+    
+    if filters['condition_min'] is not None:
+        mask &= columns['condition'] >= filters['condition_min']
+        if debug:
+            logger.debug("After condition_min filter: %d", np.count_nonzero(mask))
+    
+    if filters['condition_max'] is not None:
+        mask &= columns['condition'] <= filters['condition_max']
+        if debug:
+            logger.debug("After condition_max filter: %d", np.count_nonzero(mask))
+    
+    search_address = filters['search']
+    if search_address:
+        candidates = np.flatnonzero(mask)
+        if candidates.size == mask.size:
+            mask = np.char.find(columns['address'], search_address) >= 0
+        else:
+            mask[candidates] = np.char.find(columns['address'][candidates], search_address) >= 0
+        if debug:
+            logger.debug("After search filter: %d", np.count_nonzero(mask))
+    
+    return np.flatnonzero(mask)
+
+# Matching indices for recently seen filter sets, so paging through the same
+# filters reuses the previous scan instead of re-filtering every row
+FILTER_CACHE_SIZE = 128
+FILTER_CACHE = OrderedDict()
+FILTER_CACHE_LOCK = threading.Lock()
+
+def get_matching_indices(filters: Dict, columns: Dict[str, np.ndarray], count: int) -> np.ndarray:
+    """Cached wrapper around filter_property_indices keyed by the filter values"""
+    key = tuple(sorted(filters.items()))
+    with FILTER_CACHE_LOCK:
+        indices = FILTER_CACHE.get(key)
+        if indices is not None:
+            FILTER_CACHE.move_to_end(key)
+            return indices
+    
+    indices = filter_property_indices(filters, columns, count)
+    indices.flags.writeable = False
+    with FILTER_CACHE_LOCK:
+        FILTER_CACHE[key] = indices
+        if len(FILTER_CACHE) > FILTER_CACHE_SIZE:
+            FILTER_CACHE.popitem(last=False)
+    return indices
+
+def pagination_info(page: int, per_page: int, total: int) -> Dict:
+    """Pagination block shared by the paged list endpoints; callers add the total count"""
+    total_pages = -(-total // per_page)
+    return {
+        'page': page,
+        'per_page': per_page,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_prev': page > 1
+    }
+
+def properties_page(args) -> Dict:
+    """One page of filtered properties for the /api/properties query arguments"""
+    # Get query parameters, parsed once up front
+    page = int(args.get('page', 1))
+    per_page = int(args.get('per_page', 20))
+    filters = parse_property_filters(args)
+    
+    logger.debug("Properties filter request: page=%d per_page=%d filters=%s", page, per_page, filters)
+    
+    # Get processed properties (with deduplication) and their filter columns
+    processed_data, columns = load_processed_properties()
+    
+    # Row indices matching the filters (reused across page flips)
+    matching_indices = get_matching_indices(filters, columns, len(processed_data))
+    
+    # Calculate pagination
+    total_properties = int(matching_indices.size)
+    start_idx = (page - 1) * per_page
+    end_idx = start_idx + per_page
+    
+    # Get page data; only the rows on this page are materialized
+    page_data = [processed_data[i] for i in matching_indices[start_idx:end_idx].tolist()]
+    
+    # Optional column projection (?fields=address,roof_area,...)
+    fields = [name for name in args.get('fields', '').split(',') if name]
+    if fields:
+        page_data = [{name: row[name] for name in fields if name in row} for row in page_data]
+    
+    pagination = {**pagination_info(page, per_page, total_properties), 'total_properties': total_properties}
+    logger.debug("Final results: %d properties, returning page %d/%d (%d items)",
+                 total_properties, page, pagination['total_pages'], len(page_data))
+    
+    return {
+        'success': True,
+        'properties': page_data,
+        'pagination': pagination,
+        'filters_applied': filters
+    }
+
 @app.route('/api/properties', methods=['GET'])
 @require_auth
 def get_properties(user):
     """Get properties with enhanced filtering and pagination"""
     try:
-        # Get query parameters
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-        
-        # Filter parameters
-        min_area = request.args.get('min_area', type=float)
-        max_area = request.args.get('max_area', type=float)
-        material = request.args.get('material', '').lower()
-        min_pitch = request.args.get('min_pitch', type=float)
-        max_pitch = request.args.get('max_pitch', type=float)
-        condition_min = request.args.get('condition_min', type=float)
-        condition_max = request.args.get('condition_max', type=float)
-        search_address = request.args.get('search', '').lower()
-        
-        print(f"\n=== PROPERTIES FILTER REQUEST ===")
-        print(f"Page: {page}, Per page: {per_page}")
-        print(f"Filters: min_area={min_area}, max_area={max_area}, material={material}")
-        print(f"         min_pitch={min_pitch}, max_pitch={max_pitch}")
-        print(f"         condition_min={condition_min}, condition_max={condition_max}")
-        print(f"         search={search_address}")
-        
-        # Get processed properties (with deduplication)
-        processed_data = process_properties_with_deduplication()
-        print(f"Total properties before filtering: {len(processed_data)}")
-        
-        # Apply filters
-        filtered_data = processed_data.copy()
-        
-        if min_area is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('roof_area', 0) >= min_area]
-            print(f"After min_area filter: {before} -> {len(filtered_data)}")
-        
-        if max_area is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('roof_area', 0) <= max_area]
-            print(f"After max_area filter: {before} -> {len(filtered_data)}")
-        
-        if material:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('roof_material', '').lower() == material]
-            print(f"After material filter ({material}): {before} -> {len(filtered_data)}")
-        
-        if min_pitch is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('avg_pitch', p.get('pitch', 0)) >= min_pitch]
-            print(f"After min_pitch filter: {before} -> {len(filtered_data)}")
-        
-        if max_pitch is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('avg_pitch', p.get('pitch', 0)) <= max_pitch]
-            print(f"After max_pitch filter: {before} -> {len(filtered_data)}")
-        
-        if condition_min is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('avg_condition', p.get('roof condition summary score', 0)) >= condition_min]
-            print(f"After condition_min filter: {before} -> {len(filtered_data)}")
-        
-        if condition_max is not None:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if p.get('avg_condition', p.get('roof condition summary score', 0)) <= condition_max]
-            print(f"After condition_max filter: {before} -> {len(filtered_data)}")
-        
-        if search_address:
-            before = len(filtered_data)
-            filtered_data = [p for p in filtered_data if search_address in p.get('address', '').lower()]
-            print(f"After search filter ({search_address}): {before} -> {len(filtered_data)}")
-        
-        # Calculate pagination
-        total_properties = len(filtered_data)
-        total_pages = math.ceil(total_properties / per_page)
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        
-        # Get page data
-        page_data = filtered_data[start_idx:end_idx]
-        
-        print(f"\nFinal results: {total_properties} properties, returning page {page}/{total_pages} ({len(page_data)} items)")
-        print("=" * 40 + "\n")
-        
-        return jsonify({
-            'success': True,
-            'properties': page_data,
-            'pagination': {
-                'page': page,
-                'per_page': per_page,
-                'total_properties': total_properties,
-                'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_prev': page > 1
-            },
-            'filters_applied': {
-                'min_area': min_area,
-                'max_area': max_area,
-                'material': material,
-                'min_pitch': min_pitch,
-                'max_pitch': max_pitch,
-                'condition_min': condition_min,
-                'condition_max': condition_max,
-                'search': search_address
-            }
-        })
-        
+        return conditional_json(properties_page(request.args))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1269,13 +1560,8 @@ def get_property_details(user, property_id):
     """Get detailed property information"""
     try:
         # Find property by address (using property_id as address for now)
-        processed_data = process_properties_with_deduplication()
-        property_data = None
-        
-        for prop in processed_data:
-            if prop.get('address', '').replace(' ', '').lower() == property_id.replace('_', ' ').lower():
-                property_data = prop
-                break
+        load_processed_properties()
+        property_data = PROPERTY_LOOKUP.get(property_id.replace('_', ' ').lower())
         
         if not property_data:
             return jsonify({'error': 'Property not found'}), 404
@@ -1288,6 +1574,25 @@ def get_property_details(user, property_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/dashboard/bootstrap', methods=['GET'])
+@require_auth
+def dashboard_bootstrap(user):
+    """
+    Everything the dashboard needs after sign-in, in one round trip: the
+    user, the /api/profile/roofer payload, the /api/properties payload for
+    the query arguments and the saved quote count
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'user': user,
+            'roofer_profile': roofer_profile_payload(user),
+            'properties': properties_page(request.args),
+            'total_quotes': count_saved_quotes(user)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -1297,3787 +1602,6 @@ def health_check():
         'properties_loaded': len(CSV_DATA) if CSV_DATA else 0
     })
 
-# Enhanced HTML template with all best practices
-TILEIT_DASHBOARD_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="Professional roofing quote generator for contractors. Generate accurate quotes based on roof area, pitch, condition, and materials.">
-    <meta name="keywords" content="roofing, quotes, contractors, roofing estimate, roof calculator">
-    <meta name="author" content="Tileit">
-    <meta property="og:title" content="Tileit - Professional Roofing Solutions">
-    <meta property="og:description" content="Generate accurate roofing quotes in seconds">
-    <meta property="og:type" content="website">
-    <title>Tileit - Professional Roofing Solutions</title>
-    <link rel="icon" type="image/svg+xml" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🏠</text></svg>">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
-            background: #fafafa;
-            color: #1d1d1f;
-            line-height: 1.47;
-            min-height: 100vh;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 20px;
-        }
-        
-        /* Header */
-        .header {
-            background: #ffffff;
-            border-bottom: 1px solid #e5e7eb;
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 16px 0;
-        }
-        
-        .logo {
-            font-size: 28px;
-            font-weight: 700;
-            color: #1d1d1f;
-            text-decoration: none;
-        }
-        
-        .nav {
-            display: flex;
-            gap: 32px;
-            align-items: center;
-        }
-        
-        .nav-item {
-            color: #1d1d1f;
-            text-decoration: none;
-            font-size: 17px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-            padding: 8px 16px;
-            border-radius: 8px;
-        }
-        
-        .nav-item:hover {
-            color: #1d9bf0;
-            background: rgba(29, 155, 240, 0.1);
-        }
-        
-        .nav-item.active {
-            color: #1d9bf0;
-            background: rgba(29, 155, 240, 0.1);
-        }
-        
-        .user-menu {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-        }
-        
-        .user-avatar {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            background: #1d9bf0;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: 600;
-            font-size: 16px;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }
-        
-        .btn {
-            padding: 12px 24px;
-            border-radius: 12px;
-            font-size: 16px;
-            font-weight: 500;
-            text-decoration: none;
-            display: inline-block;
-            transition: all 0.3s ease;
-            border: none;
-            cursor: pointer;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        }
-        
-        .btn-primary {
-            background: #1d9bf0;
-            color: white;
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.4);
-        }
-        
-        .btn-secondary {
-            background: #f8f9fa;
-            color: #1d1d1f;
-            border: 2px solid #e9ecef;
-        }
-        
-        .btn-secondary:hover {
-            background: #e9ecef;
-            transform: translateY(-2px);
-        }
-        
-        .btn-danger {
-            background: linear-gradient(135deg, #ff6b6b, #ee5a52);
-            color: white;
-        }
-        
-        .btn-danger:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(255, 107, 107, 0.4);
-        }
-        
-        /* Auth Section */
-        .auth-container {
-            max-width: 450px;
-            margin: 80px auto;
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-            overflow: hidden;
-            border: 1px solid #e5e7eb;
-        }
-        
-        .auth-header {
-            background: #1d9bf0;
-            padding: 32px;
-            text-align: center;
-            color: white;
-        }
-        
-        .auth-title {
-            font-size: 32px;
-            font-weight: 700;
-            margin-bottom: 12px;
-        }
-        
-        .auth-subtitle {
-            font-size: 18px;
-            opacity: 0.9;
-        }
-        
-        .auth-tabs {
-            display: flex;
-            background: #f8f9fa;
-        }
-        
-        .auth-tab {
-            flex: 1;
-            padding: 20px;
-            background: none;
-            border: none;
-            cursor: pointer;
-            font-size: 18px;
-            font-weight: 600;
-            color: #6c757d;
-            transition: all 0.3s ease;
-        }
-        
-        .auth-tab.active {
-            background: white;
-            color: #1d9bf0;
-            border-bottom: 3px solid #1d9bf0;
-        }
-        
-        .auth-form {
-            padding: 40px;
-        }
-        
-        .form-group {
-            margin-bottom: 24px;
-        }
-        
-        .form-group label {
-            display: block;
-            margin-bottom: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            color: #1d1d1f;
-        }
-        
-        .form-group input {
-            width: 100%;
-            padding: 16px 20px;
-            border: 2px solid #e9ecef;
-            border-radius: 12px;
-            font-size: 16px;
-            transition: all 0.3s ease;
-            background: white;
-        }
-        
-        .form-group input:focus {
-            outline: none;
-            border-color: #1d9bf0;
-            box-shadow: 0 0 0 4px rgba(102, 126, 234, 0.1);
-        }
-        
-        .form-row {
-            display: flex;
-            gap: 16px;
-        }
-        
-        .form-row .form-group {
-            flex: 1;
-        }
-        
-        .forgot-password {
-            text-align: right;
-            margin-top: 16px;
-        }
-        
-        .forgot-password a {
-            color: #1d9bf0;
-            text-decoration: none;
-            font-size: 14px;
-            font-weight: 500;
-        }
-        
-        .forgot-password a:hover {
-            text-decoration: underline;
-        }
-        
-        /* Dashboard */
-        .dashboard {
-            display: none;
-        }
-        
-        .dashboard.active {
-            display: block;
-        }
-        
-        .dashboard-header {
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 32px;
-            margin-bottom: 24px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            border: 1px solid #e5e7eb;
-        }
-        
-        .dashboard-title {
-            font-size: 32px;
-            font-weight: 700;
-            color: #1d1d1f;
-            margin-bottom: 8px;
-        }
-        
-        .dashboard-subtitle {
-            color: #6c757d;
-            font-size: 20px;
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 24px;
-            margin-bottom: 40px;
-        }
-        
-        .stat-card {
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 24px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            border: 1px solid #e5e7eb;
-            transition: all 0.2s ease;
-        }
-        
-        .stat-card:hover {
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            border-color: #1d9bf0;
-        }
-        
-        .stat-card h3 {
-            color: #6c757d;
-            font-size: 14px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 12px;
-        }
-        
-        .stat-card .number {
-            font-size: 36px;
-            font-weight: 700;
-            color: #1d1d1f;
-        }
-        
-        /* Filters */
-        .filters-container {
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            margin-bottom: 24px;
-            padding: 24px;
-            border: 1px solid #e5e7eb;
-        }
-        
-        .filters-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 24px;
-        }
-        
-        .filters-title {
-            font-size: 24px;
-            font-weight: 700;
-            color: #1d1d1f;
-        }
-        
-        .filters-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 24px;
-        }
-        
-        .filter-group {
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .filter-group label {
-            font-size: 14px;
-            font-weight: 600;
-            color: #1d1d1f;
-            margin-bottom: 8px;
-        }
-        
-        .filter-group input,
-        .filter-group select {
-            padding: 12px 16px;
-            border: 2px solid #e9ecef;
-            border-radius: 12px;
-            font-size: 16px;
-            transition: all 0.3s ease;
-        }
-        
-        .filter-group input:focus,
-        .filter-group select:focus {
-            outline: none;
-            border-color: #1d9bf0;
-            box-shadow: 0 0 0 4px rgba(102, 126, 234, 0.1);
-        }
-        
-        .filter-actions {
-            display: flex;
-            gap: 16px;
-            align-items: center;
-        }
-        
-        .btn-filter {
-            background: linear-gradient(135deg, #28a745, #20c997);
-            color: white;
-            padding: 12px 24px;
-            border-radius: 12px;
-            border: none;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .btn-filter:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(40, 167, 69, 0.4);
-        }
-        
-        .btn-clear {
-            background: linear-gradient(135deg, #dc3545, #c82333);
-            color: white;
-            padding: 12px 24px;
-            border-radius: 12px;
-            border: none;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .btn-clear:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(220, 53, 69, 0.4);
-        }
-        
-        /* Properties Table */
-        .properties-container {
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            margin-bottom: 24px;
-            border: 1px solid #e5e7eb;
-        }
-        
-        .properties-header {
-            padding: 20px 24px;
-            border-bottom: 1px solid #e5e7eb;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .properties-title {
-            font-size: 24px;
-            font-weight: 700;
-            color: #1d1d1f;
-        }
-        
-        .properties-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        
-        .properties-table th,
-        .properties-table td {
-            padding: 16px 20px;
-            text-align: left;
-            border-bottom: 1px solid #e9ecef;
-        }
-        
-        .properties-table th {
-            background: #f8f9fa;
-            font-weight: 600;
-            color: #1d1d1f;
-            font-size: 16px;
-        }
-        
-        .properties-table td {
-            font-size: 16px;
-            color: #1d1d1f;
-        }
-        
-        .properties-table tbody tr {
-            transition: all 0.2s ease;
-        }
-        
-        .properties-table tbody tr:hover {
-            background: #eff6ff;
-            cursor: pointer;
-            box-shadow: 0 2px 8px rgba(79, 70, 229, 0.1);
-            transform: translateY(-2px);
-        }
-        
-        .property-link {
-            color: #1d9bf0;
-            text-decoration: none;
-            font-weight: 500;
-        }
-        
-        .property-link:hover {
-            text-decoration: underline;
-        }
-        
-        /* Modal */
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 2000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.5);
-            backdrop-filter: blur(10px);
-        }
-        
-        .modal-content {
-            background: white;
-            margin: 5% auto;
-            padding: 0;
-            border-radius: 20px;
-            width: 90%;
-            max-width: 800px;
-            max-height: 80vh;
-            overflow-y: auto;
-            box-shadow: 0 30px 60px rgba(0, 0, 0, 0.3);
-        }
-        
-        .modal-header {
-            background: #1d9bf0;
-            color: white;
-            padding: 24px 32px;
-            border-radius: 20px 20px 0 0;
-        }
-        
-        .modal-title {
-            font-size: 24px;
-            font-weight: 700;
-            margin-bottom: 8px;
-        }
-        
-        .modal-body {
-            padding: 32px;
-        }
-        
-        .close {
-            color: white;
-            float: right;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .close:hover {
-            opacity: 0.7;
-        }
-        
-        /* Pagination */
-        .pagination {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: 12px;
-            padding: 24px;
-        }
-        
-        .pagination button {
-            padding: 12px 20px;
-            border: 2px solid #e9ecef;
-            background: white;
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-        
-        .pagination button:hover:not(:disabled) {
-            border-color: #1d9bf0;
-            color: #1d9bf0;
-        }
-        
-        .pagination button:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        
-        .pagination .active {
-            background: #1d9bf0;
-            color: white;
-            border-color: #1d9bf0;
-        }
-        
-        /* Loading */
-        .loading {
-            text-align: center;
-            padding: 60px;
-            color: #6c757d;
-            font-size: 18px;
-        }
-        
-        .spinner {
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #1d9bf0;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 20px;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .error {
-            background: linear-gradient(135deg, #dc3545, #c82333);
-            color: white;
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            font-size: 16px;
-        }
-        
-        .success {
-            background: linear-gradient(135deg, #28a745, #20c997);
-            color: white;
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            font-size: 16px;
-        }
-        
-        /* Toast Notifications */
-        .toast-container {
-            position: fixed;
-            top: 80px;
-            right: 20px;
-            z-index: 3000;
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-            max-width: 400px;
-        }
-        
-        .toast {
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
-            padding: 16px 20px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            animation: slideIn 0.3s ease-out;
-            min-width: 300px;
-        }
-        
-        @keyframes slideIn {
-            from {
-                transform: translateX(400px);
-                opacity: 0;
-            }
-            to {
-                transform: translateX(0);
-                opacity: 1;
-            }
-        }
-        
-        @keyframes slideOut {
-            from {
-                transform: translateX(0);
-                opacity: 1;
-            }
-            to {
-                transform: translateX(400px);
-                opacity: 0;
-            }
-        }
-        
-        .toast.hiding {
-            animation: slideOut 0.3s ease-out forwards;
-        }
-        
-        .toast-icon {
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            flex-shrink: 0;
-        }
-        
-        .toast-success .toast-icon {
-            background: #28a745;
-            color: white;
-        }
-        
-        .toast-error .toast-icon {
-            background: #dc3545;
-            color: white;
-        }
-        
-        .toast-info .toast-icon {
-            background: #17a2b8;
-            color: white;
-        }
-        
-        .toast-warning .toast-icon {
-            background: #ffc107;
-            color: #1d1d1f;
-        }
-        
-        .toast-content {
-            flex: 1;
-        }
-        
-        .toast-title {
-            font-weight: 600;
-            margin-bottom: 4px;
-            color: #1d1d1f;
-        }
-        
-        .toast-message {
-            font-size: 14px;
-            color: #6c757d;
-        }
-        
-        .toast-close {
-            background: none;
-            border: none;
-            font-size: 20px;
-            color: #6c757d;
-            cursor: pointer;
-            padding: 0;
-            width: 24px;
-            height: 24px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: color 0.2s;
-        }
-        
-        .toast-close:hover {
-            color: #1d1d1f;
-        }
-        
-        /* User Dropdown Menu */
-        .user-menu {
-            position: relative;
-        }
-        
-        .user-info {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            cursor: pointer;
-            padding: 8px 12px;
-            border-radius: 12px;
-            transition: all 0.3s ease;
-        }
-        
-        .user-info:hover {
-            background: rgba(102, 126, 234, 0.1);
-        }
-        
-        .user-name {
-            font-weight: 500;
-            color: #1d1d1f;
-        }
-        
-        .user-dropdown {
-            position: absolute;
-            top: 100%;
-            right: 0;
-            margin-top: 8px;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
-            min-width: 200px;
-            display: none;
-            opacity: 0;
-            transform: translateY(-10px);
-            transition: all 0.3s ease;
-        }
-        
-        .user-dropdown.active {
-            display: block;
-            opacity: 1;
-            transform: translateY(0);
-        }
-        
-        .dropdown-item {
-            padding: 12px 20px;
-            color: #1d1d1f;
-            text-decoration: none;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            transition: all 0.2s;
-            cursor: pointer;
-            border: none;
-            background: none;
-            width: 100%;
-            text-align: left;
-            font-size: 15px;
-        }
-        
-        .dropdown-item:first-child {
-            border-radius: 12px 12px 0 0;
-        }
-        
-        .dropdown-item:last-child {
-            border-radius: 0 0 12px 12px;
-        }
-        
-        .dropdown-item:hover {
-            background: rgba(102, 126, 234, 0.1);
-        }
-        
-        .dropdown-divider {
-            height: 1px;
-            background: #e9ecef;
-            margin: 8px 0;
-        }
-        
-        .dropdown-item.danger {
-            color: #dc3545;
-        }
-        
-        .dropdown-item.danger:hover {
-            background: rgba(220, 53, 69, 0.1);
-        }
-        
-        /* Password Strength Indicator */
-        .password-strength {
-            margin-top: 8px;
-            height: 4px;
-            background: #e9ecef;
-            border-radius: 2px;
-            overflow: hidden;
-            display: none;
-        }
-        
-        .password-strength.active {
-            display: block;
-        }
-        
-        .password-strength-bar {
-            height: 100%;
-            transition: all 0.3s ease;
-            border-radius: 2px;
-        }
-        
-        .password-strength-weak .password-strength-bar {
-            width: 33%;
-            background: #dc3545;
-        }
-        
-        .password-strength-medium .password-strength-bar {
-            width: 66%;
-            background: #ffc107;
-        }
-        
-        .password-strength-strong .password-strength-bar {
-            width: 100%;
-            background: #28a745;
-        }
-        
-        .password-hint {
-            font-size: 12px;
-            color: #6c757d;
-            margin-top: 4px;
-        }
-        
-        /* Confirmation Dialog */
-        .confirm-dialog {
-            display: none;
-            position: fixed;
-            z-index: 3000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.5);
-            backdrop-filter: blur(10px);
-            align-items: center;
-            justify-content: center;
-        }
-        
-        .confirm-dialog.active {
-            display: flex;
-        }
-        
-        .confirm-content {
-            background: white;
-            border-radius: 20px;
-            padding: 32px;
-            max-width: 400px;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2);
-        }
-        
-        .confirm-title {
-            font-size: 24px;
-            font-weight: 700;
-            color: #1d1d1f;
-            margin-bottom: 12px;
-        }
-        
-        .confirm-message {
-            color: #6c757d;
-            font-size: 16px;
-            margin-bottom: 24px;
-            line-height: 1.5;
-        }
-        
-        .confirm-actions {
-            display: flex;
-            gap: 12px;
-            justify-content: flex-end;
-        }
-        
-        /* Loading Button State */
-        .btn.loading {
-            position: relative;
-            color: transparent;
-            pointer-events: none;
-        }
-        
-        .btn.loading::after {
-            content: '';
-            position: absolute;
-            width: 16px;
-            height: 16px;
-            top: 50%;
-            left: 50%;
-            margin-left: -8px;
-            margin-top: -8px;
-            border: 2px solid #ffffff;
-            border-radius: 50%;
-            border-top-color: transparent;
-            animation: spin 0.6s linear infinite;
-        }
-        
-        /* Footer */
-        .footer {
-            background: rgba(255, 255, 255, 0.95);
-            border-top: 1px solid rgba(0, 0, 0, 0.1);
-            padding: 40px 0;
-            margin-top: 80px;
-        }
-        
-        .footer-content {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 32px;
-        }
-        
-        .footer-section h4 {
-            font-size: 16px;
-            font-weight: 600;
-            color: #1d1d1f;
-            margin-bottom: 16px;
-        }
-        
-        .footer-links {
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }
-        
-        .footer-link {
-            color: #6c757d;
-            text-decoration: none;
-            font-size: 14px;
-            transition: color 0.2s;
-        }
-        
-        .footer-link:hover {
-            color: #1d9bf0;
-        }
-        
-        .footer-bottom {
-            border-top: 1px solid #e9ecef;
-            margin-top: 32px;
-            padding-top: 24px;
-            text-align: center;
-            color: #6c757d;
-            font-size: 14px;
-        }
-        
-        /* Session Timeout Warning */
-        .session-warning {
-            display: none;
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background: linear-gradient(135deg, #ffc107, #ff9800);
-            color: #1d1d1f;
-            padding: 20px 24px;
-            border-radius: 12px;
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.2);
-            max-width: 350px;
-            z-index: 2000;
-        }
-        
-        .session-warning.active {
-            display: block;
-            animation: slideIn 0.3s ease-out;
-        }
-        
-        .session-warning-title {
-            font-weight: 600;
-            margin-bottom: 8px;
-        }
-        
-        .session-warning-message {
-            font-size: 14px;
-            margin-bottom: 12px;
-        }
-        
-        .session-warning-actions {
-            display: flex;
-            gap: 12px;
-        }
-        
-        .btn-small {
-            padding: 8px 16px;
-            font-size: 14px;
-        }
-        
-        /* Accessibility improvements */
-        .sr-only {
-            position: absolute;
-            width: 1px;
-            height: 1px;
-            padding: 0;
-            margin: -1px;
-            overflow: hidden;
-            clip: rect(0, 0, 0, 0);
-            white-space: nowrap;
-            border-width: 0;
-        }
-        
-        *:focus-visible {
-            outline: 3px solid #1d9bf0;
-            outline-offset: 2px;
-        }
-        
-        /* Property Details Modal */
-        .modal-overlay {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(0, 0, 0, 0.5);
-            backdrop-filter: blur(4px);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            z-index: 9999;
-            animation: fadeIn 0.3s ease-out;
-        }
-        
-        .modal-content {
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            max-width: 800px;
-            width: 90%;
-            max-height: 90vh;
-            overflow-y: auto;
-            animation: slideUp 0.3s ease-out;
-        }
-        
-        @keyframes slideUp {
-            from {
-                transform: translateY(30px);
-                opacity: 0;
-            }
-            to {
-                transform: translateY(0);
-                opacity: 1;
-            }
-        }
-        
-        .modal-header {
-            padding: 24px 32px;
-            border-bottom: 1px solid #e9ecef;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .modal-header h2 {
-            margin: 0;
-            font-size: 24px;
-            font-weight: 600;
-            color: #1d1d1f;
-        }
-        
-        .btn-close {
-            background: none;
-            border: none;
-            font-size: 32px;
-            color: #6c757d;
-            cursor: pointer;
-            padding: 0;
-            width: 32px;
-            height: 32px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: 6px;
-            transition: all 0.2s;
-        }
-        
-        .btn-close:hover {
-            background: #f8f9fa;
-            color: #1d1d1f;
-        }
-        
-        .modal-body {
-            padding: 32px;
-        }
-        
-        .property-details-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 32px;
-        }
-        
-        .detail-section {
-            background: #ffffff;
-            padding: 0;
-            border-radius: 0;
-        }
-        
-        .detail-section h3 {
-            margin: 0 0 20px 0;
-            font-size: 18px;
-            font-weight: 600;
-            color: #1d1d1f;
-        }
-        
-        .detail-row {
-            display: flex;
-            justify-content: space-between;
-            padding: 12px 0;
-            border-bottom: 1px solid #dee2e6;
-        }
-        
-        .detail-row:last-child {
-            border-bottom: none;
-        }
-        
-        .detail-label {
-            font-weight: 500;
-            color: #6c757d;
-        }
-        
-        .detail-value {
-            font-weight: 600;
-            color: #1d1d1f;
-        }
-        
-        /* New Modern Info Item Styling */
-        .info-item {
-            display: flex;
-            flex-direction: column;
-            gap: 6px;
-            padding: 14px 0;
-            border-bottom: 1px solid #e5e7eb;
-        }
-        
-        .info-item:last-child {
-            border-bottom: none;
-        }
-        
-        .info-label {
-            font-size: 13px;
-            font-weight: 500;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .info-value {
-            font-size: 16px;
-            font-weight: 600;
-            color: #111827;
-        }
-        
-        .quote-summary {
-            display: flex;
-            flex-direction: column;
-            gap: 16px;
-        }
-        
-        .quote-range {
-            background: linear-gradient(135deg, #4f46e5 0%, #3b82f6 100%);
-            padding: 24px;
-            border-radius: 12px;
-            color: white;
-            box-shadow: 0 4px 12px rgba(79, 70, 229, 0.2);
-        }
-        
-        .quote-range h4 {
-            margin: 0 0 16px 0;
-            font-size: 16px;
-            font-weight: 500;
-            opacity: 0.9;
-        }
-        
-        .quote-amounts {
-            display: flex;
-            gap: 20px;
-        }
-        
-        .quote-amount {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .amount-label {
-            font-size: 12px;
-            opacity: 0.8;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 8px;
-        }
-        
-        .amount-value {
-            font-size: 28px;
-            font-weight: 700;
-        }
-        
-        .modal-footer {
-            padding: 20px 32px;
-            border-top: 1px solid #e9ecef;
-            display: flex;
-            gap: 12px;
-            justify-content: flex-end;
-        }
-        
-        .btn-sm {
-            padding: 8px 16px;
-            font-size: 14px;
-        }
-        
-        /* Property Analysis Section */
-        .analysis-section {
-            padding: 24px 32px;
-            background: #f9fafb;
-            border-top: 1px solid #e5e7eb;
-        }
-        
-        .analysis-section h3 {
-            margin: 0 0 20px 0;
-            font-size: 18px;
-            font-weight: 600;
-            color: #111827;
-        }
-        
-        .analysis-content {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-        
-        .analysis-item {
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-        }
-        
-        .analysis-label {
-            font-size: 13px;
-            font-weight: 600;
-            color: #6b7280;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .analysis-badge {
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 6px;
-            font-size: 14px;
-            font-weight: 600;
-            width: fit-content;
-        }
-        
-        .status-excellent {
-            background: #d1fae5;
-            color: #065f46;
-        }
-        
-        .status-good {
-            background: #dbeafe;
-            color: #1e40af;
-        }
-        
-        .status-fair {
-            background: #fef3c7;
-            color: #92400e;
-        }
-        
-        .status-poor {
-            background: #fee2e2;
-            color: #991b1b;
-        }
-        
-        .analysis-list {
-            margin: 0;
-            padding-left: 20px;
-            color: #374151;
-            line-height: 1.6;
-        }
-        
-        .analysis-list li {
-            margin: 6px 0;
-        }
-        
-        /* Shimmer Loader */
-        @keyframes shimmer {
-            0% {
-                background-position: -1000px 0;
-            }
-            100% {
-                background-position: 1000px 0;
-            }
-        }
-        
-        .shimmer {
-            animation: shimmer 2s infinite linear;
-            background: linear-gradient(to right, #f0f0f0 8%, #e0e0e0 18%, #f0f0f0 33%);
-            background-size: 1000px 100%;
-        }
-        
-        .loading-shimmer {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(0, 0, 0, 0.3);
-            backdrop-filter: blur(4px);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            z-index: 9998;
-        }
-        
-        .shimmer-box {
-            background: white;
-            padding: 40px;
-            border-radius: 16px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            text-align: center;
-        }
-        
-        .shimmer-spinner {
-            width: 50px;
-            height: 50px;
-            border: 4px solid #e5e7eb;
-            border-top-color: #4f46e5;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 20px;
-        }
-        
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-        
-        .shimmer-text {
-            font-size: 16px;
-            font-weight: 500;
-            color: #374151;
-        }
-        
-        /* Fade animations for modals */
-        @keyframes fadeIn {
-            from {
-                opacity: 0;
-            }
-            to {
-                opacity: 1;
-            }
-        }
-        
-        @keyframes slideUp {
-            from {
-                transform: translateY(30px);
-                opacity: 0;
-            }
-            to {
-                transform: translateY(0);
-                opacity: 1;
-            }
-        }
-        
-        /* Responsive */
-        @media (max-width: 768px) {
-            .container {
-                padding: 0 16px;
-            }
-            
-            .filters-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .form-row {
-                flex-direction: column;
-            }
-            
-            .nav {
-                gap: 16px;
-            }
-            
-            .nav-item {
-                font-size: 14px;
-                padding: 6px 12px;
-            }
-            
-            .property-details-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .modal-content {
-                width: 95%;
-                max-height: 95vh;
-            }
-            
-            .modal-header,
-            .modal-body,
-            .modal-footer {
-                padding: 16px 20px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <div class="container">
-            <div class="header-content">
-                <a href="#" class="logo">Tileit</a>
-                <div class="nav">
-                    <a href="#" class="nav-item active" onclick="showSection('dashboard')">Dashboard</a>
-                    <a href="#" class="nav-item" onclick="showSection('properties')">Properties</a>
-                    <a href="#" class="nav-item" onclick="showSection('quotes')">Quotes</a>
-                    <a href="#" class="nav-item" onclick="showSection('settings')">Settings</a>
-                    <a href="#" class="nav-item" onclick="showSection('profile')">Profile</a>
-                </div>
-                <div class="user-menu" id="userMenu" style="display: none;">
-                    <div class="user-avatar" id="userAvatar">U</div>
-                    <span id="userName" style="margin-right: 16px; font-weight: 500;">User</span>
-                    <button class="btn btn-danger" onclick="confirmLogout()" style="padding: 8px 20px;">Logout</button>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <div class="container">
-        <!-- Authentication Section -->
-        <div id="authSection" class="auth-container">
-            <div class="auth-header">
-                <div class="auth-title">Welcome to Tileit</div>
-                <div class="auth-subtitle">Professional roofing solutions for modern businesses</div>
-            </div>
-            
-            <div class="auth-tabs">
-                <button class="auth-tab active" onclick="showLogin()">Sign In</button>
-                <button class="auth-tab" onclick="showRegister()">Create Account</button>
-            </div>
-            
-            <div id="loginForm" class="auth-form">
-                <div class="form-group">
-                    <label>Email Address</label>
-                    <input type="email" id="loginEmail" placeholder="your@company.com">
-                </div>
-                
-                <div class="form-group">
-                    <label>Password</label>
-                    <input type="password" id="loginPassword" placeholder="Enter your password">
-                </div>
-                
-                <div class="forgot-password">
-                    <a href="#" onclick="showForgotPassword()">Forgot Password?</a>
-                </div>
-                
-                <button class="btn btn-primary" onclick="login()" style="width: 100%;">Sign In</button>
-            </div>
-            
-            <div id="registerForm" class="auth-form" style="display: none;">
-                <div class="form-group">
-                    <label>Business Name</label>
-                    <input type="text" id="regBusinessName" placeholder="Your Roofing Company">
-                </div>
-                
-                <div class="form-group">
-                    <label>Email Address</label>
-                    <input type="email" id="regEmail" placeholder="your@company.com">
-                </div>
-                
-                <div class="form-group">
-                    <label>Password</label>
-                    <input type="password" id="regPassword" placeholder="Create a secure password" oninput="checkPasswordStrength(this.value)">
-                    <div class="password-strength" id="passwordStrength">
-                        <div class="password-strength-bar"></div>
-                    </div>
-                    <div class="password-hint" id="passwordHint">Use at least 8 characters with a mix of letters, numbers & symbols</div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>License ID</label>
-                        <input type="text" id="regLicenseId" placeholder="LIC123456">
-                    </div>
-                    <div class="form-group">
-                        <label>ZIP Code</label>
-                        <input type="text" id="regZipCode" placeholder="11221">
-                    </div>
-                </div>
-                
-                <div class="form-group">
-                    <label>Phone Number <span style="color: red;">*</span></label>
-                    <input type="tel" id="regPhone" placeholder="555-123-4567" required>
-                </div>
-                
-                <button class="btn btn-primary" onclick="register()" style="width: 100%;">Create Account</button>
-            </div>
-            
-            <div id="forgotPasswordForm" class="auth-form" style="display: none;">
-                <div class="form-group">
-                    <label>Email Address</label>
-                    <input type="email" id="forgotEmail" placeholder="your@company.com">
-                </div>
-                
-                <button class="btn btn-primary" onclick="forgotPassword()" style="width: 100%;">Send Reset Link</button>
-                <button class="btn btn-secondary" onclick="showLogin()" style="width: 100%; margin-top: 12px;">Back to Login</button>
-            </div>
-        </div>
-        
-        <!-- Dashboard Section (Stats Only) -->
-        <div id="dashboard" class="dashboard">
-            <div class="dashboard-header">
-                <div class="dashboard-title">Business Dashboard</div>
-                <div class="dashboard-subtitle">Overview of your roofing business metrics</div>
-            </div>
-            
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <h3>Available Properties</h3>
-                    <div class="number" id="totalProperties">0</div>
-                    <p style="font-size: 14px; color: #6c757d; margin-top: 8px;">Properties in database</p>
-                </div>
-                <div class="stat-card">
-                    <h3>Saved Quotes</h3>
-                    <div class="number" id="totalQuotes">0</div>
-                    <p style="font-size: 14px; color: #6c757d; margin-top: 8px;">Quotes you've saved</p>
-                </div>
-                <div class="stat-card" id="profileStatusCard" style="cursor: pointer;" onclick="handleProfileStatusClick()">
-                    <h3>Profile Status</h3>
-                    <div id="profileStatus">Incomplete</div>
-                    <p style="font-size: 14px; color: #6c757d; margin-top: 8px;">Click to complete</p>
-                </div>
-            </div>
-            
-            <div class="filters-container">
-                <h3 style="margin-bottom: 16px; color: #1d1d1f;">Quick Actions</h3>
-                <div style="display: flex; gap: 16px; flex-wrap: wrap;">
-                    <button class="btn btn-primary" onclick="showSection('properties')">Browse Properties</button>
-                    <button class="btn btn-primary" onclick="showSection('quotes')">View Saved Quotes</button>
-                    <button class="btn btn-secondary" onclick="showSection('profile')">Update Profile</button>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Properties Section -->
-        <div id="properties" class="dashboard" style="display: none;">
-            <div class="dashboard-header">
-                <div class="dashboard-title">Property Browser</div>
-                <div class="dashboard-subtitle">Browse and filter 25,000+ properties</div>
-            </div>
-            
-            <!-- Filters Section -->
-            <div class="filters-container">
-                <div class="filters-header">
-                    <div class="filters-title">Property Filters</div>
-                    <div class="filter-actions">
-                        <button class="btn-filter" onclick="applyFilters()">Apply Filters</button>
-                        <button class="btn-clear" onclick="clearFilters()">Clear All</button>
-                    </div>
-                </div>
-                
-                <div class="filters-grid">
-                    <div class="filter-group">
-                        <label>Search Address</label>
-                        <input type="text" id="searchAddress" placeholder="Enter address...">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Material Type</label>
-                        <select id="filterMaterial">
-                            <option value="">All Materials</option>
-                            <option value="asphalt">Asphalt</option>
-                            <option value="shingle">Shingle</option>
-                            <option value="metal">Metal</option>
-                            <option value="tile">Tile</option>
-                            <option value="concrete">Concrete</option>
-                        </select>
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Min Area (sqft)</label>
-                        <input type="number" id="minArea" placeholder="0">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Max Area (sqft)</label>
-                        <input type="number" id="maxArea" placeholder="10000">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Min Pitch (°)</label>
-                        <input type="number" id="minPitch" placeholder="0">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Max Pitch (°)</label>
-                        <input type="number" id="maxPitch" placeholder="60">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Min Condition Score</label>
-                        <input type="number" id="minCondition" placeholder="0" min="0" max="100">
-                    </div>
-                    
-                    <div class="filter-group">
-                        <label>Max Condition Score</label>
-                        <input type="number" id="maxCondition" placeholder="100" min="0" max="100">
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Properties Table -->
-            <div class="properties-container">
-                <div class="properties-header">
-                    <div class="properties-title">Properties</div>
-                    <div style="display: flex; gap: 16px; align-items: center;">
-                        <div id="propertiesStats" style="color: #6c757d; font-size: 16px;"></div>
-                    </div>
-                </div>
-                
-                <div id="propertiesTable">
-                    <div class="loading">
-                        <div class="spinner"></div>
-                        Loading properties...
-                    </div>
-                </div>
-                
-                <div class="pagination" id="propertiesPagination" style="display: none;">
-                    <button onclick="previousPage()" id="prevPageBtn">Previous</button>
-                    <span id="pageInfo">Page 1 of 1</span>
-                    <button onclick="nextPage()" id="nextPageBtn">Next</button>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Saved Quotes Section -->
-        <div id="quotes" class="dashboard" style="display: none;">
-            <div class="dashboard-header">
-                <div class="dashboard-title">Saved Quotes</div>
-                <div class="dashboard-subtitle">View and manage your saved property quotes</div>
-            </div>
-            
-            <div class="properties-container">
-                <div class="properties-header">
-                    <div class="properties-title">Your Saved Quotes</div>
-                    <div style="display: flex; gap: 16px; align-items: center;">
-                        <div id="savedQuotesStats" style="color: #6c757d; font-size: 16px;"></div>
-                    </div>
-                </div>
-                
-                <div id="savedQuotesTable">
-                    <div class="loading">
-                        <div class="spinner"></div>
-                        Loading saved quotes...
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Settings Section -->
-        <div id="settings" class="dashboard" style="display: none;">
-            <div class="dashboard-header">
-                <div class="dashboard-title">Settings</div>
-                <div class="dashboard-subtitle">Customize your Tileit experience</div>
-            </div>
-            
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Notification Settings</h3>
-                <div class="form-group">
-                    <label>
-                        <input type="checkbox" id="notifications" checked> 
-                        Enable notifications
-                    </label>
-                </div>
-                <div class="form-group">
-                    <label>
-                        <input type="checkbox" id="emailAlerts" checked> 
-                        Email alerts for new quotes
-                    </label>
-                </div>
-                <div class="form-group">
-                    <label>
-                        <input type="checkbox" id="autoSave" checked> 
-                        Auto-save quotes
-                    </label>
-                </div>
-                
-                <button class="btn btn-primary" onclick="saveSettings()">Save Settings</button>
-            </div>
-            
-            <div class="filters-container" style="margin-top: 32px;">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Account Actions</h3>
-                <button class="btn btn-danger" onclick="confirmLogout()" style="width: 200px;">
-                    🚪 Logout
-                </button>
-            </div>
-        </div>
-        
-        <!-- Profile Section -->
-        <div id="profile" class="dashboard" style="display: none;">
-            <div class="dashboard-header">
-                <div class="dashboard-title">Business Profile</div>
-                <div class="dashboard-subtitle">Configure your business information and pricing</div>
-            </div>
-            
-            <!-- Business Information -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Business Information</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Business Name</label>
-                        <input type="text" id="profileBusinessName" placeholder="Your Roofing Company">
-                    </div>
-                    <div class="form-group">
-                        <label>Email Address</label>
-                        <input type="email" id="profileEmail" placeholder="your@company.com" readonly>
-                    </div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>License ID</label>
-                        <input type="text" id="profileLicenseId" placeholder="LIC123456">
-                    </div>
-                    <div class="form-group">
-                        <label>Primary ZIP Code</label>
-                        <input type="text" id="profileZipCode" placeholder="11221">
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Labor Information -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Labor Information</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Labor Rate ($/hour per worker)</label>
-                        <input type="number" id="profileLaborRate" placeholder="45" step="1" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Daily Productivity (sqft/day per crew)</label>
-                        <input type="number" id="profileDailyProductivity" placeholder="2500" step="100" min="0">
-                    </div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Base Crew Size</label>
-                        <input type="number" id="profileBaseCrewSize" placeholder="3" step="1" min="1">
-                    </div>
-                    <div class="form-group">
-                        <label>Crew Scaling Rule</label>
-                        <select id="profileCrewScalingRule">
-                            <option value="size_only">Size Only</option>
-                            <option value="size_and_complexity">Size and Complexity</option>
-                        </select>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Slope Adjustments -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Slope Cost Adjustments (%)</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Flat/Low (0-15°)</label>
-                        <input type="number" id="profileSlopeFlatLow" placeholder="0" step="0.1" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Moderate (15-30°)</label>
-                        <input type="number" id="profileSlopeModerate" placeholder="0.1" step="0.1" min="0">
-                    </div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Steep (30-45°)</label>
-                        <input type="number" id="profileSlopeSteep" placeholder="0.2" step="0.1" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Very Steep (>45°)</label>
-                        <input type="number" id="profileSlopeVerySteep" placeholder="0.3" step="0.1" min="0">
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Material Costs -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Material Costs ($/sqft)</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Asphalt</label>
-                        <input type="number" id="profileMaterialAsphalt" placeholder="4.0" step="0.5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Shingle</label>
-                        <input type="number" id="profileMaterialShingle" placeholder="4.5" step="0.5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Metal</label>
-                        <input type="number" id="profileMaterialMetal" placeholder="7.0" step="0.5" min="0">
-                    </div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Tile</label>
-                        <input type="number" id="profileMaterialTile" placeholder="8.0" step="0.5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Concrete</label>
-                        <input type="number" id="profileMaterialConcrete" placeholder="6.0" step="0.5" min="0">
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Replacement Costs -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Replacement Costs ($/sqm)</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Asphalt</label>
-                        <input type="number" id="profileReplacementAsphalt" placeholder="45" step="5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Shingle</label>
-                        <input type="number" id="profileReplacementShingle" placeholder="50" step="5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Metal</label>
-                        <input type="number" id="profileReplacementMetal" placeholder="90" step="5" min="0">
-                    </div>
-                </div>
-                
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Tile</label>
-                        <input type="number" id="profileReplacementTile" placeholder="70" step="5" min="0">
-                    </div>
-                    <div class="form-group">
-                        <label>Concrete</label>
-                        <input type="number" id="profileReplacementConcrete" placeholder="60" step="5" min="0">
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Business Margins -->
-            <div class="filters-container">
-                <h3 style="margin-bottom: 24px; color: #1d1d1f;">Business Margins</h3>
-                <div class="form-row">
-                    <div class="form-group">
-                        <label>Overhead Percentage</label>
-                        <input type="number" id="profileOverhead" placeholder="0.1" step="0.01" min="0" max="1">
-                    </div>
-                    <div class="form-group">
-                        <label>Profit Margin</label>
-                        <input type="number" id="profileProfit" placeholder="0.2" step="0.01" min="0" max="1">
-                    </div>
-                </div>
-                
-                <button class="btn btn-primary" onclick="saveRooferProfile()">Save Business Profile</button>
-            </div>
-        </div>
-    </div>
-    
-    <!-- Property Details Modal -->
-    <div id="propertyModal" class="modal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <span class="close" onclick="closeModal()">&times;</span>
-                <div class="modal-title">Property Details</div>
-            </div>
-            <div class="modal-body" id="modalBody">
-                <!-- Property details will be loaded here -->
-            </div>
-        </div>
-    </div>
-    
-    <!-- Toast Notification Container -->
-    <div class="toast-container" id="toastContainer" role="region" aria-live="polite" aria-label="Notifications"></div>
-    
-    <!-- Confirmation Dialog -->
-    <div class="confirm-dialog" id="confirmDialog" role="dialog" aria-modal="true" aria-labelledby="confirmTitle" aria-describedby="confirmMessage">
-        <div class="confirm-content">
-            <div class="confirm-title" id="confirmTitle">Confirm Action</div>
-            <div class="confirm-message" id="confirmMessage">Are you sure you want to proceed?</div>
-            <div class="confirm-actions">
-                <button class="btn btn-secondary" onclick="closeConfirmDialog()" id="confirmCancel">Cancel</button>
-                <button class="btn btn-danger" onclick="executeConfirmedAction()" id="confirmOk">Confirm</button>
-            </div>
-        </div>
-    </div>
-    
-    <!-- Session Timeout Warning -->
-    <div class="session-warning" id="sessionWarning">
-        <div class="session-warning-title">⏰ Session Expiring Soon</div>
-        <div class="session-warning-message">Your session will expire in <span id="sessionTimer">5:00</span> minutes. Would you like to extend your session?</div>
-        <div class="session-warning-actions">
-            <button class="btn btn-primary btn-small" onclick="extendSession()">Extend Session</button>
-            <button class="btn btn-secondary btn-small" onclick="dismissSessionWarning()">Dismiss</button>
-        </div>
-    </div>
-    
-    <!-- Footer -->
-    <footer class="footer">
-        <div class="container">
-            <div class="footer-content">
-                <div class="footer-section">
-                    <h4>Tileit</h4>
-                    <div class="footer-links">
-                        <a href="#" class="footer-link">About Us</a>
-                        <a href="#" class="footer-link">Features</a>
-                        <a href="#" class="footer-link">Pricing</a>
-                        <a href="#" class="footer-link">Blog</a>
-                    </div>
-                </div>
-                <div class="footer-section">
-                    <h4>Support</h4>
-                    <div class="footer-links">
-                        <a href="#" class="footer-link">Help Center</a>
-                        <a href="#" class="footer-link">Contact Us</a>
-                        <a href="#" class="footer-link">Documentation</a>
-                        <a href="#" class="footer-link">API Reference</a>
-                    </div>
-                </div>
-                <div class="footer-section">
-                    <h4>Legal</h4>
-                    <div class="footer-links">
-                        <a href="#" class="footer-link">Privacy Policy</a>
-                        <a href="#" class="footer-link">Terms of Service</a>
-                        <a href="#" class="footer-link">Cookie Policy</a>
-                        <a href="#" class="footer-link">GDPR Compliance</a>
-                    </div>
-                </div>
-                <div class="footer-section">
-                    <h4>Connect</h4>
-                    <div class="footer-links">
-                        <a href="#" class="footer-link">Twitter</a>
-                        <a href="#" class="footer-link">LinkedIn</a>
-                        <a href="#" class="footer-link">Facebook</a>
-                        <a href="#" class="footer-link">Instagram</a>
-                    </div>
-                </div>
-            </div>
-            <div class="footer-bottom">
-                <p>&copy; 2024 Tileit. All rights reserved. Built with ❤️ for roofing professionals.</p>
-            </div>
-        </div>
-    </footer>
-
-    <script>
-        let currentUser = null;
-        let authToken = null;
-        let currentPage = 1;
-        let currentSection = 'dashboard';
-        let sessionTimer = null;
-        let sessionWarningTimer = null;
-        let confirmCallback = null;
-        
-        // Toast Notification System
-        function showToast(message, type = 'info', title = null) {
-            const container = document.getElementById('toastContainer');
-            const toast = document.createElement('div');
-            toast.className = `toast toast-${type}`;
-            
-            const icons = {
-                success: '✓',
-                error: '✕',
-                warning: '⚠',
-                info: 'ℹ'
-            };
-            
-            const titles = {
-                success: 'Success',
-                error: 'Error',
-                warning: 'Warning',
-                info: 'Info'
-            };
-            
-            toast.innerHTML = `
-                <div class="toast-icon">${icons[type] || icons.info}</div>
-                <div class="toast-content">
-                    <div class="toast-title">${title || titles[type]}</div>
-                    <div class="toast-message">${message}</div>
-                </div>
-                <button class="toast-close" onclick="this.parentElement.remove()">&times;</button>
-            `;
-            
-            container.appendChild(toast);
-            
-            // Auto remove after 5 seconds
-            setTimeout(() => {
-                toast.classList.add('hiding');
-                setTimeout(() => toast.remove(), 300);
-            }, 5000);
-        }
-        
-        // Confirmation Dialog
-        function showConfirmDialog(title, message, onConfirm, confirmText = 'Confirm', cancelText = 'Cancel') {
-            document.getElementById('confirmTitle').textContent = title;
-            document.getElementById('confirmMessage').textContent = message;
-            document.getElementById('confirmOk').textContent = confirmText;
-            document.getElementById('confirmCancel').textContent = cancelText;
-            document.getElementById('confirmDialog').classList.add('active');
-            confirmCallback = onConfirm;
-        }
-        
-        function closeConfirmDialog() {
-            document.getElementById('confirmDialog').classList.remove('active');
-            confirmCallback = null;
-        }
-        
-        function executeConfirmedAction() {
-            if (confirmCallback) {
-                confirmCallback();
-            }
-            closeConfirmDialog();
-        }
-        
-        
-        // Password Strength Checker
-        function checkPasswordStrength(password) {
-            const strengthIndicator = document.getElementById('passwordStrength');
-            const hint = document.getElementById('passwordHint');
-            
-            if (!password) {
-                strengthIndicator.classList.remove('active');
-                strengthIndicator.className = 'password-strength';
-                hint.textContent = 'Use at least 8 characters with a mix of letters, numbers & symbols';
-                return;
-            }
-            
-            strengthIndicator.classList.add('active');
-            
-            let strength = 0;
-            if (password.length >= 8) strength++;
-            if (password.length >= 12) strength++;
-            if (/[a-z]/.test(password) && /[A-Z]/.test(password)) strength++;
-            if (/\d/.test(password)) strength++;
-            if (/[^a-zA-Z0-9]/.test(password)) strength++;
-            
-            strengthIndicator.classList.remove('password-strength-weak', 'password-strength-medium', 'password-strength-strong');
-            
-            if (strength <= 2) {
-                strengthIndicator.classList.add('password-strength-weak');
-                hint.textContent = 'Weak password - add more characters and variety';
-                hint.style.color = '#dc3545';
-            } else if (strength <= 4) {
-                strengthIndicator.classList.add('password-strength-medium');
-                hint.textContent = 'Medium password - consider adding special characters';
-                hint.style.color = '#ffc107';
-            } else {
-                strengthIndicator.classList.add('password-strength-strong');
-                hint.textContent = 'Strong password!';
-                hint.style.color = '#28a745';
-            }
-        }
-        
-        // Session Management
-        function startSessionTimer() {
-            // Clear existing timers
-            if (sessionTimer) clearTimeout(sessionTimer);
-            if (sessionWarningTimer) clearTimeout(sessionWarningTimer);
-            
-            // Show warning 5 minutes before expiration (after 19 minutes)
-            sessionWarningTimer = setTimeout(() => {
-                showSessionWarning();
-            }, 19 * 60 * 1000); // 19 minutes
-            
-            // Auto logout after 24 minutes
-            sessionTimer = setTimeout(() => {
-                showToast('Session expired. Please login again.', 'warning');
-                logout();
-            }, 24 * 60 * 1000); // 24 minutes
-        }
-        
-        function showSessionWarning() {
-            const warning = document.getElementById('sessionWarning');
-            warning.classList.add('active');
-            
-            let timeLeft = 5 * 60; // 5 minutes in seconds
-            const timerEl = document.getElementById('sessionTimer');
-            
-            const countdown = setInterval(() => {
-                timeLeft--;
-                const minutes = Math.floor(timeLeft / 60);
-                const seconds = timeLeft % 60;
-                timerEl.textContent = `${minutes}:${seconds.toString().padStart(2, '0')}`;
-                
-                if (timeLeft <= 0) {
-                    clearInterval(countdown);
-                }
-            }, 1000);
-        }
-        
-        function dismissSessionWarning() {
-            document.getElementById('sessionWarning').classList.remove('active');
-        }
-        
-        async function extendSession() {
-            try {
-                // Reload user profile to extend session
-                const response = await fetch('/api/profile', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                
-                if (response.ok) {
-                    dismissSessionWarning();
-                    startSessionTimer();
-                    showToast('Session extended successfully', 'success');
-                } else {
-                    showToast('Failed to extend session', 'error');
-                }
-            } catch (error) {
-                showToast('Error extending session', 'error');
-            }
-        }
-        
-        // Loading Button State
-        function setButtonLoading(button, isLoading) {
-            if (isLoading) {
-                button.classList.add('loading');
-                button.disabled = true;
-            } else {
-                button.classList.remove('loading');
-                button.disabled = false;
-            }
-        }
-        
-        // Check for existing session
-        window.onload = function() {
-            const savedToken = localStorage.getItem('authToken');
-            if (savedToken) {
-                authToken = savedToken;
-                loadDashboard();
-            }
-        };
-        
-        function showLogin() {
-            document.getElementById('loginForm').style.display = 'block';
-            document.getElementById('registerForm').style.display = 'none';
-            document.getElementById('forgotPasswordForm').style.display = 'none';
-            document.querySelectorAll('.auth-tab').forEach(tab => tab.classList.remove('active'));
-            document.querySelectorAll('.auth-tab')[0].classList.add('active');
-        }
-        
-        function showRegister() {
-            document.getElementById('loginForm').style.display = 'none';
-            document.getElementById('registerForm').style.display = 'block';
-            document.getElementById('forgotPasswordForm').style.display = 'none';
-            document.querySelectorAll('.auth-tab').forEach(tab => tab.classList.remove('active'));
-            document.querySelectorAll('.auth-tab')[1].classList.add('active');
-        }
-        
-        function showForgotPassword() {
-            document.getElementById('loginForm').style.display = 'none';
-            document.getElementById('registerForm').style.display = 'none';
-            document.getElementById('forgotPasswordForm').style.display = 'block';
-        }
-        
-        async function login(event) {
-            if (event) event.preventDefault();
-            
-            const email = document.getElementById('loginEmail').value.trim();
-            const password = document.getElementById('loginPassword').value;
-            const submitBtn = event ? event.target : document.querySelector('#loginForm .btn-primary');
-            
-            if (!email || !password) {
-                showToast('Please fill in all fields', 'error');
-                return;
-            }
-            
-            // Email validation
-            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-            if (!emailRegex.test(email)) {
-                showToast('Please enter a valid email address', 'error');
-                return;
-            }
-            
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const response = await fetch('/api/auth/login', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({email, password})
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    authToken = result.token;
-                    currentUser = result.user;
-                    localStorage.setItem('authToken', authToken);
-                    showToast('Welcome back, ' + result.user.business_name + '!', 'success');
-                    startSessionTimer();
-                    setTimeout(() => loadDashboard(), 500);
-                } else {
-                    showToast(result.error || 'Login failed', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Login error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        async function register(event) {
-            if (event) event.preventDefault();
-            
-            const businessName = document.getElementById('regBusinessName').value.trim();
-            const email = document.getElementById('regEmail').value.trim();
-            const password = document.getElementById('regPassword').value;
-            const licenseId = document.getElementById('regLicenseId').value.trim();
-            const zipCode = document.getElementById('regZipCode').value.trim();
-            const phone = document.getElementById('regPhone').value.trim();
-            const submitBtn = event ? event.target : document.querySelector('#registerForm .btn-primary');
-            
-            // Validation
-            if (!businessName || !email || !password || !licenseId || !zipCode || !phone) {
-                showToast('Please fill in all fields including phone number', 'error');
-                return;
-            }
-            
-            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-            if (!emailRegex.test(email)) {
-                showToast('Please enter a valid email address', 'error');
-                return;
-            }
-            
-            if (password.length < 8) {
-                showToast('Password must be at least 8 characters long', 'error');
-                return;
-            }
-            
-            const zipRegex = /^\d{5}$/;
-            if (!zipRegex.test(zipCode)) {
-                showToast('Please enter a valid 5-digit ZIP code', 'error');
-                return;
-            }
-            
-            // Phone validation (basic)
-            const phoneRegex = /^[\d\s\-\(\)]+$/;
-            if (!phoneRegex.test(phone) || phone.length < 10) {
-                showToast('Please enter a valid phone number', 'error');
-                return;
-            }
-            
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const response = await fetch('/api/auth/register', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        business_name: businessName,
-                        email,
-                        password,
-                        license_id: licenseId,
-                        primary_zip_code: zipCode,
-                        phone: phone
-                    })
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    authToken = result.token;
-                    currentUser = result.user;
-                    localStorage.setItem('authToken', authToken);
-                    showToast('Account created successfully! Welcome to Tileit!', 'success');
-                    startSessionTimer();
-                    setTimeout(() => loadDashboard(), 500);
-                } else {
-                    showToast(result.error || 'Registration failed', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Registration error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        async function forgotPassword(event) {
-            if (event) event.preventDefault();
-            
-            const email = document.getElementById('forgotEmail').value.trim();
-            const submitBtn = event ? event.target : document.querySelector('#forgotPasswordForm .btn-primary');
-            
-            if (!email) {
-                showToast('Please enter your email address', 'error');
-                return;
-            }
-            
-            const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-            if (!emailRegex.test(email)) {
-                showToast('Please enter a valid email address', 'error');
-                return;
-            }
-            
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const response = await fetch('/api/auth/forgot-password', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({email})
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast('Password reset link sent to your email. Check your inbox.', 'success');
-                    setTimeout(() => showLogin(), 2000);
-                } else {
-                    showToast(result.error || 'Failed to send reset link', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Forgot password error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        function confirmLogout() {
-            showConfirmDialog(
-                'Confirm Logout',
-                'Are you sure you want to logout?',
-                () => logout(),
-                'Logout',
-                'Cancel'
-            );
-        }
-        
-        async function logout() {
-            try {
-                // Call logout API
-                if (authToken) {
-                    await fetch('/api/auth/logout', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                            'Authorization': 'Bearer ' + authToken
-                        }
-                    });
-                }
-            } catch (error) {
-                console.error('Logout API error:', error);
-            } finally {
-                // Clear session data
-                authToken = null;
-                currentUser = null;
-                localStorage.removeItem('authToken');
-                
-                // Clear timers
-                if (sessionTimer) clearTimeout(sessionTimer);
-                if (sessionWarningTimer) clearTimeout(sessionWarningTimer);
-                
-                // Reset UI
-                document.getElementById('authSection').style.display = 'block';
-                document.getElementById('dashboard').classList.remove('active');
-                document.getElementById('dashboard').style.display = 'none';
-                document.getElementById('userMenu').style.display = 'none';
-                document.getElementById('sessionWarning').classList.remove('active');
-                
-                // Hide all sections
-                document.querySelectorAll('.dashboard').forEach(el => el.style.display = 'none');
-                
-                showToast('You have been logged out successfully', 'info');
-            }
-        }
-        
-        function showSection(section) {
-            // Hide all sections
-            document.querySelectorAll('.dashboard').forEach(el => el.style.display = 'none');
-            document.querySelectorAll('.nav-item').forEach(el => el.classList.remove('active'));
-            
-            // Show selected section and load data
-            if (section === 'dashboard') {
-                document.getElementById('dashboard').style.display = 'block';
-                document.querySelectorAll('.nav-item')[0].classList.add('active');
-                // Dashboard loads stats automatically on init
-            } else if (section === 'properties') {
-                document.getElementById('properties').style.display = 'block';
-                document.querySelectorAll('.nav-item')[1].classList.add('active');
-                loadProperties(); // Load properties when viewing this page
-            } else if (section === 'quotes') {
-                document.getElementById('quotes').style.display = 'block';
-                document.querySelectorAll('.nav-item')[2].classList.add('active');
-                loadSavedQuotes(); // Load saved quotes
-            } else if (section === 'settings') {
-                document.getElementById('settings').style.display = 'block';
-                document.querySelectorAll('.nav-item')[3].classList.add('active');
-            } else if (section === 'profile') {
-                document.getElementById('profile').style.display = 'block';
-                document.querySelectorAll('.nav-item')[4].classList.add('active');
-                loadRooferProfile();
-            }
-            
-            currentSection = section;
-        }
-        
-        function handleProfileStatusClick() {
-            const statusElement = document.getElementById('profileStatus');
-            if (statusElement && statusElement.textContent.includes('Incomplete')) {
-                showSection('profile');
-            }
-        }
-        
-        async function loadDashboard() {
-            try {
-                // Load user info
-                const userResponse = await fetch('/api/profile', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const userResult = await userResponse.json();
-                
-                if (userResult.success) {
-                    currentUser = userResult.user;
-                    document.getElementById('userName').textContent = currentUser.business_name;
-                    document.getElementById('userAvatar').textContent = currentUser.business_name.charAt(0).toUpperCase();
-                    document.getElementById('userMenu').style.display = 'flex';
-                    
-                    // Populate profile form
-                    document.getElementById('profileBusinessName').value = currentUser.business_name;
-                    document.getElementById('profileEmail').value = currentUser.email;
-                    document.getElementById('profileLicenseId').value = currentUser.license_id;
-                    document.getElementById('profileZipCode').value = currentUser.primary_zip_code;
-                    
-                    // Make email readonly
-                    document.getElementById('profileEmail').setAttribute('readonly', 'true');
-                }
-                
-                // Load roofer profile to check status
-                await loadRooferProfile();
-                
-                // Load properties
-                await loadProperties();
-                
-                // Load quotes count
-                try {
-                    const quotesResponse = await fetch('/api/quotes', {
-                        headers: {'Authorization': 'Bearer ' + authToken}
-                    });
-                    const quotesResult = await quotesResponse.json();
-                    if (quotesResult.success && quotesResult.quotes) {
-                        document.getElementById('totalQuotes').textContent = quotesResult.quotes.length;
-                    }
-                } catch (error) {
-                    console.log('No quotes yet');
-                }
-                
-                // Show dashboard
-                document.getElementById('authSection').style.display = 'none';
-                document.getElementById('dashboard').classList.add('active');
-                document.getElementById('dashboard').style.display = 'block';
-                
-            } catch (error) {
-                console.error('Error loading dashboard:', error);
-                showToast('Error loading dashboard data', 'error');
-                logout();
-            }
-        }
-        
-        async function loadProperties(page = 1) {
-            try {
-                const params = new URLSearchParams({
-                    page: page,
-                    per_page: 20
-                });
-                
-                // Add filters
-                const searchAddress = document.getElementById('searchAddress').value;
-                const material = document.getElementById('filterMaterial').value;
-                const minArea = document.getElementById('minArea').value;
-                const maxArea = document.getElementById('maxArea').value;
-                const minPitch = document.getElementById('minPitch').value;
-                const maxPitch = document.getElementById('maxPitch').value;
-                const minCondition = document.getElementById('minCondition').value;
-                const maxCondition = document.getElementById('maxCondition').value;
-                
-                if (searchAddress) params.append('search', searchAddress);
-                if (material) params.append('material', material);
-                if (minArea) params.append('min_area', minArea);
-                if (maxArea) params.append('max_area', maxArea);
-                if (minPitch) params.append('min_pitch', minPitch);
-                if (maxPitch) params.append('max_pitch', maxPitch);
-                if (minCondition) params.append('condition_min', minCondition);
-                if (maxCondition) params.append('condition_max', maxCondition);
-                
-                const response = await fetch(`/api/properties?${params}`, {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success) {
-                    document.getElementById('totalProperties').textContent = result.pagination.total_properties;
-                    document.getElementById('propertiesStats').textContent = 
-                        `Showing ${result.properties.length} of ${result.pagination.total_properties} properties`;
-                    
-                    displayProperties(result.properties);
-                    updatePropertiesPagination(result.pagination);
-                }
-            } catch (error) {
-                console.error('Error loading properties:', error);
-            }
-        }
-        
-        function displayProperties(properties) {
-            const container = document.getElementById('propertiesTable');
-            
-            if (properties.length === 0) {
-                container.innerHTML = '<div class="loading">No properties found matching your filters.</div>';
-                return;
-            }
-            
-            const tableHTML = `
-                <table class="properties-table">
-                    <thead>
-                        <tr>
-                            <th>Address</th>
-                            <th>Material</th>
-                            <th>Area (sqft)</th>
-                            <th>Pitch (°)</th>
-                            <th>Condition</th>
-                            <th>Height (ft)</th>
-                            <th>Layers</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        ${properties.map(prop => `
-                            <tr onclick="showPropertyDetails('${prop.address.replace(/'/g, "\\'")}')">
-                                <td><a href="#" class="property-link">${prop.address || 'N/A'}</a></td>
-                                <td>${prop.roof_material || 'N/A'}</td>
-                                <td>${prop.roof_area ? prop.roof_area.toFixed(0) : 'N/A'}</td>
-                                <td>${prop.avg_pitch ? prop.avg_pitch.toFixed(1) : (prop.pitch ? prop.pitch.toFixed(1) : 'N/A')}</td>
-                                <td>${prop.avg_condition ? prop.avg_condition.toFixed(1) : (prop['roof condition summary score'] || 'N/A')}</td>
-                                <td>${prop.avg_height ? prop.avg_height.toFixed(1) : (prop['height (ft)'] ? prop['height (ft)'].toFixed(1) : 'N/A')}</td>
-                                <td>${prop.roof_layers || 1}</td>
-                            </tr>
-                        `).join('')}
-                    </tbody>
-                </table>
-            `;
-            
-            container.innerHTML = tableHTML;
-        }
-        
-        
-        function updatePropertiesPagination(pagination) {
-            const container = document.getElementById('propertiesPagination');
-            const prevBtn = document.getElementById('prevPageBtn');
-            const nextBtn = document.getElementById('nextPageBtn');
-            const pageInfo = document.getElementById('pageInfo');
-            
-            if (pagination.total_pages > 1) {
-                container.style.display = 'flex';
-                prevBtn.disabled = !pagination.has_prev;
-                nextBtn.disabled = !pagination.has_next;
-                pageInfo.textContent = `Page ${pagination.page} of ${pagination.total_pages}`;
-            } else {
-                container.style.display = 'none';
-            }
-        }
-        
-        function previousPage() {
-            if (currentPage > 1) {
-                currentPage--;
-                loadProperties(currentPage);
-            }
-        }
-        
-        function nextPage() {
-            currentPage++;
-            loadProperties(currentPage);
-        }
-        
-        // Load Saved Quotes
-        async function loadSavedQuotes() {
-            try {
-                const response = await fetch('/api/quotes/saved', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success) {
-                    savedQuotesArray = result.quotes; // Store globally
-                    document.getElementById('totalQuotes').textContent = result.quotes.length;
-                    document.getElementById('savedQuotesStats').textContent = 
-                        `${result.quotes.length} saved ${result.quotes.length === 1 ? 'quote' : 'quotes'}`;
-                    displaySavedQuotes(result.quotes);
-                } else {
-                    savedQuotesArray = [];
-                    document.getElementById('savedQuotesTable').innerHTML = '<div class="loading">No saved quotes yet.</div>';
-                }
-            } catch (error) {
-                console.error('Error loading saved quotes:', error);
-                savedQuotesArray = [];
-                document.getElementById('savedQuotesTable').innerHTML = '<div class="loading">No saved quotes yet. Browse properties to create some!</div>';
-            }
-        }
-        
-        function displaySavedQuotes(quotes) {
-            const container = document.getElementById('savedQuotesTable');
-            
-            if (quotes.length === 0) {
-                container.innerHTML = '<div class="loading">No saved quotes yet. Browse properties and click "Save Quote" to add them here!</div>';
-                return;
-            }
-            
-            const tableHTML = `
-                <table class="properties-table">
-                    <thead>
-                        <tr>
-                            <th>Property Address</th>
-                            <th>Material</th>
-                            <th>Area (sqft)</th>
-                            <th>Quote Range</th>
-                            <th>Saved On</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        ${quotes.map((quote, index) => {
-                            const addr = (quote.property_snapshot && quote.property_snapshot.address) || quote.property_address || 'N/A';
-                            const material = (quote.property_snapshot && (quote.property_snapshot.roof_material || quote.property_snapshot.material)) || quote.material || 'N/A';
-                            const areaVal = (quote.property_snapshot && (quote.property_snapshot.roof_area || quote.property_snapshot.area)) || quote.area;
-                            const area = areaVal ? Math.round(areaVal) : 'N/A';
-                            const minQ = (quote.quote_snapshot && quote.quote_snapshot.min_quote) || quote.min_quote;
-                            const maxQ = (quote.quote_snapshot && quote.quote_snapshot.max_quote) || quote.max_quote;
-                            const savedOn = quote.saved_date ? new Date(quote.saved_date).toLocaleDateString() : 'N/A';
-                            return `
-                              <tr>
-                                <td>${addr}</td>
-                                <td>${material}</td>
-                                <td>${area}</td>
-                                <td>$${minQ ? Math.round(minQ).toLocaleString() : 'N/A'} - $${maxQ ? Math.round(maxQ).toLocaleString() : 'N/A'}</td>
-                                <td>${savedOn}</td>
-                                <td>
-                                  <button class="btn btn-sm btn-primary" onclick="viewSavedQuoteDetails(${index})">View Details</button>
-                                  <button class="btn btn-sm btn-success" onclick="downloadPDF('${quote.id}')" style="margin-left: 8px;">📄 PDF</button>
-                                  <button class="btn btn-sm btn-secondary" onclick="deleteSavedQuote('${quote.id}')" style="margin-left: 8px;">Delete</button>
-                                </td>
-                              </tr>`;
-                        }).join('')}
-                    </tbody>
-                </table>
-            `;
-            
-            container.innerHTML = tableHTML;
-        }
-        
-        // Show Property Details Modal
-        function showLoadingShimmer(text = 'Loading...') {
-            const shimmerHTML = `
-                <div id="loadingShimmer" class="loading-shimmer">
-                    <div class="shimmer-box">
-                        <div class="shimmer-spinner"></div>
-                        <div class="shimmer-text">${text}</div>
-                    </div>
-                </div>
-            `;
-            document.body.insertAdjacentHTML('beforeend', shimmerHTML);
-        }
-        
-        function hideLoadingShimmer() {
-            const shimmer = document.getElementById('loadingShimmer');
-            if (shimmer) shimmer.remove();
-        }
-        
-        async function showPropertyDetails(address) {
-            try {
-                showLoadingShimmer('Loading property details...');
-                
-                // Find the property data
-                const params = new URLSearchParams({ search: address, per_page: 1 });
-                const response = await fetch(`/api/properties?${params}`, {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status}`);
-                }
-                
-                const result = await response.json();
-                
-                if (!result.success || result.properties.length === 0) {
-                    hideLoadingShimmer();
-                    showToast('Property not found', 'error');
-                    return;
-                }
-                
-                const property = result.properties[0];
-                
-                // Update shimmer text
-                hideLoadingShimmer();
-                showLoadingShimmer('Generating quote...');
-                
-                // Generate quote for this property
-                const quoteResponse = await fetch('/api/quotes/generate', {
-                    method: 'POST',
-                    headers: {
-                        'Authorization': 'Bearer ' + authToken,
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        addresses: [property.address]
-                    })
-                });
-                
-                hideLoadingShimmer();
-                
-                if (!quoteResponse.ok) {
-                    // Prefer friendly message when profile is missing
-                    if (quoteResponse.status === 400) {
-                        try {
-                            const errJson = await quoteResponse.json();
-                            const msg = errJson && (errJson.error || errJson.message);
-                            if (msg) throw new Error(msg);
-                        } catch (_) {
-                            // fallthrough to generic
-                        }
-                    }
-                    throw new Error(`Quote calculation failed! status: ${quoteResponse.status}`);
-                }
-                
-                const quoteResult = await quoteResponse.json();
-                
-                if (!quoteResult.success || !quoteResult.quotes || quoteResult.quotes.length === 0) {
-                    showToast('Failed to generate quote', 'error');
-                    return;
-                }
-                
-                const quote = quoteResult.quotes[0];
-                showPropertyModal(property, quote);
-                
-            } catch (error) {
-                hideLoadingShimmer();
-                console.error('Error loading property details:', error);
-                showToast('Error: ' + error.message, 'error');
-            }
-        }
-        
-        function generatePropertyAnalysis(property, quote) {
-            const condition = property.avg_condition || property['roof condition summary score'] || 75;
-            const pitch = property.avg_pitch || property.pitch || 20;
-            const layers = property.roof_layers || 1;
-            
-            // Condition Category
-            let conditionCategory, conditionClass;
-            if (condition >= 80) {
-                conditionCategory = 'Excellent';
-                conditionClass = 'status-excellent';
-            } else if (condition >= 60) {
-                conditionCategory = 'Good';
-                conditionClass = 'status-good';
-            } else if (condition >= 40) {
-                conditionCategory = 'Fair';
-                conditionClass = 'status-fair';
-            } else {
-                conditionCategory = 'Poor';
-                conditionClass = 'status-poor';
-            }
-            
-            // Issues & Recommendations
-            let issues = [];
-            let recommendations = [];
-            
-            if (condition < 50) {
-                issues.push('Low condition score indicates potential damage');
-                recommendations.push('Schedule inspection within 3 months');
-                recommendations.push('Consider full roof replacement');
-            } else if (condition < 70) {
-                issues.push('Moderate wear detected');
-                recommendations.push('Schedule inspection within 6 months');
-                recommendations.push('Monitor for leaks or damage');
-            }
-            
-            if (pitch > 30) {
-                issues.push('Steep pitch requires specialized crew');
-                recommendations.push('Use safety equipment and experienced crew');
-            }
-            
-            if (layers > 1) {
-                issues.push(`Multiple layers (${layers}) may require removal`);
-                recommendations.push('Factor in additional removal costs');
-            }
-            
-            if (issues.length === 0) {
-                issues.push('No major issues detected');
-            }
-            if (recommendations.length === 0) {
-                recommendations.push('Standard maintenance schedule recommended');
-            }
-            
-            return `
-                <div class="analysis-item">
-                    <span class="analysis-label">Condition Category</span>
-                    <span class="analysis-badge ${conditionClass}">${conditionCategory} (${condition.toFixed(1)}/100)</span>
-                </div>
-                <div class="analysis-item">
-                    <span class="analysis-label">Potential Issues</span>
-                    <ul class="analysis-list">
-                        ${issues.map(issue => `<li>${issue}</li>`).join('')}
-                    </ul>
-                </div>
-                <div class="analysis-item">
-                    <span class="analysis-label">Recommended Actions</span>
-                    <ul class="analysis-list">
-                        ${recommendations.map(rec => `<li>${rec}</li>`).join('')}
-                    </ul>
-                </div>
-            `;
-        }
-        
-        // Store current property and quote globally for save function
-        let currentPropertyData = null;
-        let currentQuoteData = null;
-        let savedQuotesArray = [];
-        let currentGeneratedQuotes = [];
-        
-        function showPropertyModal(property, quote) {
-            // Store in global variables
-            currentPropertyData = property;
-            currentQuoteData = quote;
-            
-            const modalHTML = `
-                <div id="propertyModal" class="modal-overlay" onclick="closePropertyModal(event)">
-                    <div class="modal-content" onclick="event.stopPropagation()">
-                        <div class="modal-header">
-                            <h2>Property Details</h2>
-                            <button class="btn-close" onclick="closePropertyModal()">×</button>
-                        </div>
-                        <div class="modal-body">
-                            <div class="property-details-grid">
-                                <div class="detail-section">
-                                    <h3>Property Information</h3>
-                                    <div class="info-item">
-                                        <span class="info-label">Address</span>
-                                        <span class="info-value">${property.address || 'N/A'}</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Roof Material</span>
-                                        <span class="info-value">${property.roof_material ? property.roof_material.charAt(0).toUpperCase() + property.roof_material.slice(1) : 'N/A'}</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Roof Area</span>
-                                        <span class="info-value">${property.roof_area ? property.roof_area.toFixed(0) + ' sqft' : 'N/A'}</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Pitch</span>
-                                        <span class="info-value">${property.avg_pitch ? property.avg_pitch.toFixed(1) : (property.pitch ? property.pitch.toFixed(1) : 'N/A')}°</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Condition Score</span>
-                                        <span class="info-value">${property.avg_condition ? property.avg_condition.toFixed(1) : (property['roof condition summary score'] || 'N/A')}/100</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Height</span>
-                                        <span class="info-value">${property.avg_height ? property.avg_height.toFixed(1) : (property['height (ft)'] ? property['height (ft)'].toFixed(1) : 'N/A')} ft</span>
-                                    </div>
-                                    <div class="info-item">
-                                        <span class="info-label">Roof Layers</span>
-                                        <span class="info-value">${property.roof_layers || 1}</span>
-                                    </div>
-                                </div>
-                                
-                                <div class="detail-section">
-                                    <h3>Quote Details</h3>
-                                    <div class="quote-summary">
-                                        <div class="quote-range">
-                                            <h4>Estimated Cost Range</h4>
-                                            <div class="quote-amounts">
-                                                <div class="quote-amount">
-                                                    <span class="amount-label">Minimum</span>
-                                                    <span class="amount-value">$${quote.min_quote ? Math.round(quote.min_quote).toLocaleString() : 'N/A'}</span>
-                                                </div>
-                                                <div class="quote-amount">
-                                                    <span class="amount-label">Maximum</span>
-                                                    <span class="amount-value">$${quote.max_quote ? Math.round(quote.max_quote).toLocaleString() : 'N/A'}</span>
-                                                </div>
-                                            </div>
-                                        </div>
-                                        <div class="info-item">
-                                            <span class="info-label">Recommended Crew Size</span>
-                                            <span class="info-value">${quote.crew_size_used || 'N/A'} workers</span>
-                                        </div>
-                                        ${quote.notes ? `
-                                        <div class="detail-row">
-                                            <span class="detail-label">Notes:</span>
-                                            <span class="detail-value">${quote.notes}</span>
-                                        </div>
-                                        ` : ''}
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <!-- Property Analysis Section -->
-                            <div class="analysis-section">
-                                <h3>🔍 Property Analysis</h3>
-                                <div class="analysis-content">
-                                    ${generatePropertyAnalysis(property, quote)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="modal-footer">
-                            <button class="btn btn-secondary" onclick="closePropertyModal()">Close</button>
-                            <button class="btn btn-success" onclick="downloadPDFFromModal()">📄 Download PDF</button>
-                            <button class="btn btn-primary" onclick="saveCurrentQuote()">💾 Save Quote</button>
-                        </div>
-                    </div>
-                </div>
-            `;
-            
-            document.body.insertAdjacentHTML('beforeend', modalHTML);
-        }
-        
-        function closePropertyModal(event) {
-            if (!event || event.target.classList.contains('modal-overlay')) {
-                const modal = document.getElementById('propertyModal');
-                if (modal) modal.remove();
-            }
-        }
-        
-        // Function to save the currently displayed property quote
-        async function saveCurrentQuote() {
-            if (!currentPropertyData || !currentQuoteData) {
-                showToast('No quote data available', 'error');
-                return;
-            }
-            
-            console.log('💾 Saving quote...');
-            console.log('Current Property Data:', currentPropertyData);
-            console.log('Current Quote Data:', currentQuoteData);
-            
-            // Build the payload
-            const payload = {
-                property_address: currentPropertyData.address || currentPropertyData.Address || currentPropertyData['Address'] || 'Unknown',
-                material: currentPropertyData.roof_material || currentPropertyData.Material || currentPropertyData['Roof Material'] || 'Unknown',
-                area: currentPropertyData.roof_area || currentPropertyData.Area || currentPropertyData['Area (sqft)'] || 0,
-                min_quote: currentQuoteData.min_quote,
-                max_quote: currentQuoteData.max_quote,
-                crew_size: currentQuoteData.crew_size_used || 3,
-                time_estimate: 0,
-                notes: currentQuoteData.estimated_quote_range || '',
-                // snapshots for rich Saved Quotes details
-                property_snapshot: currentPropertyData,
-                quote_snapshot: currentQuoteData
-            };
-            
-            console.log('📤 Payload being sent:', payload);
-            
-            try {
-                const response = await fetch('/api/quotes/save', {
-                    method: 'POST',
-                    headers: {
-                        'Authorization': 'Bearer ' + authToken,
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(payload)
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast('Quote saved successfully!', 'success');
-                    closePropertyModal();
-                    // Refresh saved quotes count
-                    loadSavedQuotes();
-                } else {
-                    showToast(result.message || 'Failed to save quote', 'error');
-                }
-            } catch (error) {
-                console.error('Error saving quote:', error);
-                showToast('Error saving quote', 'error');
-            }
-        }
-        
-        // Legacy function for saved quotes view
-        async function saveQuote(property, quote) {
-            currentPropertyData = property;
-            currentQuoteData = quote;
-            await saveCurrentQuote();
-        }
-        
-        function viewSavedQuoteDetails(index) {
-            const quote = savedQuotesArray[index];
-            if (!quote) {
-                showToast('Quote not found', 'error');
-                return;
-            }
-            
-            // Reconstruct property and quote objects from saved quote
-            // Prefer stored snapshots; fall back to minimal fields
-            const property = quote.property_snapshot ? quote.property_snapshot : {
-                address: quote.property_address,
-                roof_material: quote.material,
-                roof_area: quote.area
-            };
-            
-            const quoteData = quote.quote_snapshot ? quote.quote_snapshot : {
-                min_quote: quote.min_quote,
-                max_quote: quote.max_quote,
-                crew_size_used: quote.crew_size,
-                estimated_quote_range: quote.notes
-            };
-            
-            showPropertyModal(property, quoteData);
-        }
-        
-        async function deleteSavedQuote(quoteId) {
-            if (!confirm('Are you sure you want to delete this quote?')) return;
-            
-            console.log('Deleting quote with ID:', quoteId);
-            
-            try {
-                const response = await fetch(`/api/quotes/${quoteId}`, {
-                    method: 'DELETE',
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast('Quote deleted successfully', 'success');
-                    loadSavedQuotes();
-                } else {
-                    showToast('Failed to delete quote', 'error');
-                }
-            } catch (error) {
-                console.error('Error deleting quote:', error);
-                showToast('Error deleting quote', 'error');
-            }
-        }
-        
-        async function downloadPDF(quoteId, quoteData = null) {
-            try {
-                showToast('Generating PDF...', 'info');
-                
-                const url = `/api/quotes/${quoteId}/pdf`;
-                const response = await fetch(url, {
-                    method: 'GET',
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                
-                if (!response.ok) {
-                    const error = await response.json().catch(() => ({error: 'Failed to generate PDF'}));
-                    throw new Error(error.error || 'Failed to generate PDF');
-                }
-                
-                // Get PDF blob
-                const blob = await response.blob();
-                const url_blob = window.URL.createObjectURL(blob);
-                
-                // Create download link
-                const a = document.createElement('a');
-                a.href = url_blob;
-                a.download = `Roofing_Estimate_${quoteId}_${new Date().toISOString().split('T')[0]}.pdf`;
-                document.body.appendChild(a);
-                a.click();
-                
-                // Cleanup
-                window.URL.revokeObjectURL(url_blob);
-                document.body.removeChild(a);
-                
-                showToast('PDF downloaded successfully!', 'success');
-            } catch (error) {
-                console.error('Error downloading PDF:', error);
-                showToast('Failed to download PDF: ' + error.message, 'error');
-            }
-        }
-        
-        async function downloadPDFFromData(quote, quoteId = null) {
-            try {
-                showToast('Generating PDF...', 'info');
-                
-                const response = await fetch('/api/quotes/generate-pdf', {
-                    method: 'POST',
-                    headers: {
-                        'Authorization': 'Bearer ' + authToken,
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify({
-                        quote: quote
-                    })
-                });
-                
-                if (!response.ok) {
-                    const error = await response.json().catch(() => ({error: 'Failed to generate PDF'}));
-                    throw new Error(error.error || 'Failed to generate PDF');
-                }
-                
-                // Get PDF blob
-                const blob = await response.blob();
-                const url_blob = window.URL.createObjectURL(blob);
-                
-                // Create download link
-                const a = document.createElement('a');
-                a.href = url_blob;
-                const address = quote.address || 'quote';
-                const safeAddress = address.replace(/[^a-z0-9]/gi, '_').substring(0, 30);
-                a.download = `Roofing_Estimate_${safeAddress}_${new Date().toISOString().split('T')[0]}.pdf`;
-                document.body.appendChild(a);
-                a.click();
-                
-                // Cleanup
-                window.URL.revokeObjectURL(url_blob);
-                document.body.removeChild(a);
-                
-                showToast('PDF downloaded successfully!', 'success');
-            } catch (error) {
-                console.error('Error downloading PDF:', error);
-                showToast('Failed to download PDF: ' + error.message, 'error');
-            }
-        }
-        
-        async function downloadPDFFromIndex(index) {
-            // Get quotes from the global array
-            if (!currentGeneratedQuotes || !currentGeneratedQuotes[index]) {
-                showToast('Quote not found', 'error');
-                return;
-            }
-            
-            await downloadPDFFromData(currentGeneratedQuotes[index], index);
-        }
-        
-        async function downloadPDFFromModal() {
-            if (!currentPropertyData || !currentQuoteData) {
-                showToast('No quote data available', 'error');
-                return;
-            }
-            
-            // Combine property and quote data into a QuoteResult-like object
-            const quoteForPDF = {
-                address: currentPropertyData.address || 'Unknown Address',
-                roof_material: currentPropertyData.roof_material || 'asphalt',
-                pitch: currentPropertyData.pitch || currentPropertyData.avg_pitch || 15,
-                estimated_quote_range: currentQuoteData.estimated_quote_range || `$${currentQuoteData.min_quote || 0} - $${currentQuoteData.max_quote || 0}`,
-                min_quote: currentQuoteData.min_quote || 0,
-                max_quote: currentQuoteData.max_quote || 0,
-                region_multiplier: currentQuoteData.region_multiplier || 1.0,
-                crew_size_used: currentQuoteData.crew_size_used || 3,
-                roof_area: currentPropertyData.roof_area || 0,
-                material_cost: currentQuoteData.material_cost || 0,
-                labor_cost: currentQuoteData.labor_cost || 0,
-                repair_cost: currentQuoteData.repair_cost || 0,
-                subtotal: currentQuoteData.subtotal || 0,
-                overhead: currentQuoteData.overhead || 0,
-                profit: currentQuoteData.profit || 0,
-                total: currentQuoteData.total || (currentQuoteData.min_quote || 0)
-            };
-            
-            await downloadPDFFromData(quoteForPDF);
-        }
-        
-        function applyFilters() {
-            currentPage = 1;
-            showToast('Applying filters...', 'info');
-            loadProperties();
-        }
-        
-        function clearFilters() {
-            document.getElementById('searchAddress').value = '';
-            document.getElementById('filterMaterial').value = '';
-            document.getElementById('minArea').value = '';
-            document.getElementById('maxArea').value = '';
-            document.getElementById('minPitch').value = '';
-            document.getElementById('maxPitch').value = '';
-            document.getElementById('minCondition').value = '';
-            document.getElementById('maxCondition').value = '';
-            currentPage = 1;
-            showToast('Filters cleared', 'info');
-            loadProperties();
-        }
-        
-        async function saveSettings(event) {
-            if (event) event.preventDefault();
-            
-            const submitBtn = event ? event.target : document.querySelector('#settings .btn-primary');
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const settings = {
-                    notifications: document.getElementById('notifications').checked,
-                    email_alerts: document.getElementById('emailAlerts').checked,
-                    auto_save: document.getElementById('autoSave').checked
-                };
-                
-                const response = await fetch('/api/settings', {
-                    method: 'PUT',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + authToken
-                    },
-                    body: JSON.stringify(settings)
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast('Settings saved successfully!', 'success');
-                } else {
-                    showToast(result.error || 'Error saving settings', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Save settings error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        async function updateProfile(event) {
-            if (event) event.preventDefault();
-            
-            const businessName = document.getElementById('profileBusinessName').value.trim();
-            const licenseId = document.getElementById('profileLicenseId').value.trim();
-            const zipCode = document.getElementById('profileZipCode').value.trim();
-            const submitBtn = event ? event.target : document.querySelector('#profile .btn-primary');
-            
-            // Validation
-            if (!businessName || !licenseId || !zipCode) {
-                showToast('Please fill in all fields', 'error');
-                return;
-            }
-            
-            const zipRegex = /^\d{5}$/;
-            if (!zipRegex.test(zipCode)) {
-                showToast('Please enter a valid 5-digit ZIP code', 'error');
-                return;
-            }
-            
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const profileData = {
-                    business_name: businessName,
-                    license_id: licenseId,
-                    primary_zip_code: zipCode
-                };
-                
-                const response = await fetch('/api/profile', {
-                    method: 'PUT',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + authToken
-                    },
-                    body: JSON.stringify(profileData)
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    // Update current user info
-                    currentUser.business_name = businessName;
-                    currentUser.license_id = licenseId;
-                    currentUser.primary_zip_code = zipCode;
-                    
-                    // Update display
-                    document.getElementById('userName').textContent = businessName;
-                    document.getElementById('userAvatar').textContent = businessName.charAt(0).toUpperCase();
-                    
-                    showToast('Profile updated successfully!', 'success');
-                } else {
-                    showToast(result.error || 'Error updating profile', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Update profile error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        // Roofer Profile Functions
-        async function loadRooferProfile() {
-            try {
-                const response = await fetch('/api/profile/roofer', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success && result.profile) {
-                    const profile = result.profile;
-                    
-                    // Check if profile is actually saved (not just default values)
-                    // A saved profile will have all required fields set to non-zero values
-                    const isComplete = result.profile_exists && 
-                                      profile.labor_rate && profile.labor_rate > 0 && 
-                                      profile.daily_productivity && profile.daily_productivity > 0 && 
-                                      profile.base_crew_size && profile.base_crew_size > 0 && 
-                                      profile.overhead_percent !== null && 
-                                      profile.profit_margin !== null;
-                    
-                    // Update profile status
-                    const statusElement = document.getElementById('profileStatus');
-                    const statusCard = document.getElementById('profileStatusCard');
-                    if (isComplete) {
-                        statusElement.textContent = 'Complete ✓';
-                        statusElement.style.color = '#4caf50';
-                        if (statusCard) {
-                            statusCard.style.cursor = 'default';
-                            statusCard.onclick = null;
-                        }
-                    } else {
-                        statusElement.textContent = 'Incomplete - Click to complete';
-                        statusElement.style.color = '#ff9800';
-                        if (statusCard) {
-                            statusCard.style.cursor = 'pointer';
-                        }
-                    }
-                    
-                    // Labor Information
-                    document.getElementById('profileLaborRate').value = profile.labor_rate || 45;
-                    document.getElementById('profileDailyProductivity').value = profile.daily_productivity || 2500;
-                    document.getElementById('profileBaseCrewSize').value = profile.base_crew_size || 3;
-                    document.getElementById('profileCrewScalingRule').value = profile.crew_scaling_rule || 'size_and_complexity';
-                    
-                    // Slope Adjustments
-                    const slope = profile.slope_cost_adjustment || {};
-                    document.getElementById('profileSlopeFlatLow').value = slope.flat_low || 0;
-                    document.getElementById('profileSlopeModerate').value = slope.moderate || 0.1;
-                    document.getElementById('profileSlopeSteep').value = slope.steep || 0.2;
-                    document.getElementById('profileSlopeVerySteep').value = slope.very_steep || 0.3;
-                    
-                    // Material Costs
-                    const materials = profile.material_costs || {};
-                    document.getElementById('profileMaterialAsphalt').value = materials.asphalt || 4.0;
-                    document.getElementById('profileMaterialShingle').value = materials.shingle || 4.5;
-                    document.getElementById('profileMaterialMetal').value = materials.metal || 7.0;
-                    document.getElementById('profileMaterialTile').value = materials.tile || 8.0;
-                    document.getElementById('profileMaterialConcrete').value = materials.concrete || 6.0;
-                    
-                    // Replacement Costs
-                    const replacement = profile.replacement_costs || {};
-                    document.getElementById('profileReplacementAsphalt').value = replacement.asphalt || 45;
-                    document.getElementById('profileReplacementShingle').value = replacement.shingle || 50;
-                    document.getElementById('profileReplacementMetal').value = replacement.metal || 90;
-                    document.getElementById('profileReplacementTile').value = replacement.tile || 70;
-                    document.getElementById('profileReplacementConcrete').value = replacement.concrete || 60;
-                    
-                    // Business Margins
-                    document.getElementById('profileOverhead').value = profile.overhead_percent || 0.1;
-                    document.getElementById('profileProfit').value = profile.profit_margin || 0.2;
-                } else {
-                    // No profile found, mark as incomplete
-                    const statusElement = document.getElementById('profileStatus');
-                    const statusCard = document.getElementById('profileStatusCard');
-                    statusElement.textContent = 'Incomplete - Click to complete';
-                    statusElement.style.color = '#ff9800';
-                    if (statusCard) {
-                        statusCard.style.cursor = 'pointer';
-                    }
-                }
-            } catch (error) {
-                console.error('Error loading roofer profile:', error);
-                // Mark as incomplete
-                const statusElement = document.getElementById('profileStatus');
-                const statusCard = document.getElementById('profileStatusCard');
-                statusElement.textContent = 'Incomplete - Click to complete';
-                statusElement.style.color = '#ff9800';
-                if (statusCard) {
-                    statusCard.style.cursor = 'pointer';
-                }
-            }
-        }
-        
-        async function saveRooferProfile(event) {
-            if (event) event.preventDefault();
-            
-            const submitBtn = event ? event.target : document.querySelector('#profile .btn-primary');
-            setButtonLoading(submitBtn, true);
-            
-            try {
-                const profileData = {
-                    labor_rate: parseFloat(document.getElementById('profileLaborRate').value),
-                    daily_productivity: parseInt(document.getElementById('profileDailyProductivity').value),
-                    base_crew_size: parseInt(document.getElementById('profileBaseCrewSize').value),
-                    crew_scaling_rule: document.getElementById('profileCrewScalingRule').value,
-                    slope_cost_adjustment: {
-                        flat_low: parseFloat(document.getElementById('profileSlopeFlatLow').value),
-                        moderate: parseFloat(document.getElementById('profileSlopeModerate').value),
-                        steep: parseFloat(document.getElementById('profileSlopeSteep').value),
-                        very_steep: parseFloat(document.getElementById('profileSlopeVerySteep').value)
-                    },
-                    material_costs: {
-                        asphalt: parseFloat(document.getElementById('profileMaterialAsphalt').value),
-                        shingle: parseFloat(document.getElementById('profileMaterialShingle').value),
-                        metal: parseFloat(document.getElementById('profileMaterialMetal').value),
-                        tile: parseFloat(document.getElementById('profileMaterialTile').value),
-                        concrete: parseFloat(document.getElementById('profileMaterialConcrete').value)
-                    },
-                    replacement_costs: {
-                        asphalt: parseFloat(document.getElementById('profileReplacementAsphalt').value),
-                        shingle: parseFloat(document.getElementById('profileReplacementShingle').value),
-                        metal: parseFloat(document.getElementById('profileReplacementMetal').value),
-                        tile: parseFloat(document.getElementById('profileReplacementTile').value),
-                        concrete: parseFloat(document.getElementById('profileReplacementConcrete').value)
-                    },
-                    overhead_percent: parseFloat(document.getElementById('profileOverhead').value),
-                    profit_margin: parseFloat(document.getElementById('profileProfit').value)
-                };
-                
-                // Also update basic profile info
-                const businessName = document.getElementById('profileBusinessName').value.trim();
-                const licenseId = document.getElementById('profileLicenseId').value.trim();
-                const zipCode = document.getElementById('profileZipCode').value.trim();
-                
-                // Update basic profile first
-                await fetch('/api/profile', {
-                    method: 'PUT',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + authToken
-                    },
-                    body: JSON.stringify({
-                        business_name: businessName,
-                        license_id: licenseId,
-                        primary_zip_code: zipCode
-                    })
-                });
-                
-                // Then save roofer profile
-                const response = await fetch('/api/profile/roofer', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + authToken
-                    },
-                    body: JSON.stringify(profileData)
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast('Business profile saved successfully!', 'success');
-                } else {
-                    showToast(result.error || 'Error saving profile', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Save roofer profile error:', error);
-            } finally {
-                setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        // Quote Functions
-        async function generateAllQuotes(event) {
-            if (event) event.preventDefault();
-            
-            const submitBtn = event ? event.target : null;
-            if (submitBtn) setButtonLoading(submitBtn, true);
-            
-            try {
-                // Check if profile is complete first
-                const profileResponse = await fetch('/api/profile/roofer', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const profileResult = await profileResponse.json();
-                
-                if (!profileResult.success || !profileResult.profile) {
-                    showToast('Please complete your business profile before generating quotes', 'warning');
-                    showSection('profile');
-                    if (submitBtn) setButtonLoading(submitBtn, false);
-                    return;
-                }
-                
-                const profile = profileResult.profile;
-                const isComplete = profile.labor_rate && profile.daily_productivity && 
-                                  profile.base_crew_size && profile.overhead_percent && 
-                                  profile.profit_margin;
-                
-                if (!isComplete) {
-                    showToast('Please complete your business profile before generating quotes', 'warning');
-                    showSection('profile');
-                    if (submitBtn) setButtonLoading(submitBtn, false);
-                    return;
-                }
-                
-                showToast('Generating quotes, please wait...', 'info');
-                
-                const response = await fetch('/api/quotes/generate', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'Authorization': 'Bearer ' + authToken
-                    },
-                    body: JSON.stringify({})
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showToast(`Generated ${result.count} quotes successfully!`, 'success');
-                    // Update total quotes counter
-                    document.getElementById('totalQuotes').textContent = result.count;
-                    
-                    // Show the generated quotes in the properties table
-                    await loadGeneratedQuotes();
-                } else {
-                    showToast(result.error || 'Error generating quotes', 'error');
-                }
-            } catch (error) {
-                showToast('Network error. Please try again.', 'error');
-                console.error('Generate quotes error:', error);
-            } finally {
-                if (submitBtn) setButtonLoading(submitBtn, false);
-            }
-        }
-        
-        async function loadGeneratedQuotes() {
-            try {
-                const response = await fetch('/api/quotes', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success && result.quotes && result.quotes.length > 0) {
-                    displayQuotesInProperties(result.quotes);
-                }
-            } catch (error) {
-                console.error('Error loading quotes:', error);
-            }
-        }
-        
-        function displayQuotesInProperties(quotes) {
-            const container = document.getElementById('propertiesTable');
-            
-            if (quotes.length === 0) {
-                container.innerHTML = '<div class="loading">No quotes generated yet.</div>';
-                return;
-            }
-            
-            const tableHTML = `
-                <table class="properties-table">
-                    <thead>
-                        <tr>
-                            <th>Address</th>
-                            <th>Material</th>
-                            <th>Area (sqft)</th>
-                            <th>Pitch (°)</th>
-                            <th>Crew Size</th>
-                            <th>Quote Range</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        ${quotes.map(quote => `
-                            <tr onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')">
-                                <td><a href="#" class="property-link">${quote.address || 'N/A'}</a></td>
-                                <td>${quote.roof_material || 'N/A'}</td>
-                                <td>${quote.roof_area ? quote.roof_area.toFixed(0) : 'N/A'}</td>
-                                <td>${quote.pitch ? quote.pitch.toFixed(1) : 'N/A'}</td>
-                                <td>${quote.crew_size_used || 'N/A'}</td>
-                                <td><strong>${quote.estimated_quote_range || 'N/A'}</strong></td>
-                            </tr>
-                        `).join('')}
-                    </tbody>
-                </table>
-            `;
-            
-            container.innerHTML = tableHTML;
-        }
-        
-        async function showQuoteDetails(address) {
-            try {
-                const response = await fetch('/api/quotes', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success) {
-                    const quote = result.quotes.find(q => q.address === address);
-                    if (!quote) return;
-                    
-                    const modalBody = document.getElementById('modalBody');
-                    
-                    modalBody.innerHTML = `
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 24px;">
-                            <div>
-                                <h4 style="margin-bottom: 16px; color: #1d1d1f;">Quote Details</h4>
-                                <p><strong>Address:</strong> ${quote.address}</p>
-                                <p><strong>Material:</strong> ${quote.roof_material || 'N/A'}</p>
-                                <p><strong>Area:</strong> ${quote.roof_area ? quote.roof_area.toFixed(0) + ' sqft' : 'N/A'}</p>
-                                <p><strong>Pitch:</strong> ${quote.pitch ? quote.pitch.toFixed(1) + '°' : 'N/A'}</p>
-                                <p><strong>Crew Size:</strong> ${quote.crew_size_used || 'N/A'}</p>
-                                <p><strong>Region Multiplier:</strong> ${quote.region_multiplier ? quote.region_multiplier.toFixed(2) + 'x' : 'N/A'}</p>
-                            </div>
-                            <div>
-                                <h4 style="margin-bottom: 16px; color: #1d1d1f;">Cost Breakdown</h4>
-                                <p><strong>Material Cost:</strong> $${quote.material_cost ? quote.material_cost.toFixed(2) : 'N/A'}</p>
-                                <p><strong>Labor Cost:</strong> $${quote.labor_cost ? quote.labor_cost.toFixed(2) : 'N/A'}</p>
-                                <p><strong>Repair Cost:</strong> $${quote.repair_cost ? quote.repair_cost.toFixed(2) : 'N/A'}</p>
-                                <p><strong>Subtotal:</strong> $${quote.subtotal ? quote.subtotal.toFixed(2) : 'N/A'}</p>
-                                <p><strong>Overhead:</strong> $${quote.overhead ? quote.overhead.toFixed(2) : 'N/A'}</p>
-                                <p><strong>Profit:</strong> $${quote.profit ? quote.profit.toFixed(2) : 'N/A'}</p>
-                                <p style="font-size: 18px; margin-top: 16px;"><strong>Total Quote Range:</strong><br>${quote.estimated_quote_range || 'N/A'}</p>
-                            </div>
-                        </div>
-                    `;
-                    
-                    document.getElementById('propertyModal').style.display = 'flex';
-                }
-            } catch (error) {
-                console.error('Error loading quote details:', error);
-            }
-        }
-        
-        async function loadQuotes() {
-            try {
-                const response = await fetch('/api/quotes', {
-                    headers: {'Authorization': 'Bearer ' + authToken}
-                });
-                const result = await response.json();
-                
-                if (result.success) {
-                    displayQuotes(result.quotes);
-                } else {
-                    showToast('Error loading quotes', 'error');
-                }
-            } catch (error) {
-                console.error('Error loading quotes:', error);
-                showToast('Error loading quotes', 'error');
-            }
-        }
-        
-        function displayQuotes(quotes) {
-            const container = document.getElementById('quotesTable');
-            
-            // Store quotes globally for PDF download
-            currentGeneratedQuotes = quotes || [];
-            
-            if (!quotes || quotes.length === 0) {
-                container.innerHTML = '<div class="loading">No quotes generated yet. Click "Generate All Quotes" to create quotes.</div>';
-                document.getElementById('totalQuotesCount').textContent = '0';
-                document.getElementById('totalValueRange').textContent = '$0 - $0';
-                return;
-            }
-            
-            // Calculate totals
-            const totalMin = quotes.reduce((sum, q) => sum + q.min_quote, 0);
-            const totalMax = quotes.reduce((sum, q) => sum + q.max_quote, 0);
-            
-            document.getElementById('totalQuotesCount').textContent = quotes.length;
-            document.getElementById('totalValueRange').textContent = `$${totalMin.toLocaleString()} - $${totalMax.toLocaleString()}`;
-            
-            // Create table
-            const tableHTML = `
-                <table class="properties-table">
-                    <thead>
-                        <tr>
-                            <th>Address</th>
-                            <th>Material</th>
-                            <th>Area (sqft)</th>
-                            <th>Pitch (°)</th>
-                            <th>Crew Size</th>
-                            <th>Quote Range</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        ${quotes.map((quote, index) => `
-                            <tr>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')"><a href="#" class="property-link">${quote.address || 'N/A'}</a></td>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')">${quote.roof_material || 'N/A'}</td>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')">${quote.roof_area ? quote.roof_area.toFixed(0) : 'N/A'}</td>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')">${quote.pitch ? quote.pitch.toFixed(1) : 'N/A'}</td>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')">${quote.crew_size_used || 'N/A'}</td>
-                                <td onclick="showQuoteDetails('${quote.address.replace(/'/g, "\\'")}')"><strong>${quote.estimated_quote_range}</strong></td>
-                                <td>
-                                    <button class="btn btn-sm btn-success" onclick="event.stopPropagation(); downloadPDFFromIndex(${index})">📄 PDF</button>
-                                </td>
-                            </tr>
-                        `).join('')}
-                    </tbody>
-                </table>
-            `;
-            
-            container.innerHTML = tableHTML;
-        }
-        
-        function showQuoteDetails(address) {
-            // TODO: Implement detailed quote view
-            showToast('Quote details coming soon', 'info');
-        }
-        
-        // Close modal when clicking outside
-        window.onclick = function(event) {
-            const modal = document.getElementById('propertyModal');
-            if (event.target === modal) {
-                modal.style.display = 'none';
-            }
-            
-            const confirmDialog = document.getElementById('confirmDialog');
-            if (event.target === confirmDialog) {
-                closeConfirmDialog();
-            }
-        }
-        
-        // Keyboard accessibility
-        document.addEventListener('keydown', function(event) {
-            // Escape key closes modals and dialogs
-            if (event.key === 'Escape') {
-                // Close property modal
-                const propertyModal = document.getElementById('propertyModal');
-                if (propertyModal.style.display === 'block') {
-                    closeModal();
-                }
-                
-                // Close confirmation dialog
-                const confirmDialog = document.getElementById('confirmDialog');
-                if (confirmDialog.classList.contains('active')) {
-                    closeConfirmDialog();
-                }
-                
-                // Close user dropdown
-                const dropdown = document.getElementById('userDropdown');
-                if (dropdown && dropdown.classList.contains('active')) {
-                    dropdown.classList.remove('active');
-                }
-            }
-            
-            // Enter key on login/register forms
-            if (event.key === 'Enter') {
-                const loginForm = document.getElementById('loginForm');
-                const registerForm = document.getElementById('registerForm');
-                const forgotPasswordForm = document.getElementById('forgotPasswordForm');
-                
-                if (loginForm && loginForm.style.display !== 'none' && document.activeElement.closest('#loginForm')) {
-                    event.preventDefault();
-                    login();
-                }
-                
-                if (registerForm && registerForm.style.display !== 'none' && document.activeElement.closest('#registerForm')) {
-                    event.preventDefault();
-                    register();
-                }
-                
-                if (forgotPasswordForm && forgotPasswordForm.style.display !== 'none' && document.activeElement.closest('#forgotPasswordForm')) {
-                    event.preventDefault();
-                    forgotPassword();
-                }
-            }
-        });
-        
-    </script>
-</body>
-</html>
-"""
-
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    app.run(debug=debug, use_reloader=debug, host='0.0.0.0', port=5000)
@@ -3,62 +3,150 @@ Utility functions for CSV parsing, data processing, and regional calculations
 """
 
 import csv
-import json
+from collections import defaultdict
 from typing import Dict, List, Optional
 from pathlib import Path
 
+import orjson
+import pandas as pd
+
+# pyarrow's CSV reader parses blocks on several threads; it is optional, and
+# parse_nearmap_csv falls back to pandas without it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = pc = pacsv = None
+
+
+# Nearmap columns coerced to float (blank or unparseable cells become 0.0)
+# and to bool (only "TRUE", in any case, is true)
+NUMERIC_FIELDS = (
+    'roof condition summary score', 'pitch', 'height (m)', 'height (ft)',
+    'num stories', 'tile count', 'zinc staining count', 'metal clipped area (sqm)',
+    'gable ratio', 'shingle units needing fix', 'shingle repair area (sqm)',
+    'tile units needing fix', 'tile repair area (sqm)', 'metal units needing fix',
+    'metal repair area (sqm)'
+)
+BOOLEAN_FIELDS = ('building', 'ponding', 'zinc staining (flag)', 'cracking',
+                  'debris', 'algae', 'roof with temporary repair presence')
+
+
+def _records(columns: List[str], values: List[List]) -> List[Dict]:
+    """Zip per-column value lists back into one dict per row"""
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _read_nearmap_pyarrow(file_path: str) -> List[Dict]:
+    """
+    Read the CSV with pyarrow's multithreaded reader
+    Raises pyarrow.ArrowInvalid when a numeric column holds a non-numeric value
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as file:
+        header = next(csv.reader(file), [])
+    # Numeric columns are typed by the reader, everything else stays text.
+    # Blanks are null only in the float columns: strings can't be null, so
+    # empty text cells come back as ''
+    column_types = {name: pa.float64() if name in NUMERIC_FIELDS else pa.string()
+                    for name in header}
+    table = pacsv.read_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(column_types=column_types,
+                                             null_values=[''],
+                                             strings_can_be_null=False)
+    )
+
+    columns = {name: table.column(name) for name in table.column_names}
+    for field in NUMERIC_FIELDS:
+        if field in columns:
+            columns[field] = pc.fill_null(columns[field], 0.0)
+    for field in BOOLEAN_FIELDS:
+        if field in columns:
+            columns[field] = pc.equal(pc.utf8_upper(columns[field]), 'TRUE')
+
+    names = list(columns)
+    values = [columns[name].to_pylist() for name in names]
+    for field in NUMERIC_FIELDS:
+        if field not in columns:
+            names.append(field)
+            values.append([0.0] * table.num_rows)
+    # Normalize key names - convert "roof material" to "roof_material"
+    if 'roof material' in columns:
+        names.append('roof_material')
+        values.append(values[names.index('roof material')])
+    return _records(names, values)
+
+
+def _read_nearmap_pandas(file_path: str) -> List[Dict]:
+    """Read the CSV with pandas' C parser"""
+    # Numeric columns are typed by the C parser itself; everything else is
+    # read as text with blanks kept as '', so untouched columns come back
+    # exactly as they appear in the file
+    options = dict(engine='c', keep_default_na=False, encoding='utf-8',
+                   na_values={field: [''] for field in NUMERIC_FIELDS})
+    try:
+        df = pd.read_csv(file_path, dtype=defaultdict(lambda: str, {
+            field: 'float64' for field in NUMERIC_FIELDS}), **options)
+    except ValueError:
+        # A non-numeric value in a numeric column: read it as text and
+        # let to_numeric turn the bad cells into NaN
+        df = pd.read_csv(file_path, dtype=str, **options)
+        for field in NUMERIC_FIELDS:
+            if field in df:
+                df[field] = pd.to_numeric(df[field], errors='coerce')
+
+    for field in NUMERIC_FIELDS:
+        if field in df:
+            df[field] = df[field].fillna(0.0)
+        else:
+            df[field] = 0.0
+
+    for field in BOOLEAN_FIELDS:
+        if field in df:
+            df[field] = df[field].str.upper() == 'TRUE'
+
+    # Normalize key names - convert "roof material" to "roof_material"
+    if 'roof material' in df:
+        df['roof_material'] = df['roof material']
+
+    # Built from per-column lists (native Python values) rather than
+    # DataFrame.to_dict, which boxes every cell separately and costs
+    # several times the parse itself
+    columns = list(df.columns)
+    return _records(columns, [df[column].tolist() for column in columns])
+
 
 def parse_nearmap_csv(file_path: str) -> List[Dict]:
     """
     Parse Nearmap CSV file and return list of dictionaries
-    Handles the specific format of the roofing data CSV
+    Handles the specific format of the roofing data CSV; the file is read
+    and coerced column-wise by pyarrow when it is installed, otherwise by
+    pandas' C parser
     """
-    data = []
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Convert numeric fields
-                numeric_fields = [
-                    'roof condition summary score', 'pitch', 'height (m)', 'height (ft)',
-                    'num stories', 'tile count', 'zinc staining count', 'metal clipped area (sqm)',
-                    'gable ratio', 'shingle units needing fix', 'shingle repair area (sqm)',
-                    'tile units needing fix', 'tile repair area (sqm)', 'metal units needing fix',
-                    'metal repair area (sqm)'
-                ]
-                
-                for field in numeric_fields:
-                    if field in row and row[field]:
-                        try:
-                            row[field] = float(row[field])
-                        except ValueError:
-                            row[field] = 0.0
-                    else:
-                        row[field] = 0.0
-                
-                # Convert boolean fields
-                boolean_fields = ['building', 'ponding', 'zinc staining (flag)', 'cracking', 
-                                'debris', 'algae', 'roof with temporary repair presence']
-                
-                for field in boolean_fields:
-                    if field in row:
-                        row[field] = row[field].upper() == 'TRUE' if row[field] else False
-                
-                # Normalize key names - convert "roof material" to "roof_material"
-                if 'roof material' in row:
-                    row['roof_material'] = row['roof material']
-                
-                data.append(row)
-                
+        if pacsv is not None:
+            try:
+                return _read_nearmap_pyarrow(file_path)
+            except pa.ArrowInvalid:
+                # Unparseable numeric cells: pandas coerces them to 0.0
+                pass
+        return _read_nearmap_pandas(file_path)
+
     except FileNotFoundError:
         print(f"Error: CSV file not found at {file_path}")
         return []
     except Exception as e:
         print(f"Error parsing CSV: {e}")
         return []
-    
-    return data
+
+
+# Columns a parsed CSV needs for quote calculations
+CSV_REQUIRED_FIELDS = (
+    'address', 'roof_material', 'pitch', 'height (ft)',
+    'roof condition summary score'
+)
 
 
 def validate_csv_structure(data: List[Dict]) -> bool:
@@ -68,13 +156,8 @@ def validate_csv_structure(data: List[Dict]) -> bool:
     if not data:
         return False
     
-    required_fields = [
-        'address', 'roof_material', 'pitch', 'height (ft)',
-        'roof condition summary score'
-    ]
-    
     sample_row = data[0]
-    missing_fields = [field for field in required_fields if field not in sample_row]
+    missing_fields = [field for field in CSV_REQUIRED_FIELDS if field not in sample_row]
     
     if missing_fields:
         print(f"Missing required fields: {missing_fields}")
@@ -90,46 +173,57 @@ def get_csv_summary(data: List[Dict]) -> Dict:
     if not data:
         return {}
     
-    # Count by entity type
+    # One pass over the rows collects every statistic
     entity_counts = {}
+    material_counts = {}
+    condition_total = 0
+    condition_count = 0
+    addresses = set()
     for row in data:
         entity = row.get('entity', 'unknown')
         entity_counts[entity] = entity_counts.get(entity, 0) + 1
-    
-    # Material distribution
-    material_counts = {}
-    for row in data:
         material = row.get('roof_material', 'unknown')
         material_counts[material] = material_counts.get(material, 0) + 1
-    
-    # Condition score statistics
-    condition_scores = [row.get('roof condition summary score', 0) for row in data if row.get('roof condition summary score')]
-    avg_condition = sum(condition_scores) / len(condition_scores) if condition_scores else 0
+        # Condition score statistics skip missing and zero scores
+        score = row.get('roof condition summary score')
+        if score:
+            condition_total += score
+            condition_count += 1
+        addresses.add(row.get('address', ''))
+    avg_condition = condition_total / condition_count if condition_count else 0
     
     return {
         'total_records': len(data),
         'entity_breakdown': entity_counts,
         'material_breakdown': material_counts,
         'average_condition_score': round(avg_condition, 2),
-        'unique_addresses': len(set(row.get('address', '') for row in data))
+        'unique_addresses': len(addresses)
     }
 
 
+# Quote exports stay indented for reading; numpy values from the quote engine
+# are written as numbers
+QUOTES_JSON_OPTION = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
 def save_quotes_to_json(quotes: List, output_path: str) -> bool:
     """
     Save quote results to JSON file
     """
     try:
-        # Convert QuoteResult objects to dictionaries
-        quotes_data = []
-        for quote in quotes:
-            if hasattr(quote, 'to_dict'):
-                quotes_data.append(quote.to_dict())
-            else:
-                quotes_data.append(quote)
-        
-        with open(output_path, 'w', encoding='utf-8') as file:
-            json.dump(quotes_data, file, indent=2, default=str)
+        # Quotes are converted and serialized one at a time, so the export
+        # never holds a dict copy of the whole list in memory
+        with open(output_path, 'wb', buffering=1 << 20) as file:
+            file.write(b'[')
+            separator = b'\n'
+            for quote in quotes:
+                # Convert QuoteResult objects to dictionaries
+                if hasattr(quote, 'to_dict'):
+                    quote = quote.to_dict()
+                file.write(separator)
+                file.write(orjson.dumps(quote, default=str, option=QUOTES_JSON_OPTION))
+                separator = b',\n'
+            file.write(b'\n]\n')
         
         return True
     except Exception as e:
@@ -142,8 +236,8 @@ def load_roofer_profile(file_path: str) -> Optional[Dict]:
     Load roofer profile from JSON file
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
     except Exception as e:
         print(f"Error loading roofer profile: {e}")
         return None
@@ -154,8 +248,8 @@ def save_roofer_profile(profile: Dict, file_path: str) -> bool:
     Save roofer profile to JSON file
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(profile, file, indent=2)
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
         return True
     except Exception as e:
         print(f"Error saving roofer profile: {e}")
@@ -176,18 +270,30 @@ def format_quote_range(min_quote: float, max_quote: float) -> str:
     return f"${min_quote:,.0f} - ${max_quote:,.0f}"
 
 
+MATERIAL_DISPLAY_NAMES = {
+    'asphalt': 'Asphalt Shingles',
+    'shingle': 'Shingles',
+    'metal': 'Metal Roofing',
+    'tile': 'Tile Roofing',
+    'concrete': 'Concrete Tiles'
+}
+
+
 def get_roof_material_display_name(material: str) -> str:
     """
     Get display-friendly name for roof material
     """
-    material_names = {
-        'asphalt': 'Asphalt Shingles',
-        'shingle': 'Shingles',
-        'metal': 'Metal Roofing',
-        'tile': 'Tile Roofing',
-        'concrete': 'Concrete Tiles'
-    }
-    return material_names.get(material.lower(), material.title())
+    return MATERIAL_DISPLAY_NAMES.get(material.lower(), material.title())
+
+
+# Roofer profile fields, in the order their errors are reported
+ROOFER_REQUIRED_FIELDS = (
+    'business_name', 'license_id', 'primary_zip_code', 'email',
+    'labor_rate', 'daily_productivity', 'base_crew_size', 'crew_scaling_rule',
+    'overhead_percent', 'profit_margin'
+)
+ROOFER_NUMERIC_FIELDS = ('labor_rate', 'daily_productivity', 'base_crew_size',
+                         'overhead_percent', 'profit_margin')
 
 
 def validate_roofer_profile(profile_data: Dict) -> List[str]:
@@ -196,19 +302,12 @@ def validate_roofer_profile(profile_data: Dict) -> List[str]:
     """
     errors = []
     
-    required_fields = [
-        'business_name', 'license_id', 'primary_zip_code', 'email',
-        'labor_rate', 'daily_productivity', 'base_crew_size', 'crew_scaling_rule',
-        'overhead_percent', 'profit_margin'
-    ]
-    
-    for field in required_fields:
+    for field in ROOFER_REQUIRED_FIELDS:
         if field not in profile_data:
             errors.append(f"Missing required field: {field}")
     
     # Validate numeric fields
-    numeric_fields = ['labor_rate', 'daily_productivity', 'base_crew_size', 'overhead_percent', 'profit_margin']
-    for field in numeric_fields:
+    for field in ROOFER_NUMERIC_FIELDS:
         if field in profile_data:
             try:
                 value = float(profile_data[field])
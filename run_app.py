@@ -23,4 +23,7 @@ if __name__ == '__main__':
     print("   - GET  /api/health")
     print("\nStarting Flask server...")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # The debugger and its reloader (which re-imports the whole app in a
+    # second process) are opt-in with FLASK_DEBUG=1
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    app.run(debug=debug, use_reloader=debug, host='0.0.0.0', port=5000)
@@ -9,7 +9,6 @@ sys.path.append('backend')
 
 from backend.models.roofer_profile import RooferProfile, SlopeCostAdjustment, MaterialCosts, ReplacementCosts, CrewScalingRule
 from backend.quote_engine import calculate_quote
-from backend.utils import parse_nearmap_csv
 
 def create_sample_roofer_profile():
     """Create a sample roofer profile for testing"""
@@ -85,6 +84,9 @@ def test_with_sample_data():
 
 def test_with_csv_data():
     """Test with actual CSV data if available"""
+    # Imported here so the sample-data test doesn't pay for loading pandas
+    from backend.utils import parse_nearmap_csv
+    
     csv_path = "data/nearmap_synthetic_extended_correlated.csv"
     
     if not os.path.exists(csv_path):